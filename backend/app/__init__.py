@@ -33,6 +33,10 @@ def create_app(config_name='development'):
     """
     app = Flask(__name__)
 
+    # orjson instead of stdlib json for every jsonify()/request.get_json()
+    from app.utils.json_provider import OrjsonProvider
+    app.json = OrjsonProvider(app)
+
     # Load configuration
     app.config.from_object(config[config_name])
     setup_logging(app.config.get('LOG_LEVEL', 'DEBUG'))
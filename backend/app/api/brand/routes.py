@@ -388,10 +388,14 @@ def get_config():
         user_id = g.user_id
         config = brand_config_service.get_config(user_id)
 
-        return jsonify({
+        # Content-hash ETag: an unchanged config revalidates to an empty 304
+        response = jsonify({
             "success": True,
             "config": config
-        }), 200
+        })
+        response.add_etag()
+        response.headers["Cache-Control"] = "private, no-cache"
+        return response.make_conditional(request)
 
     except Exception as e:
         return error_response(e, default_log="Error fetching brand config")
@@ -385,6 +385,9 @@ def update_api_keys():
                 ):
                     from app.services.integrations.knowledge_bases.mixpanel.mixpanel_service import mixpanel_service
                     mixpanel_service.reload_config()
+                elif key_id in ('NANO_BANANA_API_KEY', 'OPENAI_API_KEY'):
+                    from app.services.integrations.google.imagen_service import imagen_service
+                    imagen_service.reload_config()
                 elif key_id in ('OPIK_API_KEY', 'OPIK_WORKSPACE', 'OPIK_PROJECT_NAME', 'OPIK_URL_OVERRIDE'):
                     # Reset Claude client so it re-initializes with/without Opik wrapping
                     from app.services.integrations.claude.claude_service import claude_service
@@ -434,6 +437,10 @@ def delete_api_key(key_id):
         env_service.save()
         env_service.reload_env()
 
+        if key_id in ('NANO_BANANA_API_KEY', 'OPENAI_API_KEY'):
+            from app.services.integrations.google.imagen_service import imagen_service
+            imagen_service.reload_config()
+
         return jsonify({
             'success': True,
             'message': f'API key {key_id} deleted successfully'
@@ -39,6 +39,7 @@ Routes:
 - GET  /projects/<id>/studio/<type>-jobs      - List jobs
 - GET  /projects/<id>/studio/<type>-jobs/<id> - Job status
 - GET  /projects/<id>/studio/<type>/<file>    - Serve generated files
+- GET  /projects/<id>/studio/jobs/<id>/events - Job status as SSE
 """
 from flask import Blueprint, request
 
@@ -81,6 +82,7 @@ from app.api.studio import blogs  # noqa: F401
 from app.api.studio import business_reports  # noqa: F401
 from app.api.studio import job_groups  # noqa: F401
 from app.api.studio import job_actions  # noqa: F401
+from app.api.studio import job_events  # noqa: F401
 
 # The noqa comments tell flake8 to ignore the
 # "imported but unused" warning. We import to register routes,
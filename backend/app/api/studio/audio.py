@@ -90,14 +90,7 @@ def generate_audio_overview(project_id: str):
 
         if parent_job_id:
             # Clean up any previously failed edit jobs for this parent
-            try:
-                all_jobs = studio_index_service.list_audio_jobs(project_id)
-                for job in all_jobs:
-                    if (job.get("status") == "error"
-                            and job.get("parent_job_id") == parent_job_id):
-                        studio_index_service.delete_audio_job(project_id, job["id"])
-            except Exception:
-                pass  # Non-critical cleanup -- don't block the new edit
+            studio_index_service.delete_failed_edit_jobs(project_id, "audio", parent_job_id)
 
             parent_job = studio_index_service.get_audio_job(project_id, parent_job_id)
             if not parent_job:
@@ -32,6 +32,7 @@ import io
 import zipfile
 from flask import jsonify, request, current_app, send_file, Response, g
 from app.api.studio import studio_bp
+from app.api.studio.file_utils import zip_compress_type
 from app.services.studio_services import studio_index_service
 from app.services.tool_executors.blog_agent_executor import blog_agent_executor
 from app.services.integrations.supabase import storage_service
@@ -83,14 +84,7 @@ def generate_blog_post(project_id: str):
 
         if parent_job_id:
             # Clean up any previously failed edit jobs for this parent
-            try:
-                all_jobs = studio_index_service.list_blog_jobs(project_id)
-                for job in all_jobs:
-                    if (job.get("status") == "error"
-                            and job.get("parent_job_id") == parent_job_id):
-                        studio_index_service.delete_blog_job(project_id, job["id"])
-            except Exception:
-                pass  # Non-critical cleanup — don't block the new edit
+            studio_index_service.delete_failed_edit_jobs(project_id, "blog", parent_job_id)
 
             parent_job = studio_index_service.get_blog_job(project_id, parent_job_id)
             if not parent_job or not parent_job.get('markdown_file'):
@@ -385,7 +379,10 @@ def download_blog_post(project_id: str, job_id: str):
                         filename=image_filename
                     )
                     if image_data:
-                        zip_file.writestr(f"images/{image_filename}", image_data)
+                        zip_file.writestr(
+                            f"images/{image_filename}", image_data,
+                            compress_type=zip_compress_type(image_filename)
+                        )
 
         zip_buffer.seek(0)
 
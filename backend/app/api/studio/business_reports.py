@@ -33,6 +33,7 @@ import io
 import zipfile
 from flask import jsonify, request, current_app, send_file, Response
 from app.api.studio import studio_bp
+from app.api.studio.file_utils import zip_compress_type
 from app.services.studio_services import studio_index_service
 from app.services.tool_executors.business_report_agent_executor import business_report_agent_executor
 from app.services.integrations.supabase import storage_service
@@ -78,14 +79,7 @@ def generate_business_report(project_id: str):
 
         if parent_job_id:
             # Clean up any previously failed edit jobs for this parent
-            try:
-                all_jobs = studio_index_service.list_business_report_jobs(project_id)
-                for job in all_jobs:
-                    if (job.get("status") == "error"
-                            and job.get("parent_job_id") == parent_job_id):
-                        studio_index_service.delete_business_report_job(project_id, job["id"])
-            except Exception:
-                pass  # Non-critical cleanup
+            studio_index_service.delete_failed_edit_jobs(project_id, "business_report", parent_job_id)
 
             parent_job = studio_index_service.get_business_report_job(project_id, parent_job_id)
             if not parent_job or not parent_job.get('markdown_file'):
@@ -360,7 +354,10 @@ def download_business_report(project_id: str, job_id: str):
                 if chart_filename:
                     chart_data = storage_service.download_ai_image(project_id, chart_filename)
                     if chart_data:
-                        zip_file.writestr(f"charts/{chart_filename}", chart_data)
+                        zip_file.writestr(
+                            f"charts/{chart_filename}", chart_data,
+                            compress_type=zip_compress_type(chart_filename)
+                        )
 
         zip_buffer.seek(0)
 
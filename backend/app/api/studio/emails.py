@@ -33,11 +33,17 @@ import re
 import zipfile
 from flask import g, jsonify, request, current_app, send_file, Response
 from app.api.studio import studio_bp
+from app.api.studio.file_utils import zip_compress_type
 from app.services.studio_services import studio_index_service
 from app.services.tool_executors.email_agent_executor import email_agent_executor
 from app.services.integrations.supabase import storage_service
 from app.services.auth import require_permission
 
+# Image src attributes pointing at our email-templates endpoint
+_EMAIL_IMAGE_SRC_RE = re.compile(
+    r'src="(/api/v1/projects/[^"]+/studio/email-templates/[^"]+\.(?:png|jpg|jpeg|gif|webp|svg))"'
+)
+
 
 @studio_bp.route('/projects/<project_id>/studio/email-template', methods=['POST'])
 @require_permission("studio", "emails")
@@ -70,14 +76,7 @@ def generate_email_template(project_id: str):
 
         if parent_job_id:
             # Clean up any previously failed edit jobs for this parent
-            try:
-                all_jobs = studio_index_service.list_email_jobs(project_id)
-                for job in all_jobs:
-                    if (job.get("status") == "error"
-                            and job.get("parent_job_id") == parent_job_id):
-                        studio_index_service.delete_email_job(project_id, job["id"])
-            except Exception:
-                pass  # Non-critical cleanup — don't block the new edit
+            studio_index_service.delete_failed_edit_jobs(project_id, "email", parent_job_id)
 
             parent_job = studio_index_service.get_email_job(project_id, parent_job_id)
             if not parent_job or not parent_job.get('html_file'):
@@ -305,11 +304,7 @@ def preview_email_template(project_id: str, job_id: str):
                 separator = '&' if '?' in url else '?'
                 return f'src="{url}{separator}token={token}"'
 
-            html_content = re.sub(
-                r'src="(/api/v1/projects/[^"]+/studio/email-templates/[^"]+\.(?:png|jpg|jpeg|gif|webp|svg))"',
-                _add_token,
-                html_content
-            )
+            html_content = _EMAIL_IMAGE_SRC_RE.sub(_add_token, html_content)
 
         return Response(html_content, mimetype='text/html')
 
@@ -365,7 +360,10 @@ def download_email_template(project_id: str, job_id: str):
                         project_id, "emails", job_id, image_filename
                     )
                     if image_data:
-                        zip_file.writestr(image_filename, image_data)
+                        zip_file.writestr(
+                            image_filename, image_data,
+                            compress_type=zip_compress_type(image_filename)
+                        )
 
         zip_buffer.seek(0)
 
@@ -0,0 +1,258 @@
+"""
+File response helpers for studio routes.
+
+Studio outputs (screenshots, social images, PPTX exports) are
+downloaded from Supabase Storage into memory and handed to Flask's
+send_file. send_file already honours Range requests for in-memory files,
+but without a validator browsers can't use If-Range to resume a dropped
+download or If-None-Match to revalidate a cached image. These helpers
+attach a content-derived ETag so both work.
+
+ZIP exports are streamed with iter_zip so the client starts receiving
+bytes after the first entry instead of after the whole archive is built.
+"""
+import io
+import mimetypes
+import unicodedata
+import zipfile
+import zlib
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from urllib.parse import quote
+
+import httpx
+from flask import Response, send_file, stream_with_context
+
+from app.services.integrations.supabase import storage_service
+
+
+def content_etag(data: bytes) -> str:
+    """Cheap strong ETag for in-memory file bytes (adler32 + length)."""
+    return f"{zlib.adler32(data) & 0xFFFFFFFF:08x}-{len(data)}"
+
+
+def send_studio_bytes(
+    data: bytes,
+    filename: str,
+    mimetype: Optional[str] = None,
+    as_attachment: bool = False,
+    etag: Optional[str] = None,
+    last_modified: Optional[Union[datetime, float]] = None,
+) -> Response:
+    """
+    Send downloaded studio file bytes with conditional + Range support.
+
+    Args:
+        data: File bytes
+        filename: Name used for MIME inference and Content-Disposition
+        mimetype: Explicit MIME type (inferred from filename when None)
+        as_attachment: Force a download instead of inline display
+        etag: Precomputed ETag; derived from the bytes when None
+        last_modified: Optional datetime or POSIX timestamp for Last-Modified
+
+    Returns:
+        Flask response (200, 206 or 304)
+    """
+    response = send_file(
+        io.BytesIO(data),
+        mimetype=mimetype,
+        as_attachment=as_attachment,
+        download_name=filename.rsplit('/', 1)[-1],
+        conditional=True,
+        etag=etag or content_etag(data),
+        last_modified=last_modified,
+    )
+    # Werkzeug only sets this on 206 responses; advertise it up front so
+    # clients know they can resume.
+    response.headers["Accept-Ranges"] = "bytes"
+    return response
+
+
+# Response headers worth relaying from storage to the client
+_RELAYED_HEADERS = ("Content-Length", "Content-Range", "ETag", "Last-Modified")
+
+# Request headers relayed to storage so it can answer 304 itself
+CONDITIONAL_REQUEST_HEADERS = ("If-None-Match", "If-Modified-Since")
+
+# Request headers relayed to storage so it can answer 206 itself
+RANGE_REQUEST_HEADERS = ("Range", "If-Range")
+
+
+def relay_storage_stream(
+    upstream: httpx.Response,
+    mimetype: str,
+    chunk_size: int = 64 * 1024,
+) -> Response:
+    """
+    Relay an open storage download to the client chunk by chunk.
+
+    Peak memory is one chunk instead of the whole file, and the browser
+    starts receiving bytes before the storage download has finished.
+    Storage's status (200 or 206) and its Content-Length / Content-Range /
+    ETag / Last-Modified are passed through, and a 304 from storage becomes
+    an empty 304. Closes ``upstream`` when done.
+    """
+    headers = {
+        name: upstream.headers[name]
+        for name in _RELAYED_HEADERS
+        if name in upstream.headers
+    }
+    # iter_bytes() decodes any Content-Encoding, so storage's length is for
+    # the encoded body, not what the client receives
+    if "Content-Encoding" in upstream.headers:
+        headers.pop("Content-Length", None)
+
+    if upstream.status_code == 304:
+        upstream.close()
+        headers.pop("Content-Length", None)
+        return Response(status=304, headers=headers)
+
+    def generate():
+        try:
+            yield from upstream.iter_bytes(chunk_size)
+        finally:
+            upstream.close()
+
+    response = Response(
+        stream_with_context(generate()),
+        status=upstream.status_code,
+        mimetype=mimetype,
+        headers=headers,
+    )
+    # The generator never starts for HEAD or a client that disconnects
+    # first, so its finally can't be the only place the upstream is closed
+    response.call_on_close(upstream.close)
+    return response
+
+
+def head_response(
+    filename: str,
+    size: int,
+    mimetype: Optional[str] = None,
+    last_modified: Optional[Any] = None,
+    etag: Optional[str] = None,
+) -> Response:
+    """Body-less response carrying the headers a GET would send."""
+    response = Response(
+        status=200,
+        mimetype=mimetype or mimetypes.guess_type(filename)[0] or "application/octet-stream",
+    )
+    response.headers["Content-Length"] = str(size)
+    response.headers["Accept-Ranges"] = "bytes"
+    if last_modified is not None:
+        response.last_modified = last_modified
+    if etag:
+        response.set_etag(etag)
+    return response
+
+
+def head_studio_file(
+    project_id: str,
+    job_type: str,
+    job_id: str,
+    filename: str,
+    mimetype: Optional[str] = None,
+) -> Response:
+    """
+    Answer a HEAD probe from storage object metadata.
+
+    Flask routes HEAD through the GET handler, which would download the
+    whole file just to throw the body away. Object info gives size and
+    type for a fraction of the transfer. No ETag here: the GET side derives
+    its ETag from the bytes, and storage's own etag wouldn't match it.
+    """
+    info: Optional[Dict[str, Any]] = storage_service.get_studio_file_info(
+        project_id, job_type, job_id, filename
+    )
+    if not info:
+        return Response(status=404)
+
+    metadata = info.get("metadata") or {}
+    size = info.get("size", metadata.get("size"))
+    if size is None:
+        return Response(status=404)
+
+    return head_response(
+        filename,
+        int(size),
+        mimetype=mimetype or info.get("content_type") or metadata.get("mimetype"),
+    )
+
+
+def set_attachment_filename(response: Response, filename: str) -> None:
+    """
+    Mark a hand-built response as a download named ``filename``.
+
+    Mirrors what send_file does for download_name: non-ASCII names get an
+    ASCII fallback plus an RFC 5987 ``filename*``.
+    """
+    try:
+        filename.encode("ascii")
+    except UnicodeEncodeError:
+        simple = unicodedata.normalize("NFKD", filename).encode("ascii", "ignore").decode("ascii")
+        quoted = quote(filename, safe="!#$&+-.^_`|~")
+        names = {"filename": simple, "filename*": f"UTF-8''{quoted}"}
+    else:
+        names = {"filename": filename}
+    response.headers.set("Content-Disposition", "attachment", **names)
+
+
+# Already-compressed formats: DEFLATE burns CPU on these for ~0% gain
+_STORED_SUFFIXES = frozenset({
+    ".png", ".jpg", ".jpeg", ".gif", ".webp",
+    ".mp3", ".mp4", ".wav", ".webm",
+    ".zip", ".pptx", ".docx", ".xlsx", ".woff", ".woff2",
+})
+
+
+def zip_compress_type(arcname: str) -> int:
+    """ZIP_STORED for already-compressed media, ZIP_DEFLATED for everything else."""
+    suffix = arcname[arcname.rfind("."):].lower() if "." in arcname else ""
+    return zipfile.ZIP_STORED if suffix in _STORED_SUFFIXES else zipfile.ZIP_DEFLATED
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only, unseekable sink that hands written bytes back in chunks."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._chunks: List[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        chunk = b"".join(self._chunks)
+        self._chunks.clear()
+        return chunk
+
+
+def iter_zip(entries: Iterable[Tuple[str, Optional[Union[str, bytes]]]]) -> Iterator[bytes]:
+    """
+    Build a ZIP archive incrementally, yielding bytes after each entry.
+
+    zipfile writes data descriptors when the target isn't seekable, so
+    the archive is valid without ever holding more than one entry in
+    memory. Entries whose data is None are skipped. Images and other
+    already-compressed formats are stored rather than deflated.
+
+    Args:
+        entries: (arcname, data) pairs, consumed lazily
+
+    Yields:
+        Archive bytes, one chunk per entry plus the central directory
+    """
+    sink = _ChunkSink()
+    with zipfile.ZipFile(sink, "w", zipfile.ZIP_DEFLATED) as zip_file:
+        for arcname, data in entries:
+            if data is None:
+                continue
+            zip_file.writestr(arcname, data, compress_type=zip_compress_type(arcname))
+            chunk = sink.drain()
+            if chunk:
+                yield chunk
+    yield sink.drain()
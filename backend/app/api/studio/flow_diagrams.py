@@ -72,14 +72,7 @@ def generate_flow_diagram(project_id: str):
 
         if parent_job_id:
             # Clean up any previously failed edit jobs for this parent
-            try:
-                all_jobs = studio_index_service.list_flow_diagram_jobs(project_id)
-                for job in all_jobs:
-                    if (job.get("status") == "error"
-                            and job.get("parent_job_id") == parent_job_id):
-                        studio_index_service.delete_flow_diagram_job(project_id, job["id"])
-            except Exception:
-                pass  # Non-critical cleanup -- don't block the new edit
+            studio_index_service.delete_failed_edit_jobs(project_id, "flow_diagram", parent_job_id)
 
             parent_job = studio_index_service.get_flow_diagram_job(project_id, parent_job_id)
             if not parent_job or not parent_job.get('mermaid_syntax'):
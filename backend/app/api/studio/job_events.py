@@ -0,0 +1,87 @@
+"""
+Studio job event stream — Server-Sent Events alternative to polling.
+
+Clients poll `/<type>-jobs/<job_id>` every few seconds during generations
+that run from 30 seconds to several minutes. This endpoint keeps one
+connection open instead and pushes a `status` event only when the job
+actually changes:
+
+  * Writes made in this worker (the background task usually runs in the
+    same process as the POST that started it) wake the stream
+    immediately via `studio_index_service.wait_for_job_change`.
+  * Writes made by other workers are picked up by a re-read every
+    `_REREAD_SECONDS`, served through the single-flight poll cache.
+
+The stream closes once the job reaches a terminal status, or after
+`_MAX_STREAM_SECONDS` — EventSource reconnects on its own, which keeps a
+single connection from pinning a worker greenlet indefinitely. Comment
+heartbeats keep idle proxies from dropping the connection.
+
+Events:
+  * `status` — `{"job": {...}}` with the full job record
+  * `gone`   — the job was deleted while streaming
+"""
+import time
+
+from flask import Response, current_app, jsonify, stream_with_context
+
+from app.api.studio import studio_bp
+from app.api.studio.job_utils import job_etag
+from app.services.studio_services import studio_index_service
+
+_TERMINAL_STATUSES = ("ready", "error", "cancelled")
+_REREAD_SECONDS = 2.0
+_HEARTBEAT_SECONDS = 15.0
+_MAX_STREAM_SECONDS = 300.0
+
+
+def _job_version(job: dict) -> str:
+    """Change marker for a job; updated_at-based when available."""
+    return job_etag(job) or f"{job.get('status')}:{job.get('progress')}:{job.get('status_message')}"
+
+
+@studio_bp.route("/projects/<project_id>/studio/jobs/<job_id>/events", methods=["GET"])
+def stream_studio_job_events(project_id: str, job_id: str):
+    job = studio_index_service.get_job_for_poll(project_id, job_id)
+    if not job:
+        return jsonify({"success": False, "error": "Job not found"}), 404
+
+    def _event(name: str, payload: dict) -> str:
+        return f"event: {name}\ndata: {current_app.json.dumps(payload)}\n\n"
+
+    def generate():
+        current = job
+        last_version = None
+        started_at = last_sent_at = time.monotonic()
+
+        while True:
+            if current is None:
+                yield _event("gone", {"job_id": job_id})
+                return
+
+            version = _job_version(current)
+            if version != last_version:
+                yield _event("status", {"job": current})
+                last_version = version
+                last_sent_at = time.monotonic()
+
+            if current.get("status") in _TERMINAL_STATUSES:
+                return
+
+            now = time.monotonic()
+            if now - started_at >= _MAX_STREAM_SECONDS:
+                return
+            if now - last_sent_at >= _HEARTBEAT_SECONDS:
+                yield ": keep-alive\n\n"
+                last_sent_at = now
+
+            studio_index_service.wait_for_job_change(_REREAD_SECONDS)
+            current = studio_index_service.get_job_for_poll(project_id, job_id)
+
+    headers = {
+        "Content-Type": "text/event-stream",
+        "Cache-Control": "no-cache, no-transform",
+        "Connection": "keep-alive",
+        "X-Accel-Buffering": "no",
+    }
+    return Response(stream_with_context(generate()), headers=headers)
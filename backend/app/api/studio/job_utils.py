@@ -0,0 +1,45 @@
+"""
+Job status response helpers for studio routes.
+
+The frontend polls job status every few seconds, and most polls return a
+job that hasn't changed since the last one. studio_jobs.updated_at is
+bumped by a trigger on every write, so it makes a cheap validator: the
+ETag is derived from it and an unchanged job is answered with an empty
+304 instead of re-sending the full job JSON.
+"""
+import zlib
+from typing import Any, Dict, Optional
+
+from flask import Response, jsonify, request
+
+
+def job_etag(job: Dict[str, Any]) -> Optional[str]:
+    """ETag for a job record, or None if the row has no updated_at."""
+    updated_at = job.get("updated_at")
+    if not updated_at:
+        return None
+    key = f"{job.get('id')}:{updated_at}:{job.get('status')}"
+    return f"{zlib.adler32(key.encode('utf-8')) & 0xFFFFFFFF:08x}"
+
+
+def job_status_response(job: Dict[str, Any]) -> Response:
+    """
+    Build the `{'success': True, 'job': job}` status response.
+
+    Sets an ETag and answers If-None-Match with 304. Cache-Control is
+    no-cache so the browser always revalidates. A poll must never see a
+    stale status.
+    """
+    etag = job_etag(job)
+    if etag and request.if_none_match.contains(etag):
+        response = Response(status=304)
+    else:
+        response = jsonify({
+            'success': True,
+            'job': job
+        })
+
+    if etag:
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = 'private, no-cache'
+    return response
@@ -16,6 +16,7 @@ Output Structure:
 - slides/base-styles.css (brand colors/fonts)
 - slides/slide_01.html, slide_02.html, ... (HTML slides)
 - screenshots/slide_01.png, slide_02.png, ... (captured screenshots)
+- screenshots/slide_01.webp, ... (smaller preview copies)
 - Presentation.pptx (final output)
 
 Routes:
@@ -28,12 +29,18 @@ Routes:
 """
 import io
 import zipfile
+from datetime import datetime, timezone
 from flask import jsonify, request, current_app, send_file, Response
+from werkzeug.http import is_resource_modified
 from app.api.studio import studio_bp
+from app.api.studio.file_utils import send_studio_bytes, head_response, head_studio_file, zip_compress_type
 from app.services.studio_services import studio_index_service
 from app.services.integrations.supabase import storage_service
+from app.services.background_services.task_service import task_service
 from app.services.auth import require_permission
 
+PPTX_MIMETYPE = 'application/vnd.openxmlformats-officedocument.presentationml.presentation'
+
 
 @studio_bp.route('/projects/<project_id>/studio/presentation', methods=['POST'])
 @require_permission("studio", "presentations")
@@ -55,7 +62,7 @@ def generate_presentation(project_id: str):
     from app.services.tool_executors import presentation_agent_executor
 
     try:
-        data = request.get_json()
+        data = request.get_json(silent=True, cache=False) or {}
         source_id = data.get('source_id')
         direction = data.get('direction', '')
 
@@ -68,14 +75,7 @@ def generate_presentation(project_id: str):
 
         if parent_job_id:
             # Clean up any previously failed edit jobs for this parent
-            try:
-                all_jobs = studio_index_service.list_presentation_jobs(project_id)
-                for job in all_jobs:
-                    if (job.get("status") == "error"
-                            and job.get("parent_job_id") == parent_job_id):
-                        studio_index_service.delete_presentation_job(project_id, job["id"])
-            except Exception:
-                pass  # Non-critical cleanup — don't block the new edit
+            studio_index_service.delete_failed_edit_jobs(project_id, "presentation", parent_job_id)
 
             parent_job = studio_index_service.get_presentation_job(project_id, parent_job_id)
             if not parent_job or not parent_job.get('slide_files'):
@@ -127,7 +127,7 @@ def generate_presentation(project_id: str):
         return jsonify(result), 202  # Accepted
 
     except Exception as e:
-        current_app.logger.error(f"Error starting presentation generation: {e}")
+        current_app.logger.exception("Error starting presentation generation: %s", e)
         return jsonify({
             'success': False,
             'error': f'Failed to start presentation generation: {str(e)}'
@@ -143,7 +143,7 @@ def get_presentation_job_status(project_id: str, job_id: str):
         Job object with current status, progress, and results if complete
     """
     try:
-        job = studio_index_service.get_presentation_job(project_id, job_id)
+        job = studio_index_service.get_job_for_poll(project_id, job_id)
 
         if not job:
             return jsonify({
@@ -157,7 +157,7 @@ def get_presentation_job_status(project_id: str, job_id: str):
         })
 
     except Exception as e:
-        current_app.logger.error(f"Error getting presentation job status: {e}")
+        current_app.logger.exception("Error getting presentation job status: %s", e)
         return jsonify({
             'success': False,
             'error': f'Failed to get job status: {str(e)}'
@@ -191,14 +191,14 @@ def list_presentation_jobs(project_id: str):
         })
 
     except Exception as e:
-        current_app.logger.error(f"Error listing presentation jobs: {e}")
+        current_app.logger.exception("Error listing presentation jobs: %s", e)
         return jsonify({
             'success': False,
             'error': f'Failed to list jobs: {str(e)}'
         }), 500
 
 
-@studio_bp.route('/projects/<project_id>/studio/presentations/<job_id>/slides/<path:filename>', methods=['GET'])
+@studio_bp.route('/projects/<project_id>/studio/presentations/<job_id>/slides/<path:filename>', methods=['GET', 'HEAD'])
 def get_presentation_slide(project_id: str, job_id: str, filename: str):
     """
     Serve a slide file (HTML or CSS).
@@ -207,14 +207,18 @@ def get_presentation_slide(project_id: str, job_id: str, filename: str):
         - HTML slides: slide_01.html, slide_02.html, etc.
         - Stylesheets: base-styles.css
     """
+    if not storage_service.is_safe_studio_filename(filename):
+        return jsonify({
+            'success': False,
+            'error': 'Invalid filename'
+        }), 400
+
     try:
-        # Determine MIME type
-        mime_type = 'text/html'
-        if filename.endswith('.css'):
-            mime_type = 'text/css'
+        if request.method == 'HEAD':
+            return head_studio_file(project_id, "presentations", job_id, f"slides/{filename}")
 
         # Download from Supabase Storage (files stored under slides/ subfolder)
-        content = storage_service.download_studio_file(
+        content = storage_service.download_studio_binary(
             project_id, "presentations", job_id, f"slides/{filename}"
         )
         if content is None:
@@ -223,39 +227,72 @@ def get_presentation_slide(project_id: str, job_id: str, filename: str):
                 'error': 'File not found'
             }), 404
 
-        return Response(content, mimetype=mime_type)
+        # send_file infers text/html vs text/css from the name and handles
+        # conditional/Range requests, so no manual MIME branching here.
+        return send_file(io.BytesIO(content), download_name=filename.rsplit('/', 1)[-1])
 
     except Exception as e:
-        current_app.logger.error(f"Error serving slide file: {e}")
+        current_app.logger.exception("Error serving slide file: %s", e)
         return jsonify({
             'success': False,
             'error': f'Failed to serve file: {str(e)}'
         }), 500
 
 
-@studio_bp.route('/projects/<project_id>/studio/presentations/<job_id>/screenshots/<path:filename>', methods=['GET'])
+@studio_bp.route('/projects/<project_id>/studio/presentations/<job_id>/screenshots/<path:filename>', methods=['GET', 'HEAD'])
 def get_presentation_screenshot(project_id: str, job_id: str, filename: str):
     """
-    Serve a screenshot image file (PNG).
+    Serve a screenshot image file (PNG, or WebP when the client accepts it).
 
     Screenshots are captured by Playwright at 1920x1080
     and used to create the PPTX. They provide a reliable preview.
+    A WebP copy is stored next to each PNG; browsers that explicitly
+    accept image/webp get that instead. Jobs without has_webp (captured
+    before WebP copies existed) always get the PNG.
     """
+    if not storage_service.is_safe_studio_filename(filename):
+        return jsonify({
+            'success': False,
+            'error': 'Invalid filename'
+        }), 400
+
     try:
-        # Download from Supabase Storage (screenshots stored under screenshots/ subfolder)
-        file_data = storage_service.download_studio_binary(
-            project_id, "presentations", job_id, f"screenshots/{filename}"
+        # Prefer the WebP copy when the browser lists image/webp itself;
+        # quality() would also match */* and image/*
+        candidates = [filename]
+        wants_webp = any(
+            mimetype == 'image/webp' and quality > 0
+            for mimetype, quality in request.accept_mimetypes
         )
-        if file_data is None:
-            return jsonify({
-                'success': False,
-                'error': 'Screenshot not found'
-            }), 404
+        if wants_webp and filename.lower().endswith('.png'):
+            job = studio_index_service.get_job_for_poll(project_id, job_id)
+            if job and job.get('has_webp'):
+                candidates.insert(0, f"{filename[:-4]}.webp")
+
+        for candidate in candidates:
+            if request.method == 'HEAD':
+                response = head_studio_file(project_id, "presentations", job_id, f"screenshots/{candidate}")
+                if response.status_code == 404:
+                    continue
+            else:
+                # Download from Supabase Storage (screenshots stored under screenshots/ subfolder)
+                file_data = storage_service.download_studio_binary(
+                    project_id, "presentations", job_id, f"screenshots/{candidate}"
+                )
+                if file_data is None:
+                    continue
+                response = send_studio_bytes(file_data, candidate)
 
-        return send_file(io.BytesIO(file_data), mimetype='image/png', as_attachment=False)
+            response.vary.add('Accept')
+            return response
+
+        return jsonify({
+            'success': False,
+            'error': 'Screenshot not found'
+        }), 404
 
     except Exception as e:
-        current_app.logger.error(f"Error serving screenshot file: {e}")
+        current_app.logger.exception("Error serving screenshot file: %s", e)
         return jsonify({
             'success': False,
             'error': f'Failed to serve screenshot: {str(e)}'
@@ -289,16 +326,23 @@ def preview_presentation(project_id: str, job_id: str):
                 'error': 'No slides available'
             }), 404
 
-        # Get requested slide number (1-indexed)
+        # Get requested slide number (1-indexed); clamp only when out of range
+        total_slides = len(slide_files)
         slide_num = request.args.get('slide', 1, type=int)
-        slide_num = max(1, min(slide_num, len(slide_files)))
+        if not 1 <= slide_num <= total_slides:
+            slide_num = max(1, min(slide_num, total_slides))
 
         slide_file = slide_files[slide_num - 1]
-        slide_url = f"/api/v1/projects/{project_id}/studio/presentations/{job_id}/slides/{slide_file}"
+        # Jobs created before slide_url_prefix was stored fall back to building it
+        slide_url_prefix = (
+            job.get('slide_url_prefix')
+            or f"/api/v1/projects/{project_id}/studio/presentations/{job_id}/slides/"
+        )
+        slide_url = slide_url_prefix + slide_file
 
         return jsonify({
             'success': True,
-            'total_slides': len(slide_files),
+            'total_slides': total_slides,
             'current_slide': slide_num,
             'slide_file': slide_file,
             'slide_url': slide_url,
@@ -308,14 +352,14 @@ def preview_presentation(project_id: str, job_id: str):
         })
 
     except Exception as e:
-        current_app.logger.error(f"Error previewing presentation: {e}")
+        current_app.logger.exception("Error previewing presentation: %s", e)
         return jsonify({
             'success': False,
             'error': f'Failed to preview presentation: {str(e)}'
         }), 500
 
 
-@studio_bp.route('/projects/<project_id>/studio/presentations/<job_id>/download', methods=['GET'])
+@studio_bp.route('/projects/<project_id>/studio/presentations/<job_id>/download', methods=['GET', 'HEAD'])
 def download_presentation(project_id: str, job_id: str):
     """
     Download presentation as PPTX file.
@@ -346,6 +390,38 @@ def download_presentation(project_id: str, job_id: str):
                     'error': 'PPTX file not ready yet. Export may still be processing.'
                 }), 400
 
+            # Jobs exported after size/mtime were recorded can answer a
+            # re-download with 304 before pulling the file from storage.
+            pptx_mtime = job.get('pptx_mtime')
+            pptx_etag = None
+            pptx_modified = None
+            if pptx_mtime is not None and job.get('pptx_size') is not None:
+                pptx_etag = f"{job_id}-{job['pptx_size']}-{int(pptx_mtime)}"
+                # Stored as a POSIX timestamp; the HTTP helpers want a datetime
+                pptx_modified = datetime.fromtimestamp(pptx_mtime, timezone.utc)
+                if not is_resource_modified(
+                    request.environ, etag=pptx_etag, last_modified=pptx_modified
+                ):
+                    response = Response(status=304)
+                    response.set_etag(pptx_etag)
+                    return response
+
+            download_name = job.get('pptx_filename', 'Presentation.pptx')
+
+            if request.method == 'HEAD':
+                # Size/mtime on the job record answer the probe without storage
+                if pptx_etag is not None:
+                    return head_response(
+                        download_name,
+                        job['pptx_size'],
+                        mimetype=PPTX_MIMETYPE,
+                        last_modified=pptx_modified,
+                        etag=pptx_etag
+                    )
+                return head_studio_file(
+                    project_id, "presentations", job_id, pptx_filename, mimetype=PPTX_MIMETYPE
+                )
+
             pptx_data = storage_service.download_studio_binary(
                 project_id, "presentations", job_id, pptx_filename
             )
@@ -355,13 +431,13 @@ def download_presentation(project_id: str, job_id: str):
                     'error': 'PPTX file not found'
                 }), 404
 
-            download_name = job.get('pptx_filename', 'Presentation.pptx')
-
-            return send_file(
-                io.BytesIO(pptx_data),
-                mimetype='application/vnd.openxmlformats-officedocument.presentationml.presentation',
+            return send_studio_bytes(
+                pptx_data,
+                download_name,
+                mimetype=PPTX_MIMETYPE,
                 as_attachment=True,
-                download_name=download_name
+                etag=pptx_etag,
+                last_modified=pptx_modified
             )
 
         elif download_format == 'zip':
@@ -375,47 +451,37 @@ def download_presentation(project_id: str, job_id: str):
             # Create ZIP in memory from Supabase Storage
             zip_buffer = io.BytesIO()
 
+            # Collect every archive entry first so the storage downloads can
+            # run concurrently instead of one round-trip per file.
+            archive_names = [f"slides/{slide_file}" for slide_file in job.get('slide_files') or []]
+            archive_names.append("slides/base-styles.css")
+
+            screenshots = job.get('screenshots') or []
+            for screenshot_info in screenshots:
+                screenshot_name = screenshot_info.get('filename', '')
+                if not screenshot_name:
+                    # Extract filename from path if stored that way
+                    path = screenshot_info.get('path', '')
+                    if path:
+                        screenshot_name = path.rsplit('/', 1)[-1].rsplit('\\', 1)[-1]
+                if screenshot_name:
+                    archive_names.append(f"screenshots/{screenshot_name}")
+
+            pptx_filename = job.get('pptx_file')
+            if pptx_filename:
+                archive_names.append(pptx_filename)
+
+            file_contents = storage_service.download_studio_binaries(
+                project_id, "presentations", job_id, archive_names
+            )
+
             with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-                # Add slide HTML files and base-styles.css
-                slide_files = job.get('slide_files') or []
-                for slide_file in slide_files:
-                    content = storage_service.download_studio_file(
-                        project_id, "presentations", job_id, f"slides/{slide_file}"
-                    )
+                for archive_name, content in zip(archive_names, file_contents):
                     if content:
-                        zip_file.writestr(f"slides/{slide_file}", content)
-
-                # Add base-styles.css
-                css_content = storage_service.download_studio_file(
-                    project_id, "presentations", job_id, "slides/base-styles.css"
-                )
-                if css_content:
-                    zip_file.writestr("slides/base-styles.css", css_content)
-
-                # Add screenshots
-                screenshots = job.get('screenshots') or []
-                for screenshot_info in screenshots:
-                    screenshot_name = screenshot_info.get('filename', '')
-                    if not screenshot_name:
-                        # Extract filename from path if stored that way
-                        path = screenshot_info.get('path', '')
-                        if path:
-                            screenshot_name = path.rsplit('/', 1)[-1].rsplit('\\', 1)[-1]
-                    if screenshot_name:
-                        img_data = storage_service.download_studio_binary(
-                            project_id, "presentations", job_id, f"screenshots/{screenshot_name}"
+                        zip_file.writestr(
+                            archive_name, content,
+                            compress_type=zip_compress_type(archive_name)
                         )
-                        if img_data:
-                            zip_file.writestr(f"screenshots/{screenshot_name}", img_data)
-
-                # Add PPTX file
-                pptx_filename = job.get('pptx_file')
-                if pptx_filename:
-                    pptx_data = storage_service.download_studio_binary(
-                        project_id, "presentations", job_id, pptx_filename
-                    )
-                    if pptx_data:
-                        zip_file.writestr(pptx_filename, pptx_data)
 
             zip_buffer.seek(0)
 
@@ -433,7 +499,7 @@ def download_presentation(project_id: str, job_id: str):
             }), 400
 
     except Exception as e:
-        current_app.logger.error(f"Error downloading presentation: {e}")
+        current_app.logger.exception("Error downloading presentation: %s", e)
         return jsonify({
             'success': False,
             'error': f'Failed to download presentation: {str(e)}'
@@ -445,8 +511,11 @@ def delete_presentation(project_id: str, job_id: str):
     """
     Delete a presentation and its files.
 
+    The index row is removed synchronously; storage files are cleaned up
+    by a background task.
+
     Returns:
-        Success status
+        202 Accepted with success status
     """
     try:
         # Get job to verify it exists
@@ -457,19 +526,33 @@ def delete_presentation(project_id: str, job_id: str):
                 'error': 'Job not found'
             }), 404
 
-        # Delete files from Supabase Storage
-        storage_service.delete_studio_job_files(project_id, "presentations", job_id)
-
-        # Delete from index
+        # Delete from index first so the job disappears from the UI right away
         deleted = studio_index_service.delete_presentation_job(project_id, job_id)
+        if not deleted:
+            return jsonify({
+                'success': False,
+                'message': 'Failed to delete from index'
+            })
+
+        # A deck is dozens of slide HTML files + screenshots spread over
+        # several storage folders; walking and removing them can take
+        # seconds, so it runs in the background instead of holding the request.
+        task_service.submit_task(
+            task_type="presentation_cleanup",
+            target_id=job_id,
+            callable_func=storage_service.delete_studio_job_files,
+            project_id=project_id,
+            job_type="presentations",
+            job_id=job_id
+        )
 
         return jsonify({
-            'success': deleted,
-            'message': 'Presentation deleted' if deleted else 'Failed to delete from index'
-        })
+            'success': True,
+            'message': 'Presentation deleted'
+        }), 202  # Accepted - storage cleanup scheduled
 
     except Exception as e:
-        current_app.logger.error(f"Error deleting presentation: {e}")
+        current_app.logger.exception("Error deleting presentation: %s", e)
         return jsonify({
             'success': False,
             'error': f'Failed to delete presentation: {str(e)}'
@@ -56,7 +56,7 @@ def generate_quiz(project_id: str):
         - message: Status message
     """
     try:
-        data = request.get_json() or {}
+        data = request.get_json(silent=True, cache=False) or {}
 
         source_id = data.get('source_id')
         if not source_id:
@@ -82,14 +82,7 @@ def generate_quiz(project_id: str):
 
         if parent_job_id:
             # Clean up any previously failed edit jobs for this parent
-            try:
-                all_jobs = studio_index_service.list_quiz_jobs(project_id)
-                for job in all_jobs:
-                    if (job.get("status") == "error"
-                            and job.get("parent_job_id") == parent_job_id):
-                        studio_index_service.delete_quiz_job(project_id, job["id"])
-            except Exception:
-                pass  # Non-critical cleanup — don't block the new edit
+            studio_index_service.delete_failed_edit_jobs(project_id, "quiz", parent_job_id)
 
             parent_job = studio_index_service.get_quiz_job(project_id, parent_job_id)
             if not parent_job:
@@ -150,7 +143,7 @@ def generate_quiz(project_id: str):
         }), 202  # 202 Accepted - processing started
 
     except Exception as e:
-        current_app.logger.error(f"Error starting quiz generation: {e}")
+        current_app.logger.exception("Error starting quiz generation: %s", e)
         return jsonify({
             'success': False,
             'error': f'Failed to start quiz generation: {str(e)}'
@@ -167,7 +160,7 @@ def get_quiz_job_status(project_id: str, job_id: str):
         - job: Job record with status, progress, questions (when ready)
     """
     try:
-        job = studio_index_service.get_quiz_job(project_id, job_id)
+        job = studio_index_service.get_job_for_poll(project_id, job_id)
 
         if not job:
             return jsonify({
@@ -181,7 +174,7 @@ def get_quiz_job_status(project_id: str, job_id: str):
         }), 200
 
     except Exception as e:
-        current_app.logger.error(f"Error getting quiz job status: {e}")
+        current_app.logger.exception("Error getting quiz job status: %s", e)
         return jsonify({
             'success': False,
             'error': f'Failed to get job status: {str(e)}'
@@ -218,7 +211,7 @@ def list_quiz_jobs(project_id: str):
         }), 200
 
     except Exception as e:
-        current_app.logger.error(f"Error listing quiz jobs: {e}")
+        current_app.logger.exception("Error listing quiz jobs: %s", e)
         return jsonify({
             'success': False,
             'error': f'Failed to list jobs: {str(e)}'
@@ -251,7 +244,7 @@ def delete_quiz_job(project_id: str, job_id: str):
         })
 
     except Exception as e:
-        current_app.logger.error(f"Error deleting quiz job: {e}")
+        current_app.logger.exception("Error deleting quiz job: %s", e)
         return jsonify({
             'success': False,
             'error': f'Failed to delete quiz job: {str(e)}'
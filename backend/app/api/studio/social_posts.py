@@ -25,10 +25,10 @@ Routes:
 - GET  /projects/<id>/studio/social-post-jobs                - List jobs
 - GET  /projects/<id>/studio/social/<job_id>/<file>          - Serve image file (from Supabase)
 """
-import io
 import uuid
-from flask import g, jsonify, request, current_app, send_file
+from flask import g, jsonify, request, current_app
 from app.api.studio import studio_bp
+from app.api.studio.file_utils import send_studio_bytes, head_studio_file
 from app.api.studio.logo_utils import resolve_logo
 from app.services.studio_services import studio_index_service
 from app.services.studio_services.social_posts_service import social_posts_service
@@ -61,7 +61,7 @@ def generate_social_posts(project_id: str):
         - message: Status message
     """
     try:
-        data = request.get_json() or {}
+        data = request.get_json(silent=True, cache=False) or {}
 
         # Edit mode: load parent job's posts as context for refinement
         parent_job_id = data.get("parent_job_id")
@@ -71,14 +71,7 @@ def generate_social_posts(project_id: str):
 
         if parent_job_id:
             # Clean up any previously failed edit jobs for this parent
-            try:
-                all_jobs = studio_index_service.list_social_post_jobs(project_id)
-                for job in all_jobs:
-                    if (job.get("status") == "error"
-                            and job.get("parent_job_id") == parent_job_id):
-                        studio_index_service.delete_social_post_job(project_id, job["id"])
-            except Exception:
-                pass  # Non-critical cleanup
+            studio_index_service.delete_failed_edit_jobs(project_id, "social_post", parent_job_id)
 
             parent_job = studio_index_service.get_social_post_job(project_id, parent_job_id)
             if not parent_job:
@@ -163,7 +156,7 @@ def generate_social_posts(project_id: str):
         }), 202  # 202 Accepted - processing started
 
     except Exception as e:
-        current_app.logger.error(f"Error starting social post generation: {e}")
+        current_app.logger.exception("Error starting social post generation: %s", e)
         return jsonify({
             'success': False,
             'error': f'Failed to start social post generation: {str(e)}'
@@ -180,7 +173,7 @@ def get_social_post_job_status(project_id: str, job_id: str):
         - job: Job record with status, progress, posts (when ready)
     """
     try:
-        job = studio_index_service.get_social_post_job(project_id, job_id)
+        job = studio_index_service.get_job_for_poll(project_id, job_id)
 
         if not job:
             return jsonify({
@@ -194,7 +187,7 @@ def get_social_post_job_status(project_id: str, job_id: str):
         }), 200
 
     except Exception as e:
-        current_app.logger.error(f"Error getting social post job status: {e}")
+        current_app.logger.exception("Error getting social post job status: %s", e)
         return jsonify({
             'success': False,
             'error': f'Failed to get job status: {str(e)}'
@@ -226,7 +219,7 @@ def list_social_post_jobs(project_id: str):
         }), 200
 
     except Exception as e:
-        current_app.logger.error(f"Error listing social post jobs: {e}")
+        current_app.logger.exception("Error listing social post jobs: %s", e)
         return jsonify({
             'success': False,
             'error': f'Failed to list jobs: {str(e)}'
@@ -262,14 +255,14 @@ def delete_social_post_job(project_id: str, job_id: str):
         })
 
     except Exception as e:
-        current_app.logger.error(f"Error deleting social post job: {e}")
+        current_app.logger.exception("Error deleting social post job: %s", e)
         return jsonify({
             'success': False,
             'error': f'Failed to delete social post job: {str(e)}'
         }), 500
 
 
-@studio_bp.route('/projects/<project_id>/studio/social/<job_id>/<filename>', methods=['GET'])
+@studio_bp.route('/projects/<project_id>/studio/social/<job_id>/<filename>', methods=['GET', 'HEAD'])
 def get_social_file(project_id: str, job_id: str, filename: str):
     """
     Serve a social post image file from Supabase Storage.
@@ -277,7 +270,16 @@ def get_social_file(project_id: str, job_id: str, filename: str):
     Response:
         - Image file (png/jpg) with appropriate headers
     """
+    if not storage_service.is_safe_studio_filename(filename):
+        return jsonify({
+            'success': False,
+            'error': f'Invalid filename: {filename}'
+        }), 400
+
     try:
+        if request.method == 'HEAD':
+            return head_studio_file(project_id, "social_posts", job_id, filename)
+
         # Fetch from Supabase Storage
         file_data = storage_service.download_studio_binary(
             project_id=project_id,
@@ -292,17 +294,11 @@ def get_social_file(project_id: str, job_id: str, filename: str):
                 'error': f'Social image not found: {filename}'
             }), 404
 
-        # Determine mimetype
-        mimetype = 'image/png' if filename.endswith('.png') else 'image/jpeg'
-
-        return send_file(
-            io.BytesIO(file_data),
-            mimetype=mimetype,
-            as_attachment=False
-        )
+        # MIME type (png/jpeg) is inferred from the filename
+        return send_studio_bytes(file_data, filename)
 
     except Exception as e:
-        current_app.logger.error(f"Error serving social file: {e}")
+        current_app.logger.exception("Error serving social file: %s", e)
         return jsonify({
             'success': False,
             'error': f'Failed to serve social file: {str(e)}'
@@ -26,13 +26,28 @@ Routes:
 - GET  /projects/<id>/studio/videos/<id>/preview/<file>     - Preview video
 - GET  /projects/<id>/studio/videos/<id>/download/<file>    - Download video
 """
-import io
-from flask import jsonify, request, current_app, send_file
+from flask import jsonify, request, current_app
 from app.api.studio import studio_bp
+from app.api.studio.file_utils import (
+    CONDITIONAL_REQUEST_HEADERS,
+    RANGE_REQUEST_HEADERS,
+    head_studio_file,
+    relay_storage_stream,
+    set_attachment_filename,
+)
+from app.api.studio.job_utils import job_status_response
 from app.services.studio_services import studio_index_service
+from app.services.tool_executors.video_executor import video_executor
 from app.services.integrations.supabase import storage_service
 from app.services.auth import require_permission
 
+_ASPECT_RATIOS = ("16:9", "16:10")
+
+
+def _is_int_in_range(value, low: int, high: int) -> bool:
+    """True for a real int (not bool/str/float) within [low, high]."""
+    return isinstance(value, int) and not isinstance(value, bool) and low <= value <= high
+
 
 @studio_bp.route('/projects/<project_id>/studio/videos', methods=['POST'])
 @require_permission("studio", "videos")
@@ -56,9 +71,7 @@ def generate_video(project_id: str):
         - message: Status message
     """
     try:
-        from app.services.tool_executors.video_executor import video_executor
-
-        data = request.get_json()
+        data = request.get_json(silent=True, cache=False) or {}
         source_id = data.get("source_id")
         direction = data.get("direction", "")
         aspect_ratio = data.get("aspect_ratio", "16:9")
@@ -72,14 +85,7 @@ def generate_video(project_id: str):
 
         if parent_job_id:
             # Clean up any previously failed edit jobs for this parent
-            try:
-                all_jobs = studio_index_service.list_video_jobs(project_id)
-                for job in all_jobs:
-                    if (job.get("status") == "error"
-                            and job.get("parent_job_id") == parent_job_id):
-                        studio_index_service.delete_video_job(project_id, job["id"])
-            except Exception:
-                pass  # Non-critical cleanup
+            studio_index_service.delete_failed_edit_jobs(project_id, "video", parent_job_id)
 
             parent_job = studio_index_service.get_video_job(project_id, parent_job_id)
             if not parent_job:
@@ -104,19 +110,19 @@ def generate_video(project_id: str):
             }), 400
 
         # Validate parameters
-        if aspect_ratio not in ["16:9", "16:10"]:
+        if aspect_ratio not in _ASPECT_RATIOS:
             return jsonify({
                 'success': False,
                 'error': 'aspect_ratio must be "16:9" or "16:10"'
             }), 400
 
-        if not (5 <= duration_seconds <= 8):
+        if not _is_int_in_range(duration_seconds, 5, 8):
             return jsonify({
                 'success': False,
                 'error': 'duration_seconds must be between 5 and 8'
             }), 400
 
-        if not (1 <= number_of_videos <= 4):
+        if not _is_int_in_range(number_of_videos, 1, 4):
             return jsonify({
                 'success': False,
                 'error': 'number_of_videos must be between 1 and 4'
@@ -158,7 +164,7 @@ def get_video_job_status(project_id: str, job_id: str):
         - job: Video job record with status and videos
     """
     try:
-        job = studio_index_service.get_video_job(project_id, job_id)
+        job = studio_index_service.get_job_for_poll(project_id, job_id)
 
         if not job:
             return jsonify({
@@ -166,10 +172,7 @@ def get_video_job_status(project_id: str, job_id: str):
                 'error': 'Job not found'
             }), 404
 
-        return jsonify({
-            'success': True,
-            'job': job
-        })
+        return job_status_response(job)
 
     except Exception as e:
         current_app.logger.error(f"Error getting video job status: {e}")
@@ -193,7 +196,7 @@ def list_video_jobs(project_id: str):
     """
     try:
         source_id = request.args.get('source_id')
-        jobs = studio_index_service.list_video_jobs(project_id, source_id)
+        jobs = studio_index_service.list_jobs_for_poll(project_id, "video", source_id)
 
         # Filter out orphaned failed-edit jobs (error + parent_job_id)
         clean_jobs = [
@@ -214,64 +217,68 @@ def list_video_jobs(project_id: str):
         }), 500
 
 
-@studio_bp.route('/projects/<project_id>/studio/videos/<job_id>/preview/<filename>', methods=['GET'])
+@studio_bp.route('/projects/<project_id>/studio/videos/<job_id>/preview/<filename>', methods=['GET', 'HEAD'])
 def preview_video(project_id: str, job_id: str, filename: str):
     """
     Preview a generated video file from Supabase Storage.
 
-    Returns the video file for playback in browser.
+    Returns the video file for playback in browser. Range requests are
+    answered with 206 so the <video> element can seek.
     """
-    try:
-        data = storage_service.download_studio_binary(
-            project_id, "videos", job_id, filename
-        )
+    return _serve_video(project_id, job_id, filename, as_attachment=False)
 
-        if not data:
-            return jsonify({
-                'success': False,
-                'error': 'Video file not found'
-            }), 404
 
-        return send_file(io.BytesIO(data), mimetype='video/mp4', as_attachment=False)
-
-    except Exception as e:
-        current_app.logger.error(f"Error serving video preview: {e}")
-        return jsonify({
-            'success': False,
-            'error': f'Failed to serve video: {str(e)}'
-        }), 500
-
-
-@studio_bp.route('/projects/<project_id>/studio/videos/<job_id>/download/<filename>', methods=['GET'])
+@studio_bp.route('/projects/<project_id>/studio/videos/<job_id>/download/<filename>', methods=['GET', 'HEAD'])
 def download_video(project_id: str, job_id: str, filename: str):
     """
     Download a generated video file from Supabase Storage.
 
     Returns the video file as an attachment.
     """
+    return _serve_video(project_id, job_id, filename, as_attachment=True)
+
+
+def _serve_video(project_id: str, job_id: str, filename: str, as_attachment: bool):
+    """Shared body of preview_video / download_video."""
+    if not storage_service.is_safe_studio_filename(filename):
+        return jsonify({
+            'success': False,
+            'error': 'Invalid filename'
+        }), 400
+
     try:
-        data = storage_service.download_studio_binary(
-            project_id, "videos", job_id, filename
+        if request.method == 'HEAD':
+            return head_studio_file(project_id, "videos", job_id, filename, mimetype='video/mp4')
+
+        # A <video> element sends a Range request for every seek; let
+        # storage answer it so only the requested bytes leave Supabase
+        upstream = storage_service.open_studio_binary_stream(
+            project_id, "videos", job_id, filename,
+            headers={
+                name: request.headers[name]
+                for name in CONDITIONAL_REQUEST_HEADERS + RANGE_REQUEST_HEADERS
+                if name in request.headers
+            }
         )
 
-        if not data:
+        if upstream is None:
             return jsonify({
                 'success': False,
                 'error': 'Video file not found'
             }), 404
 
-        return send_file(
-            io.BytesIO(data),
-            mimetype='video/mp4',
-            as_attachment=True,
-            download_name=filename
-        )
+        response = relay_storage_stream(upstream, 'video/mp4')
+        response.headers['Accept-Ranges'] = 'bytes'
+        if as_attachment:
+            set_attachment_filename(response, filename)
+        return response
 
     except Exception as e:
-        current_app.logger.error(f"Error downloading video: {e}")
+        action = "downloading video" if as_attachment else "serving video preview"
+        current_app.logger.error(f"Error {action}: {e}")
         return jsonify({
             'success': False,
-            'error': f'Failed to download video: {str(e)}'
+            'error': f'Failed to {"download" if as_attachment else "serve"} video: {str(e)}'
         }), 500
 
 
@@ -29,15 +29,166 @@ Routes:
 - GET  /projects/<id>/studio/websites/<id>/preview          - Preview site
 - GET  /projects/<id>/studio/websites/<id>/download         - Download ZIP
 """
-import io
+import os
 import re
-import zipfile
-from flask import jsonify, request, current_app, send_file, Response
+import threading
+from functools import lru_cache
+from typing import Optional, Tuple
+import lxml.html
+from cachetools import TTLCache
+from lxml import etree
+from flask import jsonify, request, current_app, Response, stream_with_context
 from app.api.studio import studio_bp
+from app.api.studio.file_utils import (
+    CONDITIONAL_REQUEST_HEADERS,
+    iter_zip,
+    relay_storage_stream,
+    set_attachment_filename,
+)
+from app.api.studio.job_utils import job_status_response
 from app.services.studio_services import studio_index_service
+from app.services.tool_executors.website_agent_executor import website_agent_executor
 from app.services.integrations.supabase import storage_service
 from app.services.auth import require_permission
 
+# Local url(...) references in CSS (skips absolute, protocol-relative and data: URLs)
+_CSS_URL_RE = re.compile(r"""(url\(["']?)(?!https?://|//|data:)([^"')\s]+)(["']?\))""")
+
+# Local src="..." / href="..." attributes in HTML (skips external, anchor and mailto links).
+# Only used as a fallback when lxml can't parse the page.
+_HTML_SRC_RE = re.compile(r'(src|href)="(?!https?://|//|data:|#|mailto:)([^"]+)"')
+
+# MIME types for files a generated website can contain
+_WEBSITE_MIME_TYPES = {
+    '.html': 'text/html',
+    '.htm': 'text/html',
+    '.css': 'text/css',
+    '.js': 'application/javascript',
+    '.png': 'image/png',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.gif': 'image/gif',
+    '.svg': 'image/svg+xml',
+    '.webp': 'image/webp',
+}
+
+# Per-worker caches for website files of ready jobs. A ready job's file
+# set is final (edits create a new job), so entries never need
+# invalidating; the TTL only bounds memory and deleted jobs.
+#
+# _TEXT_FILES holds small HTML/CSS/JS so hot pages are served without a
+# storage round-trip. _MISSING_FILES remembers 404s: a page referencing a
+# missing asset many times would otherwise cost one round-trip per
+# reference per pageview.
+_TEXT_FILES: TTLCache = TTLCache(maxsize=16 * 1024 * 1024, ttl=60, getsizeof=len)
+_MAX_CACHED_TEXT_CHARS = 256 * 1024
+_MISSING_FILES: TTLCache = TTLCache(maxsize=4096, ttl=60)
+_FILE_CACHE_LOCK = threading.Lock()
+
+_EXTERNAL_URL_PREFIXES = ('http://', 'https://', '//', 'data:', '#', 'mailto:')
+
+
+def _job_is_ready(project_id: str, job_id: str) -> bool:
+    job = studio_index_service.get_job_for_poll(project_id, job_id)
+    return bool(job) and job.get('status') == 'ready'
+
+
+def _is_known_missing(project_id: str, job_id: str, filename: str) -> bool:
+    with _FILE_CACHE_LOCK:
+        return (project_id, job_id, filename) in _MISSING_FILES
+
+
+def _remember_missing(project_id: str, job_id: str, filename: str) -> None:
+    if _job_is_ready(project_id, job_id):
+        with _FILE_CACHE_LOCK:
+            _MISSING_FILES[(project_id, job_id, filename)] = True
+
+
+def _download_website_text(project_id: str, job_id: str, filename: str) -> Optional[str]:
+    """download_studio_file for website text files, through the per-worker cache."""
+    key = (project_id, job_id, filename)
+    with _FILE_CACHE_LOCK:
+        content = _TEXT_FILES.get(key)
+    if content is not None:
+        return content
+
+    content = storage_service.download_studio_file(project_id, "websites", job_id, filename)
+    if (
+        content is not None
+        and len(content) <= _MAX_CACHED_TEXT_CHARS
+        and _job_is_ready(project_id, job_id)
+    ):
+        with _FILE_CACHE_LOCK:
+            _TEXT_FILES[key] = content
+    return content
+
+
+def _add_token_to_url(url: str, token: str) -> str:
+    """Append ?token= to a local URL; external/anchor/data URLs are left alone."""
+    if not url or url.startswith(_EXTERNAL_URL_PREFIXES):
+        return url
+    sep = '&' if '?' in url else '?'
+    return f'{url}{sep}token={token}'
+
+
+@lru_cache(maxsize=128)
+def _split_css_urls(content: str) -> Tuple[str, ...]:
+    """
+    Split a stylesheet around its local url() references.
+
+    The result alternates [text, prefix, url, suffix, text, ...], so every
+    4th item starting at index 2 is a URL. The regex scan happens once per
+    stylesheet (text from the per-worker file cache is the same str object,
+    so its hash is cached too); each request then only rejoins the pieces
+    with its own token.
+    """
+    return tuple(_CSS_URL_RE.split(content))
+
+
+def _add_token_to_css(content: str, token: str) -> str:
+    """Inject ?token= into local url() references in a stylesheet."""
+    parts = _split_css_urls(content)
+    if len(parts) == 1:
+        return content
+    return ''.join(
+        _add_token_to_url(part, token) if i % 4 == 2 else part
+        for i, part in enumerate(parts)
+    )
+
+
+def _add_token_to_html(html_content: str, token: str) -> str:
+    """
+    Inject ?token= into every local resource URL in an HTML page.
+
+    Parsed with lxml rather than a regex over the raw text, so single-quoted
+    attributes, srcset candidates, inline style="...url(...)" and <style>
+    blocks are all covered. Falls back to the src/href regex if the page
+    can't be parsed.
+    """
+    try:
+        doc = lxml.html.document_fromstring(html_content)
+    except (etree.ParserError, ValueError):
+        return _HTML_SRC_RE.sub(
+            lambda m: f'{m.group(1)}="{_add_token_to_url(m.group(2), token)}"',
+            html_content
+        )
+
+    # href/src/action/..., plus url() inside style attributes and <style>
+    doc.rewrite_links(lambda url: _add_token_to_url(url, token), resolve_base_href=False)
+
+    # rewrite_links doesn't look inside srcset ("url 1x, url 2x")
+    for node in doc.xpath('//*[@srcset]'):
+        candidates = []
+        for candidate in node.get('srcset').split(','):
+            parts = candidate.strip().split(None, 1)
+            if parts:
+                parts[0] = _add_token_to_url(parts[0], token)
+            candidates.append(' '.join(parts))
+        node.set('srcset', ', '.join(candidates))
+
+    doctype = doc.getroottree().docinfo.doctype or None
+    return lxml.html.tostring(doc, encoding='unicode', doctype=doctype)
+
 
 @studio_bp.route('/projects/<project_id>/studio/website', methods=['POST'])
 @require_permission("studio", "websites")
@@ -56,8 +207,6 @@ def generate_website(project_id: str):
     Returns:
         202 Accepted with job_id for polling
     """
-    from app.services.tool_executors import website_agent_executor
-
     try:
         data = request.get_json()
         source_id = data.get('source_id')
@@ -72,14 +221,7 @@ def generate_website(project_id: str):
 
         if parent_job_id:
             # Clean up any previously failed edit jobs for this parent
-            try:
-                all_jobs = studio_index_service.list_website_jobs(project_id)
-                for job in all_jobs:
-                    if (job.get("status") == "error"
-                            and job.get("parent_job_id") == parent_job_id):
-                        studio_index_service.delete_website_job(project_id, job["id"])
-            except Exception:
-                pass  # Non-critical cleanup — don't block the new edit
+            studio_index_service.delete_failed_edit_jobs(project_id, "website", parent_job_id)
 
             parent_job = studio_index_service.get_website_job(project_id, parent_job_id)
             if not parent_job or not parent_job.get('files'):
@@ -147,7 +289,7 @@ def get_website_job_status(project_id: str, job_id: str):
         Job object with current status, progress, and results if complete
     """
     try:
-        job = studio_index_service.get_website_job(project_id, job_id)
+        job = studio_index_service.get_job_for_poll(project_id, job_id)
 
         if not job:
             return jsonify({
@@ -155,10 +297,7 @@ def get_website_job_status(project_id: str, job_id: str):
                 'error': 'Job not found'
             }), 404
 
-        return jsonify({
-            'success': True,
-            'job': job
-        })
+        return job_status_response(job)
 
     except Exception as e:
         current_app.logger.error(f"Error getting website job status: {e}")
@@ -181,7 +320,7 @@ def list_website_jobs(project_id: str):
     """
     try:
         source_id = request.args.get('source_id')
-        jobs = studio_index_service.list_website_jobs(project_id, source_id)
+        jobs = studio_index_service.list_jobs_for_poll(project_id, "website", source_id)
 
         # Filter out orphaned failed-edit jobs (error + parent_job_id).
         clean_jobs = [
@@ -213,39 +352,37 @@ def get_website_file(project_id: str, job_id: str, filename: str):
         - Scripts: script.js
         - Assets: assets/image_1.png, etc.
     """
+    if not storage_service.is_safe_studio_filename(filename):
+        return jsonify({'success': False, 'error': 'Invalid filename'}), 400
+
     try:
-        # Determine MIME type
-        mime_type = 'text/html'
-        if filename.endswith('.css'):
-            mime_type = 'text/css'
-        elif filename.endswith('.js'):
-            mime_type = 'application/javascript'
-        elif filename.endswith('.png'):
-            mime_type = 'image/png'
-        elif filename.endswith('.jpg') or filename.endswith('.jpeg'):
-            mime_type = 'image/jpeg'
-        elif filename.endswith('.gif'):
-            mime_type = 'image/gif'
-        elif filename.endswith('.svg'):
-            mime_type = 'image/svg+xml'
-        elif filename.endswith('.webp'):
-            mime_type = 'image/webp'
-
-        # Binary files (images)
-        is_binary = mime_type.startswith('image/')
+        mime_type = _WEBSITE_MIME_TYPES.get(
+            os.path.splitext(filename)[1].lower(), 'application/octet-stream'
+        )
+
+        if _is_known_missing(project_id, job_id, filename):
+            return jsonify({'success': False, 'error': 'File not found'}), 404
+
+        # Binary files (images, anything unrecognized)
+        is_binary = not mime_type.startswith(('text/', 'application/javascript'))
         if is_binary:
-            file_data = storage_service.download_studio_binary(
-                project_id, "websites", job_id, filename
+            upstream = storage_service.open_studio_binary_stream(
+                project_id, "websites", job_id, filename,
+                headers={
+                    name: request.headers[name]
+                    for name in CONDITIONAL_REQUEST_HEADERS
+                    if name in request.headers
+                }
             )
-            if file_data is None:
+            if upstream is None:
+                _remember_missing(project_id, job_id, filename)
                 return jsonify({'success': False, 'error': 'File not found'}), 404
-            return send_file(io.BytesIO(file_data), mimetype=mime_type, as_attachment=False)
+            return relay_storage_stream(upstream, mime_type)
 
         # Text files (HTML, CSS, JS)
-        content = storage_service.download_studio_file(
-            project_id, "websites", job_id, filename
-        )
+        content = _download_website_text(project_id, job_id, filename)
         if content is None:
+            _remember_missing(project_id, job_id, filename)
             return jsonify({'success': False, 'error': 'File not found'}), 404
 
         # For CSS files, inject auth token into url() references so images load.
@@ -253,18 +390,7 @@ def get_website_file(project_id: str, job_id: str, filename: str):
         # separate browser requests that don't carry the parent page's query params.
         token = request.args.get('token', '')
         if mime_type == 'text/css' and token:
-            def _add_token_to_css_url(match: re.Match) -> str:
-                prefix = match.group(1)
-                url = match.group(2)
-                suffix = match.group(3)
-                sep = '&' if '?' in url else '?'
-                return f'{prefix}{url}{sep}token={token}{suffix}'
-
-            content = re.sub(
-                r"""(url\(["']?)(?!https?://|//|data:)([^"')\s]+)(["']?\))""",
-                _add_token_to_css_url,
-                content
-            )
+            content = _add_token_to_css(content, token)
 
         return Response(content, mimetype=mime_type)
 
@@ -288,9 +414,7 @@ def preview_website(project_id: str, job_id: str):
     """
     try:
         # Download index.html from Supabase Storage
-        html_content = storage_service.download_studio_file(
-            project_id, "websites", job_id, "index.html"
-        )
+        html_content = _download_website_text(project_id, job_id, "index.html")
         if html_content is None:
             return jsonify({
                 'success': False,
@@ -300,18 +424,7 @@ def preview_website(project_id: str, job_id: str):
         # Inject auth token into local resource URLs (CSS, JS, images)
         token = request.args.get('token', '')
         if token:
-            def _add_token(match: re.Match) -> str:
-                attr = match.group(1)   # src or href
-                url = match.group(2)
-                sep = '&' if '?' in url else '?'
-                return f'{attr}="{url}{sep}token={token}"'
-
-            # Match src="..." and href="..." but skip external URLs
-            html_content = re.sub(
-                r'(src|href)="(?!https?://|//|data:|#|mailto:)([^"]+)"',
-                _add_token,
-                html_content
-            )
+            html_content = _add_token_to_html(html_content, token)
 
         return Response(html_content, mimetype='text/html')
 
@@ -332,8 +445,10 @@ def download_website(project_id: str, job_id: str):
         ZIP file with all HTML pages, CSS, JS, and image assets
     """
     try:
-        # Get job info
-        job = studio_index_service.get_website_job(project_id, job_id)
+        # The job record already lists every text file and image, so it is
+        # the only metadata read needed. Downloads usually follow the poll
+        # that reported "ready", which leaves the job in the poll cache.
+        job = studio_index_service.get_job_for_poll(project_id, job_id)
         if not job:
             return jsonify({
                 'success': False,
@@ -349,36 +464,28 @@ def download_website(project_id: str, job_id: str):
         site_name = job.get('site_name', 'Website')
         zip_filename = f"{site_name.replace(' ', '_')}.zip"
 
-        # Create ZIP in memory from Supabase Storage
-        zip_buffer = io.BytesIO()
+        # Text files (HTML, CSS, JS) from job metadata, then image assets
+        archive_names = list(job.get('files') or [])
+        for image_info in job.get('images') or []:
+            img_filename = image_info.get('filename')
+            if img_filename:
+                archive_names.append(f"assets/{img_filename}")
+
+        # Downloads run in parallel; each entry is zipped as soon as it
+        # and everything before it has arrived.
+        entries = zip(
+            archive_names,
+            storage_service.iter_studio_binaries(project_id, "websites", job_id, archive_names)
+        )
 
-        with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-            # Add text files (HTML, CSS, JS) from job metadata
-            for fname in job.get('files') or []:
-                content = storage_service.download_studio_file(
-                    project_id, "websites", job_id, fname
-                )
-                if content:
-                    zip_file.writestr(fname, content)
-
-            # Add image assets
-            for image_info in job.get('images') or []:
-                img_filename = image_info.get('filename')
-                if img_filename:
-                    img_data = storage_service.download_studio_binary(
-                        project_id, "websites", job_id, f"assets/{img_filename}"
-                    )
-                    if img_data:
-                        zip_file.writestr(f"assets/{img_filename}", img_data)
-
-        zip_buffer.seek(0)
-
-        return send_file(
-            zip_buffer,
-            mimetype='application/zip',
-            as_attachment=True,
-            download_name=zip_filename
+        # Stream the ZIP as each file is fetched from Supabase Storage
+        # instead of buffering the whole archive before the first byte.
+        response = Response(
+            stream_with_context(iter_zip(entries)),
+            mimetype='application/zip'
         )
+        set_attachment_filename(response, zip_filename)
+        return response
 
     except Exception as e:
         current_app.logger.error(f"Error downloading website: {e}")
@@ -20,14 +20,19 @@ Routes:
 - GET /transcription/config - Get WebSocket URL with fresh token
 - GET /transcription/status - Check if ElevenLabs is configured
 """
+from functools import lru_cache
+
 from flask import jsonify, current_app, request
 from app.api.transcription import transcription_bp
 from app.services.integrations.elevenlabs import TranscriptionService
 from app.services.ai_services.voice_polish_service import voice_polish_service
 from app.services.auth.rbac import get_request_identity
 
-# Initialize service (lazy loads API key from env)
-transcription_service = TranscriptionService()
+
+@lru_cache(maxsize=1)
+def _transcription_service() -> TranscriptionService:
+    """Per-worker service, created on first use rather than at import."""
+    return TranscriptionService()
 
 
 @transcription_bp.route('/transcription/config', methods=['GET'])
@@ -71,7 +76,7 @@ def get_transcription_config():
         if len(keyterms) == 1 and ',' in keyterms[0]:
             keyterms = [t for t in keyterms[0].split(',') if t.strip()]
 
-        config = transcription_service.get_elevenlabs_config(keyterms=keyterms)
+        config = _transcription_service().get_elevenlabs_config(keyterms=keyterms)
 
         return jsonify({
             'success': True,
@@ -104,6 +109,8 @@ def get_transcription_status():
     - Making any external API calls
     - Generating tokens (which have limited uses)
 
+    Sends an ETag; a matching If-None-Match gets an empty 304.
+
     Use Case: Frontend can call this on load to decide whether to
     show/hide the microphone button. No point showing voice input
     if transcription isn't configured.
@@ -115,12 +122,18 @@ def get_transcription_status():
         }
     """
     try:
-        is_configured = transcription_service.is_configured()
+        is_configured = _transcription_service().is_configured()
 
-        return jsonify({
+        # The body is fully determined by the flag, so the flag is the
+        # validator: repeat checks get an empty 304 until the key is
+        # added or removed in settings.
+        response = jsonify({
             'success': True,
             'configured': is_configured
-        }), 200
+        })
+        response.set_etag(f"transcription-status-{int(is_configured)}")
+        response.headers['Cache-Control'] = 'private, no-cache'
+        return response.make_conditional(request)
 
     except Exception as e:
         current_app.logger.error(f"Error checking transcription status: {e}")
@@ -12,14 +12,71 @@ that can be injected into studio agent system prompts. The context includes:
 Brand config is now user-level (workspace setting). Studio agents pass
 project_id, which is resolved to user_id here — so agents need zero changes.
 """
+import hashlib
 import logging
-from typing import Dict, Any, List, Optional
+import threading
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
 
+import orjson
+from cachetools import LRUCache, TTLCache
+
+from app.services.data_services import project_service
 from app.services.data_services.brand_config_service import brand_config_service
 from app.services.data_services.brand_asset_service import brand_asset_service
 
 logger = logging.getLogger(__name__)
 
+_HEADER = "## Brand Guidelines\n\n"
+_FOOTER = (
+    "\n**MANDATORY**: All generated content MUST use these exact brand colors, "
+    "fonts, voice, and logo. Do NOT substitute with defaults or generic values.\n"
+)
+
+# (key, label, usage) for the standard palette, in prompt order
+_COLOR_ROLES = (
+    ("primary", "Primary Color", "headers, section backgrounds, key accents"),
+    ("accent", "Accent Color", "CTA buttons, links, highlights"),
+    ("secondary", "Secondary Color", "secondary sections, borders, dividers"),
+    ("background", "Background Color", "email/page body background"),
+    ("text", "Text Color", "all body text, paragraphs"),
+)
+
+# Formatted context keyed by (user_id, content hash of config + assets).
+# Chat builds brand context on every message and each studio agent on every
+# run, while the config itself changes rarely. A saved change produces a new
+# hash, so stale entries simply stop being hit and age out of the LRU.
+_CONTEXT_CACHE: LRUCache = LRUCache(maxsize=512)
+_CONTEXT_LOCK = threading.Lock()
+
+# project_id -> owning user_id. Projects don't change hands, so positives
+# are kept for a few minutes; misses are never cached so a just-created
+# project resolves on its first studio run.
+_OWNER_CACHE: TTLCache = TTLCache(maxsize=4096, ttl=300)
+_OWNER_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=256)
+def _google_fonts_url(*fonts: str) -> str:
+    """Google Fonts stylesheet URL for the given families (400 + 700 weights)."""
+    families = "&family=".join(f.replace(" ", "+") + ":wght@400;700" for f in fonts)
+    return f"https://fonts.googleapis.com/css2?family={families}&display=swap"
+
+
+# Config keys that can produce a prompt section on their own
+_CONTENT_KEYS = ("colors", "typography", "voice", "guidelines", "design_md", "best_practices")
+
+
+def _has_brand_content(config: Dict[str, Any]) -> bool:
+    """True if any section-producing config key is non-empty."""
+    return any(config.get(key) for key in _CONTENT_KEYS)
+
+
+def _content_key(config: Dict[str, Any], assets: List[Dict[str, Any]]) -> str:
+    """Stable short hash of everything the formatted context depends on."""
+    payload = orjson.dumps([config, assets], option=orjson.OPT_SORT_KEYS, default=str)
+    return hashlib.blake2b(payload, digest_size=8).hexdigest()
+
 
 class BrandContextLoader:
     """
@@ -51,14 +108,23 @@ class BrandContextLoader:
         such projects was running with brand styling stripped, and the
         only signal was the "could not resolve user_id" warning.
 
+        Owners are cached per project (see _OWNER_CACHE), so repeated studio
+        runs on the same project cost one lookup.
+
         Args:
             project_id: The project UUID
 
         Returns:
             The user_id who owns the project, or None if not found
         """
-        from app.services.data_services import project_service
-        return project_service.get_project_owner_id(project_id)
+        with _OWNER_LOCK:
+            user_id = _OWNER_CACHE.get(project_id)
+        if user_id is None:
+            user_id = project_service.get_project_owner_id(project_id)
+            if user_id:
+                with _OWNER_LOCK:
+                    _OWNER_CACHE[project_id] = user_id
+        return user_id
 
     def load_brand_context(
         self,
@@ -89,78 +155,75 @@ class BrandContextLoader:
             logger.warning("Brand context skipped: could not resolve user_id (project=%s)", project_id[:8])
             return ""
 
-        # Check if brand is enabled for this feature
-        if not brand_config_service.is_feature_enabled(user_id, feature_name):
-            logger.info("Brand context skipped: feature '%s' disabled (user=%s)", feature_name, user_id[:8])
+        # One config read answers both "is brand on for this feature?" and
+        # "what is the brand?"
+        config, enabled = brand_config_service.get_config_with_feature_flag(user_id, feature_name)
+        if not enabled:
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Brand context skipped: feature '%s' disabled (user=%s)", feature_name, user_id[:8])
             return ""
 
-        # Get brand config
-        config = brand_config_service.get_config(user_id)
+        assets = brand_asset_service.list_assets_cached(user_id)
 
-        # Build context sections, tracking which parts are present
-        sections = []
-        included_parts = []
-
-        sections.append("## Brand Guidelines")
-        sections.append("")
-
-        # Add color palette
-        color_context = self._build_color_context(config)
-        if color_context:
-            sections.append(color_context)
-            included_parts.append("colors")
-
-        # Add typography
-        typography_context = self._build_typography_context(config)
-        if typography_context:
-            sections.append(typography_context)
-            included_parts.append("typography")
-
-        # Add brand assets info
-        assets_context = self._build_assets_context(user_id)
-        if assets_context:
-            sections.append(assets_context)
-            included_parts.append("assets")
-
-        # Add brand voice
-        voice_context = self._build_voice_context(config)
-        if voice_context:
-            sections.append(voice_context)
-            included_parts.append("voice")
-
-        # Add guidelines text
-        guidelines_context = self._build_guidelines_context(config)
-        if guidelines_context:
-            sections.append(guidelines_context)
-            included_parts.append("guidelines")
-
-        # Add long-form design.md spec — this is the big one. When admins fill
-        # this out, it carries layout/component/voice rules the structured
-        # tokens above can't express. Skipped silently when empty so existing
-        # workspaces aren't penalized.
-        design_md_context = self._build_design_md_context(config)
-        if design_md_context:
-            sections.append(design_md_context)
-            included_parts.append("design_md")
-
-        # Add best practices
-        practices_context = self._build_practices_context(config)
-        if practices_context:
-            sections.append(practices_context)
-            included_parts.append("practices")
-
-        if len(sections) <= 2:  # Only header and empty line
-            logger.info("Brand context empty: no sections have content (user=%s, feature=%s)", user_id[:8], feature_name)
+        # Brand switched on but nothing filled in yet (typical right after
+        # onboarding): nothing to hash, look up or build.
+        if not assets and not _has_brand_content(config):
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Brand context empty: no brand content configured (user=%s, feature=%s)", user_id[:8], feature_name)
             return ""
 
-        sections.append("**MANDATORY**: All generated content MUST use these exact brand colors, fonts, voice, and logo. Do NOT substitute with defaults or generic values.")
-        sections.append("")
+        key = (user_id, _content_key(config, assets))
+        with _CONTEXT_LOCK:
+            cached = _CONTEXT_CACHE.get(key)
+        if cached is None:
+            cached = self._build_full_context(config, assets)
+            with _CONTEXT_LOCK:
+                _CONTEXT_CACHE[key] = cached
+        context, included_parts = cached
+
+        if not context:
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Brand context empty: no sections have content (user=%s, feature=%s)", user_id[:8], feature_name)
+            return ""
 
-        context = "\n".join(sections)
-        logger.info("Brand context loaded: feature=%s, user=%s, sections=[%s], length=%d chars",
-                     feature_name, user_id[:8], ", ".join(included_parts), len(context))
+        # The join and slices below are eager; skip them when INFO is off
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Brand context loaded: feature=%s, user=%s, sections=[%s], length=%d chars",
+                        feature_name, user_id[:8], ", ".join(included_parts), len(context))
         return context
 
+    def _build_full_context(
+        self,
+        config: Dict[str, Any],
+        assets: List[Dict[str, Any]]
+    ) -> Tuple[str, Tuple[str, ...]]:
+        """
+        Format every brand section into the prompt block.
+
+        Returns:
+            (context, included section names); context is "" when no
+            section has content
+        """
+        sections = (
+            ("colors", self._build_color_context(config)),
+            ("typography", self._build_typography_context(config)),
+            ("assets", self._build_assets_context(assets)),
+            ("voice", self._build_voice_context(config)),
+            ("guidelines", self._build_guidelines_context(config)),
+            # Long-form design.md spec — this is the big one. When admins fill
+            # this out, it carries layout/component/voice rules the structured
+            # tokens above can't express. Skipped silently when empty so
+            # existing workspaces aren't penalized.
+            ("design_md", self._build_design_md_context(config)),
+            ("practices", self._build_practices_context(config)),
+        )
+        present = [(name, text) for name, text in sections if text]
+        if not present:
+            return "", ()
+
+        body = "\n".join(text for _, text in present)
+        return _HEADER + body + _FOOTER, tuple(name for name, _ in present)
+
     def _build_color_context(self, config: Dict[str, Any]) -> str:
         """Build color palette context section, respecting per-color enabled toggles."""
         colors = config.get("colors", {})
@@ -171,36 +234,28 @@ class BrandContextLoader:
         # Per-color enabled flags — default all-on for backward compatibility
         enabled = colors.get("enabled", {})
 
-        lines = [
-            "### Color Palette",
-            "",
-        ]
-
         # Standard colors with usage mapping so agents know where to apply each
         # Only include colors the user has enabled in Settings > Design > Colors
-        if colors.get("primary") and enabled.get("primary", True):
-            lines.append(f"- **Primary Color**: {colors['primary']} → Use for: headers, section backgrounds, key accents")
-        if colors.get("accent") and enabled.get("accent", True):
-            lines.append(f"- **Accent Color**: {colors['accent']} → Use for: CTA buttons, links, highlights")
-        if colors.get("secondary") and enabled.get("secondary", True):
-            lines.append(f"- **Secondary Color**: {colors['secondary']} → Use for: secondary sections, borders, dividers")
-        if colors.get("background") and enabled.get("background", True):
-            lines.append(f"- **Background Color**: {colors['background']} → Use for: email/page body background")
-        if colors.get("text") and enabled.get("text", True):
-            lines.append(f"- **Text Color**: {colors['text']} → Use for: all body text, paragraphs")
-
-        # Custom colors
+        standard = "".join(
+            f"- **{label}**: {colors[key]} → Use for: {usage}\n"
+            for key, label, usage in _COLOR_ROLES
+            if colors.get(key) and enabled.get(key, True)
+        )
+
         custom_colors = colors.get("custom", [])
-        if custom_colors:
-            lines.append("")
-            lines.append("**Custom Colors**:")
-            for custom in custom_colors:
-                name = custom.get("name", "Unnamed")
-                value = custom.get("value", "#000000")
-                lines.append(f"- {name}: {value}")
+        custom = "".join(
+            f"- {custom.get('name', 'Unnamed')}: {custom.get('value', '#000000')}\n"
+            for custom in custom_colors
+        )
 
-        lines.append("")
-        return "\n".join(lines)
+        if not standard and not custom:
+            return ""
+
+        return "".join((
+            "### Color Palette\n\n",
+            standard,
+            f"\n**Custom Colors**:\n{custom}" if custom else "",
+        ))
 
     def _build_typography_context(self, config: Dict[str, Any]) -> str:
         """Build typography context section."""
@@ -209,81 +264,77 @@ class BrandContextLoader:
         if not typography:
             return ""
 
-        lines = [
-            "### Typography",
-            "",
-        ]
-
-        # Include CSS-ready snippets so agents can copy-paste directly
-        if typography.get("heading_font"):
-            hf = typography['heading_font']
-            lines.append(f"- **Heading Font**: {hf} → CSS: font-family: '{hf}', serif;")
-        if typography.get("body_font"):
-            bf = typography['body_font']
-            lines.append(f"- **Body Font**: {bf} → CSS: font-family: '{bf}', sans-serif;")
+        heading_font = typography.get("heading_font")
+        body_font = typography.get("body_font")
 
         # Google Fonts link for web/email use
-        fonts_to_import = []
-        if typography.get("body_font"):
-            fonts_to_import.append(typography["body_font"])
-        if typography.get("heading_font"):
-            fonts_to_import.append(typography["heading_font"])
-        if fonts_to_import:
-            families = "&family=".join(f.replace(" ", "+") + ":wght@400;700" for f in fonts_to_import)
-            lines.append(f"- **Google Fonts**: `<link href=\"https://fonts.googleapis.com/css2?family={families}&display=swap\" rel=\"stylesheet\">`")
-
-        if typography.get("heading_weight"):
-            lines.append(f"- **Heading Weight**: {typography['heading_weight']}")
-        if typography.get("body_weight"):
-            lines.append(f"- **Body Weight**: {typography['body_weight']}")
+        fonts_to_import = tuple(f for f in (body_font, heading_font) if f)
 
-        heading_sizes = typography.get("heading_sizes", {})
-        if heading_sizes:
-            sizes = [f"H{i}={heading_sizes.get(f'h{i}', 'auto')}" for i in range(1, 7) if heading_sizes.get(f'h{i}')]
-            lines.append(f"- **Heading Sizes**: {', '.join(sizes)}")
-
-        if typography.get("body_size"):
-            lines.append(f"- **Body Size**: {typography['body_size']}")
-        if typography.get("line_height"):
-            lines.append(f"- **Line Height**: {typography['line_height']}")
+        heading_weight = typography.get("heading_weight")
+        body_weight = typography.get("body_weight")
+        body_size = typography.get("body_size")
+        line_height = typography.get("line_height")
 
-        lines.append("")
-        return "\n".join(lines)
+        heading_sizes = typography.get("heading_sizes", {})
+        sizes = ", ".join(
+            f"H{level}={size}"
+            for level, size in ((i, heading_sizes.get(f"h{i}")) for i in range(1, 7))
+            if size
+        ) if heading_sizes else ""
 
-    def _build_assets_context(self, user_id: str) -> str:
+        # Include CSS-ready snippets so agents can copy-paste directly
+        return "".join((
+            "### Typography\n\n",
+            f"- **Heading Font**: {heading_font} → CSS: font-family: '{heading_font}', serif;\n" if heading_font else "",
+            f"- **Body Font**: {body_font} → CSS: font-family: '{body_font}', sans-serif;\n" if body_font else "",
+            f"- **Google Fonts**: `<link href=\"{_google_fonts_url(*fonts_to_import)}\" rel=\"stylesheet\">`\n" if fonts_to_import else "",
+            f"- **Heading Weight**: {heading_weight}\n" if heading_weight else "",
+            f"- **Body Weight**: {body_weight}\n" if body_weight else "",
+            f"- **Heading Sizes**: {sizes}\n" if heading_sizes else "",
+            f"- **Body Size**: {body_size}\n" if body_size else "",
+            f"- **Line Height**: {line_height}\n" if line_height else "",
+        ))
+
+    def _build_assets_context(self, assets: List[Dict[str, Any]]) -> str:
         """Build brand assets context section."""
-        assets = brand_asset_service.list_assets(user_id)
-
         if not assets:
             return ""
 
-        # Group by type
-        logos = [a for a in assets if a.get("asset_type") == "logo"]
-        icons = [a for a in assets if a.get("asset_type") == "icon"]
+        # One pass: count logos, pick up the first primary one, and collect
+        # icons (listed by name below)
+        logo_count, icons, primary_logo = 0, [], None
+        for asset in assets:
+            asset_type = asset.get("asset_type")
+            if asset_type == "logo":
+                logo_count += 1
+                if primary_logo is None and asset.get("is_primary"):
+                    primary_logo = asset
+            elif asset_type == "icon":
+                icons.append(asset)
 
         lines = [
             "### Brand Assets",
             "",
         ]
 
-        # Primary logo
-        primary_logo = next((a for a in logos if a.get("is_primary")), None)
         if primary_logo:
             lines.append(f"- **Primary Logo**: {primary_logo.get('name', 'Logo')}")
-            if primary_logo.get("description"):
-                lines.append(f"  - Description: {primary_logo['description']}")
+            logo_description = primary_logo.get("description")
+            if logo_description:
+                lines.append(f"  - Description: {logo_description}")
             lines.append("- **Logo Placeholder**: Use `BRAND_LOGO` as the image src in HTML templates")
 
         # Logo count
-        if len(logos) > 1:
-            lines.append(f"- **Additional Logos Available**: {len(logos) - 1}")
+        if logo_count > 1:
+            lines.append(f"- **Additional Logos Available**: {logo_count - 1}")
 
         # Icons — list each by name so the AI knows what's available
         if icons:
             lines.append(f"- **Icons Available**: {len(icons)}")
             for icon in icons:
                 primary_tag = " (primary)" if icon.get("is_primary") else ""
-                desc = f" — {icon['description']}" if icon.get("description") else ""
+                description = icon.get("description")
+                desc = f" — {description}" if description else ""
                 lines.append(f"  - {icon.get('name', 'Icon')}{primary_tag}{desc}")
 
         lines.append("")
@@ -296,24 +347,16 @@ class BrandContextLoader:
         if not voice:
             return ""
 
-        lines = [
-            "### Brand Voice",
-            "",
-        ]
-
-        if voice.get("tone"):
-            lines.append(f"- **Tone**: {voice['tone']}")
-
+        tone = voice.get("tone")
         personality = voice.get("personality", [])
-        if personality:
-            lines.append(f"- **Personality Traits**: {', '.join(personality)}")
-
         keywords = voice.get("keywords", [])
-        if keywords:
-            lines.append(f"- **Key Terms to Use**: {', '.join(keywords)}")
 
-        lines.append("")
-        return "\n".join(lines)
+        return "".join((
+            "### Brand Voice\n\n",
+            f"- **Tone**: {tone}\n" if tone else "",
+            f"- **Personality Traits**: {', '.join(personality)}\n" if personality else "",
+            f"- **Key Terms to Use**: {', '.join(keywords)}\n" if keywords else "",
+        ))
 
     def _build_design_md_context(self, config: Dict[str, Any]) -> str:
         """Build the long-form design.md spec section."""
@@ -321,12 +364,7 @@ class BrandContextLoader:
         if not design_md:
             return ""
 
-        return "\n".join([
-            "### Design Specification",
-            "",
-            design_md,
-            "",
-        ])
+        return f"### Design Specification\n\n{design_md}\n"
 
     def _build_guidelines_context(self, config: Dict[str, Any]) -> str:
         """Build written guidelines context section."""
@@ -335,14 +373,7 @@ class BrandContextLoader:
         if not guidelines:
             return ""
 
-        lines = [
-            "### Written Guidelines",
-            "",
-            guidelines,
-            "",
-        ]
-
-        return "\n".join(lines)
+        return f"### Written Guidelines\n\n{guidelines}\n"
 
     def _build_practices_context(self, config: Dict[str, Any]) -> str:
         """Build best practices (dos/donts) context section."""
@@ -354,24 +385,13 @@ class BrandContextLoader:
         if not dos and not donts:
             return ""
 
-        lines = [
-            "### Best Practices",
-            "",
-        ]
-
+        blocks = []
         if dos:
-            lines.append("**Do**:")
-            for item in dos:
-                lines.append(f"- {item}")
-            lines.append("")
-
+            blocks.append("**Do**:\n" + "".join(f"- {item}\n" for item in dos))
         if donts:
-            lines.append("**Don't**:")
-            for item in donts:
-                lines.append(f"- {item}")
-            lines.append("")
+            blocks.append("**Don't**:\n" + "".join(f"- {item}\n" for item in donts))
 
-        return "\n".join(lines)
+        return "### Best Practices\n\n" + "\n".join(blocks)
 
     def build_image_prompt_prefix(
         self,
@@ -398,7 +418,7 @@ class BrandContextLoader:
         if not brand_config_service.is_feature_enabled(user_id, feature_name):
             return ""
 
-        config = brand_config_service.get_config(user_id) or {}
+        config = brand_config_service.get_config_cached(user_id) or {}
         colors = config.get("colors", {}) or {}
         typography = config.get("typography", {}) or {}
         voice = config.get("voice", {}) or {}
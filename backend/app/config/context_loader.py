@@ -9,14 +9,92 @@ This module creates formatted context blocks for the system prompt:
 The context is rebuilt on every message to reflect the current state
 (active/inactive sources, new uploads, updated memories).
 """
+import contextvars
+import io
 import logging
-from typing import Dict, Any, List, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
 
 from app.services.source_services import source_service
 
 logger = logging.getLogger(__name__)
 
 
+# Memory and MCP context come from independent queries; a shared pool lets
+# them overlap with each other and with the source context build instead of
+# running back to back on every chat message.
+_CONTEXT_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="chat-context")
+
+
+def _submit(fn: Callable[..., str], *args: Any, **kwargs: Any) -> Future:
+    """Run fn on the context pool, carrying over ContextVars (req_id logging)."""
+    return _CONTEXT_POOL.submit(contextvars.copy_context().run, fn, *args, **kwargs)
+
+
+# Static scaffolding around the per-source entries in build_source_context
+_SOURCE_HEADER = (
+    "\n"
+    "## Available Sources\n"
+    "\n"
+    "You have access to the following sources.\n"
+    "\n"
+    "- Use the search_sources tool to retrieve information from embedded sources (documents, links, etc.).\n"
+    "- For CSV sources, use analyze_csv_agent when the user asks questions that require calculations/plots from the CSV data.\n"
+    "- For DATABASE sources, use analyze_database_agent when the user asks questions that require LIVE data from the database (counts, metrics, lists, trends).\n"
+    "- For FRESHDESK sources, use analyze_freshdesk_agent when the user asks questions about support ticket data (trends, metrics, SLA, agent performance, etc.).\n"
+    "- For JIRA sources, use jira_list_projects, jira_search_issues, jira_get_issue, jira_get_project for live Jira queries.\n"
+    "- For MIXPANEL sources, use mixpanel_list_events, mixpanel_query_events, mixpanel_segmentation, mixpanel_list_funnels, mixpanel_query_funnel, mixpanel_retention, mixpanel_events_after (cohort path analysis: 'what do users do after X') for live analytics queries.\n"
+    "\n"
+)
+_SOURCE_FOOTER = "When answering, pick the correct tool based on the source type (search_sources vs analyze_csv_agent vs analyze_database_agent vs analyze_freshdesk_agent).\n"
+
+# One source entry in the source context; optional lines follow it
+_SOURCE_ENTRY = "- **{name}**\n  - ID: `{id}`\n  - Type: {type}\n  - Embedded: {embedded}\n"
+
+# Tool hint line per source extension
+_SOURCE_TOOL_LINES = {
+    ".csv": "  - Chat tool: analyze_csv_agent (for calculations/plots)\n",
+    ".database": "  - Chat tool: analyze_database_agent (for live SQL queries)\n",
+    ".freshdesk": "  - Chat tool: analyze_freshdesk_agent (for ticket analytics)\n",
+    ".jira": "  - Chat tools: jira_list_projects, jira_search_issues, jira_get_issue, jira_get_project (live API)\n",
+    ".mixpanel": "  - Chat tools: mixpanel_list_events, mixpanel_query_events, mixpanel_segmentation, mixpanel_list_funnels, mixpanel_query_funnel, mixpanel_retention, mixpanel_events_after — use mixpanel_events_after for 'what do users do after X' / cohort path analysis questions (live Query API)\n",
+    ".mcp": "  - Chat tool: search_sources (RAG search over MCP resources)\n",
+}
+
+# Common extensions mapped to readable names for the source context
+_EXT_MAP = {
+    ".pdf": "PDF Document",
+    ".docx": "Word Document",
+    ".doc": "Word Document",
+    ".txt": "Text File",
+    ".pptx": "PowerPoint",
+    ".ppt": "PowerPoint",
+    ".mp3": "Audio (MP3)",
+    ".wav": "Audio (WAV)",
+    ".m4a": "Audio (M4A)",
+    ".png": "Image (PNG)",
+    ".jpg": "Image (JPEG)",
+    ".jpeg": "Image (JPEG)",
+    ".webp": "Image (WebP)",
+    ".link": "Web Link",
+    ".csv": "CSV Spreadsheet",
+    ".research": "Research Document",
+    ".database": "Database (Postgres/MySQL)",
+    ".freshdesk": "Freshdesk Tickets",
+    ".jira": "Jira Projects",
+    ".mcp": "MCP Server Resources",
+}
+
+# Fallback when the extension is unknown
+_CATEGORY_MAP = {
+    "document": "Document",
+    "image": "Image",
+    "audio": "Audio",
+    "link": "Web Content",
+    "video": "Video",
+}
+
+
 class ContextLoader:
     """
     Loader for building source and memory context for chat prompts.
@@ -28,6 +106,22 @@ class ContextLoader:
     - Project memory (specific to current project)
     """
 
+    def __init__(self):
+        """Initialize the context loader."""
+        self._memory_service = None
+
+    def _get_memory_service(self):
+        """
+        Resolve memory_service on first use and keep the reference.
+
+        Lazy to avoid the circular import
+        memory_service -> app.config -> context_loader -> memory_service.
+        """
+        if self._memory_service is None:
+            from app.services.ai_services.memory_service import memory_service
+            self._memory_service = memory_service
+        return self._memory_service
+
     def get_active_sources(
         self,
         project_id: str,
@@ -52,28 +146,22 @@ class ContextLoader:
             List of source metadata dicts for selected/ready sources
         """
         # Projected query: only the columns the source context needs (skips the
-        # heavy processing_info JSONB shipped on every message otherwise).
-        all_sources = source_service.list_sources_for_context(project_id)
-
+        # heavy processing_info JSONB shipped on every message otherwise), with
+        # the status / selection filters applied by the database.
         if selected_source_ids is None:
             # Legacy chat (column is NULL) — fall back to global active flag
-            return [
-                source for source in all_sources
-                if source.get("status") == "ready" and source.get("active", False)
-            ]
+            return source_service.list_sources_for_context(
+                project_id, ready_only=True, active_only=True
+            )
 
         if not selected_source_ids:
             # Explicitly empty selection
             return []
 
-        # Filter to selected sources that are ready
-        selected_set = set(selected_source_ids)
-        active_sources = [
-            source for source in all_sources
-            if source.get("id") in selected_set and source.get("status") == "ready"
-        ]
-
-        return active_sources
+        # Selected sources that are ready
+        return source_service.list_sources_for_context(
+            project_id, source_ids=selected_source_ids, ready_only=True
+        )
 
     def build_source_context(
         self,
@@ -104,21 +192,11 @@ class ContextLoader:
         if not active_sources:
             return ""
 
-        # Build the context block
-        lines = [
-            "",
-            "## Available Sources",
-            "",
-            "You have access to the following sources.",
-            "",
-            "- Use the search_sources tool to retrieve information from embedded sources (documents, links, etc.).",
-            "- For CSV sources, use analyze_csv_agent when the user asks questions that require calculations/plots from the CSV data.",
-            "- For DATABASE sources, use analyze_database_agent when the user asks questions that require LIVE data from the database (counts, metrics, lists, trends).",
-            "- For FRESHDESK sources, use analyze_freshdesk_agent when the user asks questions about support ticket data (trends, metrics, SLA, agent performance, etc.).",
-            "- For JIRA sources, use jira_list_projects, jira_search_issues, jira_get_issue, jira_get_project for live Jira queries.",
-            "- For MIXPANEL sources, use mixpanel_list_events, mixpanel_query_events, mixpanel_segmentation, mixpanel_list_funnels, mixpanel_query_funnel, mixpanel_retention, mixpanel_events_after (cohort path analysis: 'what do users do after X') for live analytics queries.",
-            "",
-        ]
+        # Build the context block. The per-source loop writes straight into a
+        # buffer between the static header and footer.
+        buf = io.StringIO()
+        write = buf.write
+        write(_SOURCE_HEADER)
 
         for source in active_sources:
             source_id = source.get("id", "")
@@ -138,32 +216,22 @@ class ContextLoader:
             # Format source type from type field and extension
             source_type = self._format_source_type(source_type_field.lower(), file_ext)
 
-            lines.append(f"- **{name}**")
-            lines.append(f"  - ID: `{source_id}`")
-            lines.append(f"  - Type: {source_type}")
-            lines.append(f"  - Embedded: {embedded_label}")
-            if file_ext == ".csv":
-                lines.append("  - Chat tool: analyze_csv_agent (for calculations/plots)")
-            if file_ext == ".database":
-                lines.append("  - Chat tool: analyze_database_agent (for live SQL queries)")
-            if file_ext == ".freshdesk":
-                lines.append("  - Chat tool: analyze_freshdesk_agent (for ticket analytics)")
-            if file_ext == ".jira":
-                lines.append("  - Chat tools: jira_list_projects, jira_search_issues, jira_get_issue, jira_get_project (live API)")
-            if file_ext == ".mixpanel":
-                lines.append("  - Chat tools: mixpanel_list_events, mixpanel_query_events, mixpanel_segmentation, mixpanel_list_funnels, mixpanel_query_funnel, mixpanel_retention, mixpanel_events_after — use mixpanel_events_after for 'what do users do after X' / cohort path analysis questions (live Query API)")
-            if file_ext == ".mcp":
-                lines.append("  - Chat tool: search_sources (RAG search over MCP resources)")
+            write(_SOURCE_ENTRY.format(
+                name=name, id=source_id, type=source_type, embedded=embedded_label,
+            ))
+            tool_line = _SOURCE_TOOL_LINES.get(file_ext)
+            if tool_line:
+                write(tool_line)
             if summary_text:
-                lines.append(f"  - Summary: {summary_text}")
-            lines.append("")
+                write(f"  - Summary: {summary_text}\n")
+            write("\n")
 
-        lines.append("When answering, pick the correct tool based on the source type (search_sources vs analyze_csv_agent vs analyze_database_agent vs analyze_freshdesk_agent).")
-        lines.append("")
+        write(_SOURCE_FOOTER)
 
-        return "\n".join(lines)
+        return buf.getvalue()
 
-    def _format_source_type(self, category: str, file_ext: str) -> str:
+    @staticmethod
+    def _format_source_type(category: str, file_ext: str) -> str:
         """
         Format a human-readable source type from category and extension.
 
@@ -174,43 +242,7 @@ class ContextLoader:
         Returns:
             Human-readable type string
         """
-        # Map common extensions to readable names
-        ext_map = {
-            ".pdf": "PDF Document",
-            ".docx": "Word Document",
-            ".doc": "Word Document",
-            ".txt": "Text File",
-            ".pptx": "PowerPoint",
-            ".ppt": "PowerPoint",
-            ".mp3": "Audio (MP3)",
-            ".wav": "Audio (WAV)",
-            ".m4a": "Audio (M4A)",
-            ".png": "Image (PNG)",
-            ".jpg": "Image (JPEG)",
-            ".jpeg": "Image (JPEG)",
-            ".webp": "Image (WebP)",
-            ".link": "Web Link",
-            ".csv": "CSV Spreadsheet",
-            ".research": "Research Document",
-            ".database": "Database (Postgres/MySQL)",
-            ".freshdesk": "Freshdesk Tickets",
-            ".jira": "Jira Projects",
-            ".mcp": "MCP Server Resources",
-        }
-
-        if file_ext in ext_map:
-            return ext_map[file_ext]
-
-        # Fallback to category
-        category_map = {
-            "document": "Document",
-            "image": "Image",
-            "audio": "Audio",
-            "link": "Web Content",
-            "video": "Video",
-        }
-
-        return category_map.get(category, category.title())
+        return _EXT_MAP.get(file_ext) or _CATEGORY_MAP.get(category) or category.title()
 
     def build_memory_context(self, project_id: str, user_id: Optional[str] = None) -> str:
         """
@@ -228,16 +260,14 @@ class ContextLoader:
         Returns:
             Formatted string to append to system prompt, or empty string if no memory
         """
-        # Lazy import to avoid circular imports:
-        # memory_service -> app.config -> context_loader -> memory_service
-        from app.services.ai_services.memory_service import memory_service
-
-        user_memory = memory_service.get_user_memory(user_id=user_id) if user_id else memory_service.get_user_memory()
-        project_memory = (
-            memory_service.get_project_memory(project_id, user_id=user_id)
+        memory_service = self._get_memory_service()
+        memories = (
+            memory_service.get_memories(project_id, user_id=user_id)
             if user_id
-            else memory_service.get_project_memory(project_id)
+            else memory_service.get_memories(project_id)
         )
+        user_memory = memories.get("user")
+        project_memory = memories.get("project")
 
         # Return empty if no memory exists
         if not user_memory and not project_memory:
@@ -321,26 +351,24 @@ class ContextLoader:
         Returns:
             Complete context string to append to system prompt
         """
-        parts = []
+        # Memory and MCP lookups run on the pool while the source context is
+        # built here, so the turn waits for the slowest query, not the sum.
+        memory_future = _submit(self.build_memory_context, project_id, user_id=user_id)
+        mcp_future = _submit(self.build_mcp_tools_context, user_id=user_id) if user_id else None
 
-        # Add memory context first (general personalization)
-        memory_context = self.build_memory_context(project_id, user_id=user_id)
-        if memory_context:
-            parts.append(memory_context)
-
-        # Add source context (available tools)
         source_context = self.build_source_context(
             project_id, selected_source_ids=selected_source_ids, active_sources=active_sources
         )
-        if source_context:
-            parts.append(source_context)
-
-        # Add MCP tools context (external integrations)
-        mcp_context = self.build_mcp_tools_context(user_id=user_id)
-        if mcp_context:
-            parts.append(mcp_context)
 
-        return "\n".join(parts)
+        parts = [
+            # Memory context first (general personalization)
+            memory_future.result(),
+            # Then source context (available tools)
+            source_context,
+            # Then MCP tools context (external integrations)
+            mcp_future.result() if mcp_future else "",
+        ]
+        return "\n".join(part for part in parts if part)
 
 
 # Singleton instance
@@ -7,9 +7,11 @@ Orchestrates the component generation workflow:
 """
 
 import base64
+import contextvars
 import logging
 import uuid
-from typing import Dict, Any, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 from pathlib import Path
 
@@ -26,6 +28,20 @@ from app.services.tool_executors.component_tool_executor import component_tool_e
 
 logger = logging.getLogger(__name__)
 
+# Brand color key -> CSS custom property, in brand-instruction order
+_BRAND_COLOR_VARS = (
+    ("primary", "primary-color"),
+    ("accent", "accent-color"),
+    ("secondary", "secondary-color"),
+    ("background", "bg-color"),
+    ("text", "text-color"),
+)
+
+_BRAND_LOGO_LINE = (
+    '- Logo: Include <img src="BRAND_LOGO" alt="Logo" '
+    'style="max-height:48px;width:auto;"> in the component header\n'
+)
+
 
 class ComponentAgentService:
     """Component generation agent - orchestration only."""
@@ -85,7 +101,8 @@ class ComponentAgentService:
 
     def _load_tools(self) -> List[Dict[str, Any]]:
         if self._tools is None:
-            self._tools = tool_loader.load_tools_for_agent(self.AGENT_NAME)
+            tools_config = tool_loader.load_tools_for_agent(self.AGENT_NAME)
+            self._tools = tools_config["all_tools"]
         return self._tools
 
     def _prepare_brand_logo(
@@ -106,15 +123,13 @@ class ComponentAgentService:
         """
         try:
             if not user_id:
-                project = project_service.get_project(project_id)
-                if not project:
-                    return None
-                user_id = project.get("user_id")
+                user_id = project_service.get_project_owner_id(project_id)
             if not user_id:
                 return None
 
-            # Get primary logo asset metadata
-            logo_asset = brand_asset_service.get_primary_asset(user_id, "logo")
+            # Primary logo metadata, from the asset list load_brand_context
+            # just cached
+            logo_asset = brand_asset_service.get_primary_asset_cached(user_id, "logo")
             if not logo_asset:
                 return None
 
@@ -145,6 +160,66 @@ class ComponentAgentService:
             logger.exception("Error preparing brand logo")
             return None
 
+    def _load_brand(
+        self,
+        project_id: str,
+        job_id: str,
+        user_id: Optional[str] = None,
+    ) -> Tuple[str, Optional[Dict[str, str]], Optional[Dict[str, Any]]]:
+        """
+        Load brand context, logo and config for the ads_creative feature.
+
+        The owning user is resolved once, up front, and shared by the brand
+        context, the logo and the config reads. The logo metadata and the
+        config come from the prompt-side caches that load_brand_context has
+        just filled, so after that the only round trip is the logo download.
+
+        Returns:
+            (brand_context, logo_info, brand_config); ("", None, None) when
+            brand is off for this feature
+        """
+        if not user_id:
+            user_id = project_service.get_project_owner_id(project_id)
+        if not user_id:
+            return "", None, None
+
+        brand_context = brand_context_loader.load_brand_context(
+            project_id, "ads_creative", user_id=user_id
+        )
+        if not brand_context:
+            return "", None, None
+
+        # Download brand logo so it can be embedded in the component HTML
+        logo_info = self._prepare_brand_logo(project_id, job_id, user_id=user_id)
+        brand_config = brand_config_service.get_config_cached(user_id) or {}
+        return brand_context, logo_info, brand_config
+
+    @staticmethod
+    def _build_brand_instruction(
+        brand_colors: Dict[str, Any],
+        brand_config: Optional[Dict[str, Any]],
+        logo_info: Optional[Dict[str, str]],
+    ) -> str:
+        """Build the BRAND REQUIREMENTS block appended to the user message."""
+        lines = [
+            "\n\n## BRAND REQUIREMENTS (MANDATORY)\n",
+            "You MUST use these exact colors as CSS custom properties in :root:\n",
+        ]
+        for key, css_var in _BRAND_COLOR_VARS:
+            if brand_colors.get(key):
+                lines.append(f"- --{css_var}: {brand_colors[key]}\n")
+        if brand_config:
+            typography = brand_config.get("typography", {})
+            if typography.get("heading_font"):
+                lines.append(f"- Heading font: {typography['heading_font']}\n")
+            if typography.get("body_font"):
+                lines.append(f"- Body font: {typography['body_font']}\n")
+        if logo_info:
+            lines.append(_BRAND_LOGO_LINE)
+        lines.append("All variations MUST use the same brand colors — vary layout/style, not the color palette.\n")
+        lines.append("Do NOT substitute these with any other colors, fonts, or skip the logo.\n")
+        return "".join(lines)
+
     def generate_components(
         self,
         project_id: str,
@@ -169,10 +244,19 @@ class ComponentAgentService:
             status_message="Starting component generation..."
         )
 
-        # Get source content (optional — can generate from direction alone)
-        source_content = ""
-        if source_id:
-            source_content = get_source_content(project_id, source_id, max_chars=15000)
+        # Get source content (optional — can generate from direction alone).
+        # It's a storage download independent of the brand lookups below, so
+        # it runs in the background while those happen.
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            source_future = (
+                pool.submit(
+                    contextvars.copy_context().run,
+                    get_source_content, project_id, source_id, max_chars=15000,
+                )
+                if source_id else None
+            )
+            brand_context, logo_info, brand_config = self._load_brand(project_id, job_id, user_id)
+            source_content = source_future.result() if source_future else ""
 
         # Build user message from config
         effective_direction = direction if direction else config.get("default_direction", "")
@@ -223,26 +307,13 @@ class ComponentAgentService:
                 f"{system_prompt}"
             )
 
-        # Load brand context if configured for ads_creative feature
-        brand_context = brand_context_loader.load_brand_context(
-            project_id, "ads_creative", user_id=user_id
-        )
-        logo_info = None
+        # Brand context (if configured for ads_creative) was loaded above
         brand_colors = None
-        brand_config = None
         if brand_context:
             system_prompt = f"{system_prompt}\n\n{brand_context}"
-            # Download brand logo so it can be embedded in the component HTML
-            logo_info = self._prepare_brand_logo(project_id, job_id, user_id=user_id)
             # Extract brand colors for plan validation in the tool executor
-            if user_id:
-                brand_config = brand_config_service.get_config(user_id) or {}
+            if brand_config:
                 brand_colors = brand_config.get("colors")
-            else:
-                project = project_service.get_project(project_id)
-                if project and project.get("user_id"):
-                    brand_config = brand_config_service.get_config(project["user_id"]) or {}
-                    brand_colors = brand_config.get("colors")
 
         # Filter brand_colors to only include user-enabled colors.
         # Users can toggle individual colors off in Settings > Design.
@@ -260,34 +331,7 @@ class ComponentAgentService:
         # of long system prompts. By putting exact hex values here mapped to CSS
         # custom properties, the agent is far more likely to use them in the HTML.
         if brand_context and brand_colors:
-            brand_instruction = "\n\n## BRAND REQUIREMENTS (MANDATORY)\n"
-            brand_instruction += "You MUST use these exact colors as CSS custom properties in :root:\n"
-            if brand_colors.get("primary"):
-                brand_instruction += f"- --primary-color: {brand_colors['primary']}\n"
-            if brand_colors.get("accent"):
-                brand_instruction += f"- --accent-color: {brand_colors['accent']}\n"
-            if brand_colors.get("secondary"):
-                brand_instruction += f"- --secondary-color: {brand_colors['secondary']}\n"
-            if brand_colors.get("background"):
-                brand_instruction += f"- --bg-color: {brand_colors['background']}\n"
-            if brand_colors.get("text"):
-                brand_instruction += f"- --text-color: {brand_colors['text']}\n"
-            # Typography
-            if brand_config:
-                typography = brand_config.get("typography", {})
-                if typography.get("heading_font"):
-                    brand_instruction += f"- Heading font: {typography['heading_font']}\n"
-                if typography.get("body_font"):
-                    brand_instruction += f"- Body font: {typography['body_font']}\n"
-            # Logo
-            if logo_info:
-                brand_instruction += (
-                    '- Logo: Include <img src="BRAND_LOGO" alt="Logo" '
-                    'style="max-height:48px;width:auto;"> in the component header\n'
-                )
-            brand_instruction += "All variations MUST use the same brand colors — vary layout/style, not the color palette.\n"
-            brand_instruction += "Do NOT substitute these with any other colors, fonts, or skip the logo.\n"
-            user_message = user_message + brand_instruction
+            user_message += self._build_brand_instruction(brand_colors, brand_config, logo_info)
 
         messages = [{"role": "user", "content": user_message}]
 
@@ -314,10 +358,11 @@ class ComponentAgentService:
                 model=config["model"],
                 max_tokens=config["max_tokens"],
                 temperature=config["temperature"],
-                tools=tools["all_tools"] if isinstance(tools, dict) else tools,
+                tools=tools,
                 tool_choice={"type": "any"},
                 project_id=project_id,
                 enable_prompt_cache=True,
+                limit_concurrency=True,
             )
 
             total_input_tokens += response["usage"]["input_tokens"]
@@ -367,45 +412,42 @@ class ComponentAgentService:
             # Process tool calls
             tool_results = []
 
-            for block in content_blocks:
-                block_type = getattr(block, "type", None) if hasattr(block, "type") else block.get("type")
-
-                if block_type == "tool_use":
-                    tool_name = getattr(block, "name", "") if hasattr(block, "name") else block.get("name", "")
-                    tool_input = getattr(block, "input", {}) if hasattr(block, "input") else block.get("input", {})
-                    tool_id = getattr(block, "id", "") if hasattr(block, "id") else block.get("id", "")
-
-                    # Build execution context
-                    context = {
-                        "project_id": project_id,
-                        "job_id": job_id,
-                        "source_id": source_id,
-                        "logo_info": logo_info,
-                        "brand_colors": brand_colors,
-                        "iterations": iteration,
-                        "input_tokens": total_input_tokens,
-                        "output_tokens": total_output_tokens
-                    }
-
-                    # Execute tool via executor
-                    result, is_termination = component_tool_executor.execute_tool(
-                        tool_name, tool_input, context
-                    )
+            for tool_block in claude_parsing_utils.extract_tool_use_blocks(response):
+                tool_name = tool_block["name"]
+                tool_input = tool_block["input"]
+                tool_id = tool_block["id"]
+
+                # Build execution context
+                context = {
+                    "project_id": project_id,
+                    "job_id": job_id,
+                    "source_id": source_id,
+                    "logo_info": logo_info,
+                    "brand_colors": brand_colors,
+                    "iterations": iteration,
+                    "input_tokens": total_input_tokens,
+                    "output_tokens": total_output_tokens
+                }
 
-                    if is_termination:
-                        logger.info("Completed in %d iterations", iteration)
-                        self._save_execution(
-                            project_id, execution_id, job_id, messages,
-                            result, started_at, source_id
-                        )
-                        return result
-
-                    # Add tool result
-                    tool_results.append({
-                        "type": "tool_result",
-                        "tool_use_id": tool_id,
-                        "content": result.get("message", str(result))
-                    })
+                # Execute tool via executor
+                result, is_termination = component_tool_executor.execute_tool(
+                    tool_name, tool_input, context
+                )
+
+                if is_termination:
+                    logger.info("Completed in %d iterations", iteration)
+                    self._save_execution(
+                        project_id, execution_id, job_id, messages,
+                        result, started_at, source_id
+                    )
+                    return result
+
+                # Add tool result
+                tool_results.append({
+                    "type": "tool_result",
+                    "tool_use_id": tool_id,
+                    "content": result.get("message", str(result))
+                })
 
             if tool_results:
                 messages.append({"role": "user", "content": tool_results})
@@ -10,12 +10,16 @@ It uses tool-calling to:
 
 from __future__ import annotations
 
+import contextvars
 import json
 import logging
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+import orjson
 
 from app.services.integrations.claude import claude_service
 from app.config import prompt_loader, tool_loader
@@ -25,6 +29,14 @@ from app.utils import claude_parsing_utils
 
 logger = logging.getLogger(__name__)
 
+# Sent back instead of re-running a tool call the agent already made this run.
+# The tools are read-only, so an identical call can't return anything new.
+_REPEATED_CALL_NOTE = (
+    "This exact call was already made earlier in this analysis and its result "
+    "is above. Use that result, try a different query, or call "
+    "return_database_result if you have enough to answer."
+)
+
 
 class DatabaseAnalyzerAgent(AnalyzerAgentBase):
     """
@@ -51,6 +63,9 @@ class DatabaseAnalyzerAgent(AnalyzerAgentBase):
         return self._tools or []
 
     _RESULT_PREVIEW_CHARS = 500
+    # Cap on tool calls from one turn run at the same time (each holds its
+    # own connection to the user's database).
+    _MAX_PARALLEL_TOOLS = 4
 
     @staticmethod
     def _emit_progress(
@@ -156,6 +171,9 @@ class DatabaseAnalyzerAgent(AnalyzerAgentBase):
         executed_queries: List[str] = []
 
         executor = DatabaseExecutor()
+        # One executor (and so one DB connection) per concurrent tool call;
+        # index 0 is the pre-flight executor. Grown on demand.
+        executors: List[DatabaseExecutor] = [executor]
 
         # Pre-flight check: verify the database connection is resolvable
         # BEFORE entering the expensive agent loop. This prevents wasting
@@ -196,6 +214,12 @@ class DatabaseAnalyzerAgent(AnalyzerAgentBase):
         consecutive_errors = 0
         MAX_CONSECUTIVE_ERRORS = 3
 
+        # (tool name, input) of every call made so far. Turns made up only of
+        # repeats mean the agent is going in circles; stop after a couple.
+        seen_tool_calls: Set[Tuple[str, bytes]] = set()
+        consecutive_repeat_turns = 0
+        MAX_REPEAT_TURNS = 2
+
         self._emit_progress(on_event, "Connecting to database…")
 
         try:
@@ -228,6 +252,7 @@ class DatabaseAnalyzerAgent(AnalyzerAgentBase):
                     chat_id=chat_id,
                     user_id=user_id,
                     enable_prompt_cache=True,
+                    limit_concurrency=True,
                 )
 
                 total_input_tokens += response["usage"]["input_tokens"]
@@ -248,24 +273,42 @@ class DatabaseAnalyzerAgent(AnalyzerAgentBase):
                 tool_results_data = []
                 iteration_had_error = False
 
-                for tool_block in tool_blocks:
-                    tool_name = tool_block.get("name")
-                    tool_input = tool_block.get("input", {}) or {}
-                    tool_id = tool_block.get("id")
+                # Nothing after the termination call runs, same as the old
+                # one-at-a-time loop.
+                runnable = tool_blocks
+                for idx, tool_block in enumerate(tool_blocks):
+                    if tool_block.get("name") == self.TERMINATION_TOOL:
+                        runnable = tool_blocks[: idx + 1]
+                        break
 
-                    inner_t0 = time.monotonic()
+                for tool_block in runnable:
+                    tool_input = tool_block.get("input", {}) or {}
                     self._emit_tool_event(
                         on_event,
                         "start",
-                        tool_id=tool_id,
-                        name=tool_name,
+                        tool_id=tool_block.get("id"),
+                        name=tool_block.get("name"),
                         parent_tool_id=parent_tool_id,
                         input=tool_input if isinstance(tool_input, dict) else None,
                     )
 
-                    result, is_termination = executor.execute_tool(
-                        tool_name, tool_input, project_id, source_id
-                    )
+                repeated = self._find_repeated_calls(runnable, seen_tool_calls)
+                fresh_outcomes = iter(self._execute_tool_blocks(
+                    executors,
+                    [block for idx, block in enumerate(runnable) if idx not in repeated],
+                    project_id,
+                    source_id,
+                ))
+                outcomes = [
+                    ({"success": True, "repeated": True, "note": _REPEATED_CALL_NOTE}, False, 0)
+                    if idx in repeated else next(fresh_outcomes)
+                    for idx in range(len(runnable))
+                ]
+
+                for tool_block, (result, is_termination, duration_ms) in zip(runnable, outcomes):
+                    tool_name = tool_block.get("name")
+                    tool_input = tool_block.get("input", {}) or {}
+                    tool_id = tool_block.get("id")
 
                     preview: Optional[str] = None
                     if isinstance(result, dict):
@@ -290,11 +333,15 @@ class DatabaseAnalyzerAgent(AnalyzerAgentBase):
                         name=tool_name,
                         parent_tool_id=parent_tool_id,
                         result_preview=preview,
-                        duration_ms=int((time.monotonic() - inner_t0) * 1000),
+                        duration_ms=duration_ms,
                         is_error=isinstance(result, dict) and not result.get("success", True),
                     )
 
-                    if tool_name == "query_runner" and isinstance(tool_input.get("query"), str):
+                    if (
+                        tool_name == "query_runner"
+                        and isinstance(tool_input.get("query"), str)
+                        and not (isinstance(result, dict) and result.get("repeated"))
+                    ):
                         executed_queries.append(tool_input["query"])
 
                     # Track errors for early bail-out
@@ -366,6 +413,35 @@ class DatabaseAnalyzerAgent(AnalyzerAgentBase):
                 else:
                     consecutive_errors = 0
 
+                if len(repeated) == len(runnable):
+                    consecutive_repeat_turns += 1
+                    if consecutive_repeat_turns >= MAX_REPEAT_TURNS:
+                        logger.warning(
+                            "DB agent: %d turns of repeated tool calls, bailing out early "
+                            "(source_id=%s, iteration=%d)",
+                            consecutive_repeat_turns, source_id, iteration,
+                        )
+                        error_result = {
+                            "success": False,
+                            "error": (
+                                "Database analysis stopped: the same queries kept being "
+                                "re-run without reaching an answer."
+                            ),
+                            "usage": {"input_tokens": total_input_tokens, "output_tokens": total_output_tokens},
+                        }
+                        self._save_execution(
+                            project_id=project_id,
+                            execution_id=execution_id,
+                            query=query,
+                            messages=messages,
+                            result=error_result,
+                            started_at=started_at,
+                            source_id=source_id,
+                        )
+                        return error_result
+                else:
+                    consecutive_repeat_turns = 0
+
             error_result = {
                 "success": False,
                 "error": f"Analysis did not complete within {self.MAX_ITERATIONS} iterations",
@@ -383,15 +459,96 @@ class DatabaseAnalyzerAgent(AnalyzerAgentBase):
             return error_result
 
         finally:
-            executor.close_connections()
+            # Back to the shared idle pool so the next question on this
+            # source skips the connect handshake
+            for tool_executor in executors:
+                tool_executor.release_connections()
+
+    def _find_repeated_calls(
+        self,
+        tool_blocks: List[Dict[str, Any]],
+        seen: Set[Tuple[str, bytes]],
+    ) -> Set[int]:
+        """Indexes of blocks whose exact (name, input) already ran; records the rest in ``seen``."""
+        repeated: Set[int] = set()
+        for idx, block in enumerate(tool_blocks):
+            name = block.get("name")
+            if name == self.TERMINATION_TOOL:
+                continue
+            signature = (
+                name,
+                orjson.dumps(block.get("input") or {}, option=orjson.OPT_SORT_KEYS, default=str),
+            )
+            if signature in seen:
+                repeated.add(idx)
+            else:
+                seen.add(signature)
+        return repeated
+
+    @staticmethod
+    def _run_tool_block(
+        executor: DatabaseExecutor,
+        tool_block: Dict[str, Any],
+        project_id: str,
+        source_id: str,
+    ) -> Tuple[Dict[str, Any], bool, int]:
+        """Execute one tool_use block; returns (result, is_termination, duration_ms)."""
+        t0 = time.monotonic()
+        result, is_termination = executor.execute_tool(
+            tool_block.get("name"), tool_block.get("input", {}) or {}, project_id, source_id
+        )
+        return result, is_termination, int((time.monotonic() - t0) * 1000)
+
+    def _execute_tool_blocks(
+        self,
+        executors: List[DatabaseExecutor],
+        tool_blocks: List[Dict[str, Any]],
+        project_id: str,
+        source_id: str,
+    ) -> List[Tuple[Dict[str, Any], bool, int]]:
+        """
+        Execute the tool calls of one assistant turn, concurrently when
+        there are several.
+
+        Claude often asks for a few independent schema lookups or queries
+        in one turn. Each concurrent call gets its own executor because a DB
+        connection can't run two statements at once (pymysql connections
+        aren't thread-safe at all). Results come back in block order.
+        """
+        if len(tool_blocks) <= 1:
+            return [
+                self._run_tool_block(executors[0], block, project_id, source_id)
+                for block in tool_blocks
+            ]
+
+        workers = min(len(tool_blocks), self._MAX_PARALLEL_TOOLS)
+        while len(executors) < workers:
+            executors.append(DatabaseExecutor())
+
+        outcomes: List[Tuple[Dict[str, Any], bool, int]] = []
+        for start in range(0, len(tool_blocks), workers):
+            batch = tool_blocks[start:start + workers]
+            with ThreadPoolExecutor(max_workers=len(batch)) as pool:
+                # copy_context keeps req_id log stamping in the workers
+                futures = [
+                    pool.submit(
+                        contextvars.copy_context().run,
+                        self._run_tool_block, tool_executor, block, project_id, source_id,
+                    )
+                    for tool_executor, block in zip(executors, batch)
+                ]
+                outcomes.extend(future.result() for future in futures)
+        return outcomes
 
     @staticmethod
     def _format_tool_result(result: Dict[str, Any]) -> str:
         if not result.get("success"):
             return f"Error: {result.get('error', 'Unknown error')}"
 
+        # Compact: indentation only costs the model tokens on the next turn.
+        # default=str covers Decimal and other driver types in query rows.
         try:
-            return json.dumps(result, indent=2, ensure_ascii=False)
+            return orjson.dumps(result, option=orjson.OPT_NON_STR_KEYS, default=str).decode("utf-8")
         except Exception:
             return str(result)
 
@@ -40,7 +40,8 @@ class MarketingStrategyAgentService:
 
     def _load_tools(self) -> List[Dict[str, Any]]:
         if self._tools is None:
-            self._tools = tool_loader.load_tools_for_agent(self.AGENT_NAME)
+            tools_config = tool_loader.load_tools_for_agent(self.AGENT_NAME)
+            self._tools = tools_config["all_tools"]
         return self._tools
 
     def generate_marketing_strategy(
@@ -122,7 +123,7 @@ class MarketingStrategyAgentService:
                 model=config["model"],
                 max_tokens=config["max_tokens"],
                 temperature=config["temperature"],
-                tools=tools["all_tools"] if isinstance(tools, dict) else tools,
+                tools=tools,
                 tool_choice={"type": "any"},
                 project_id=project_id,
                 enable_prompt_cache=True,
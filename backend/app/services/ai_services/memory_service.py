@@ -97,6 +97,27 @@ class MemoryService:
             logger.exception("Error reading project memory")
             return None
 
+    def get_memories(
+        self,
+        project_id: str,
+        user_id: str = DEFAULT_USER_ID,
+    ) -> Dict[str, Optional[str]]:
+        """
+        Get user and project memory together (one Supabase round-trip).
+
+        Args:
+            project_id: The project UUID
+
+        Returns:
+            {"user": ..., "project": ...}; a value is None when that memory
+            doesn't exist or couldn't be read
+        """
+        try:
+            return project_service.get_memories(project_id, user_id=user_id)
+        except Exception:
+            logger.exception("Error reading memories")
+            return {"user": None, "project": None}
+
     def _save_user_memory(
         self,
         memory: str,
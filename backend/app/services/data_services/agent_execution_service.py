@@ -11,10 +11,15 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+import orjson
+
 from app.utils.path_utils import get_web_agent_dir, get_agents_dir
 
 logger = logging.getLogger(__name__)
 
+# Indented so the logs stay readable when opened by hand
+_DUMPS_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
 
 class AgentExecutionService:
     """Read/write agent execution logs on the local filesystem."""
@@ -61,9 +66,10 @@ class AgentExecutionService:
                 for key, value in metadata.items():
                     execution_log.setdefault(key, value)
 
+            # orjson writes UTF-8 bytes directly; a long DB-agent run carries
+            # every tool call and result, and stdlib json is the slow part.
             log_file = agent_dir / f"{execution_id}.json"
-            with open(log_file, "w", encoding="utf-8") as f:
-                json.dump(execution_log, f, indent=2, ensure_ascii=False)
+            log_file.write_bytes(orjson.dumps(execution_log, option=_DUMPS_OPTIONS, default=str))
 
             return execution_id
 
@@ -5,12 +5,22 @@ Brand assets (logos, icons, fonts, images) are stored
 at the workspace (user) level and used by studio agents to maintain
 consistent branding across all projects' generated content.
 """
+import threading
 import uuid
 from typing import Optional, Dict, List, Any
 
+from cachetools import TTLCache
+
 from app.services.integrations.supabase import storage_service
 from app.services.data_services.base_service import SupabaseService
 
+# Per-user asset lists for prompt building. Brand context is assembled on
+# every chat message and studio run; a short TTL keeps that off the DB
+# while bounding how long another worker can serve a stale list.
+_PROMPT_ASSETS_TTL_SECONDS = 60
+_prompt_assets_cache: TTLCache = TTLCache(maxsize=1024, ttl=_PROMPT_ASSETS_TTL_SECONDS)
+_prompt_assets_lock = threading.Lock()
+
 
 class BrandAssetService(SupabaseService):
     """
@@ -47,6 +57,28 @@ class BrandAssetService(SupabaseService):
         )
         return response.data or []
 
+    def list_assets_cached(self, user_id: str) -> List[Dict[str, Any]]:
+        """
+        list_assets() behind a short per-user TTL cache.
+
+        For prompt building only — the brand settings UI keeps using
+        list_assets() so a fresh upload shows up immediately. Writes through
+        this service drop the cached list; the returned list is shared and
+        must not be mutated.
+        """
+        with _prompt_assets_lock:
+            assets = _prompt_assets_cache.get(user_id)
+        if assets is None:
+            assets = self.list_assets(user_id)
+            with _prompt_assets_lock:
+                _prompt_assets_cache[user_id] = assets
+        return assets
+
+    def _invalidate_cached_assets(self, user_id: str) -> None:
+        """Drop the cached prompt asset list after a write."""
+        with _prompt_assets_lock:
+            _prompt_assets_cache.pop(user_id, None)
+
     def list_assets_by_type(
         self,
         user_id: str,
@@ -130,6 +162,23 @@ class BrandAssetService(SupabaseService):
 
         return response.data[0]
 
+    def get_primary_asset_cached(
+        self,
+        user_id: str,
+        asset_type: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        get_primary_asset() answered from list_assets_cached().
+
+        Studio agents call this right after load_brand_context has filled
+        the cache, so the logo lookup costs no extra query. The returned
+        dict is shared and must not be mutated.
+        """
+        for asset in self.list_assets_cached(user_id):
+            if asset.get("asset_type") == asset_type and asset.get("is_primary"):
+                return asset
+        return None
+
     def create_asset(
         self,
         user_id: str,
@@ -207,6 +256,7 @@ class BrandAssetService(SupabaseService):
             storage_service.delete_brand_asset(user_id, asset_id, file_name)
             raise RuntimeError("Failed to create brand asset record")
 
+        self._invalidate_cached_assets(user_id)
         return response.data[0]
 
     def update_asset(
@@ -262,6 +312,7 @@ class BrandAssetService(SupabaseService):
             .eq("user_id", user_id)
             .execute()
         )
+        self._invalidate_cached_assets(user_id)
 
         if response.data:
             return response.data[0]
@@ -293,6 +344,7 @@ class BrandAssetService(SupabaseService):
 
         # Delete database record
         self.supabase.table(self.table).delete().eq("id", asset_id).eq("user_id", user_id).execute()
+        self._invalidate_cached_assets(user_id)
 
         return True
 
@@ -325,6 +377,7 @@ class BrandAssetService(SupabaseService):
         self.supabase.table(self.table).update({
             "is_primary": True
         }).eq("id", asset_id).eq("user_id", user_id).execute()
+        self._invalidate_cached_assets(user_id)
 
         return True
 
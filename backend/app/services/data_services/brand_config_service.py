@@ -9,8 +9,11 @@ The config is created on first access with sensible defaults and can be
 updated incrementally (e.g., update just colors without touching typography).
 """
 import logging
+import threading
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
+
+from cachetools import TTLCache
 
 from app.services.data_services.base_service import SupabaseService
 
@@ -90,6 +93,21 @@ DEFAULT_FEATURE_SETTINGS = {
 }
 
 
+# user_id -> config row for prompt building (see get_config_cached). Feature
+# toggles are read from the same cached row, so there is one TTL for both.
+# Writes through this service drop the user's entry in this worker only;
+# other workers pick up the change when their entry expires.
+_PROMPT_CONFIG_TTL_SECONDS = 30
+_prompt_config_cache: TTLCache = TTLCache(maxsize=1024, ttl=_PROMPT_CONFIG_TTL_SECONDS)
+_prompt_config_lock = threading.Lock()
+
+
+def _invalidate_feature_cache(user_id: str) -> None:
+    """Drop the cached config (and so the feature toggles) for a user after it changes."""
+    with _prompt_config_lock:
+        _prompt_config_cache.pop(user_id, None)
+
+
 class BrandConfigService(SupabaseService):
     """
     Service class for managing brand configuration using Supabase.
@@ -129,6 +147,23 @@ class BrandConfigService(SupabaseService):
         # Create default config if none exists
         return self._create_default_config(user_id)
 
+    def get_config_cached(self, user_id: str) -> Dict[str, Any]:
+        """
+        get_config() behind a short per-user TTL cache.
+
+        For prompt building only — every chat message and studio run reads
+        the config, while the settings UI keeps using get_config() so it
+        always shows the stored row. Writes through this service drop the
+        cached entry; the returned dict is shared and must not be mutated.
+        """
+        with _prompt_config_lock:
+            config = _prompt_config_cache.get(user_id)
+        if config is None:
+            config = self.get_config(user_id)
+            with _prompt_config_lock:
+                _prompt_config_cache[user_id] = config
+        return config
+
     def update_config(
         self,
         user_id: str,
@@ -193,6 +228,7 @@ class BrandConfigService(SupabaseService):
             .eq("user_id", user_id)
             .execute()
         )
+        _invalidate_feature_cache(user_id)
 
         if response.data:
             return response.data[0]
@@ -344,6 +380,9 @@ class BrandConfigService(SupabaseService):
         """
         Check if brand should be applied for a specific feature.
 
+        Reads the toggle from get_config_cached(), so repeated checks
+        share one config read per TTL window.
+
         Args:
             user_id: The user UUID
             feature_name: The studio feature name (e.g., 'blog', 'presentation')
@@ -351,16 +390,44 @@ class BrandConfigService(SupabaseService):
         Returns:
             True if brand should be applied for this feature
         """
-        config = self.get_config(user_id)
+        return self._feature_enabled_in(self.get_config_cached(user_id), user_id, feature_name)
+
+    def get_config_with_feature_flag(
+        self,
+        user_id: str,
+        feature_name: str
+    ) -> Tuple[Dict[str, Any], bool]:
+        """
+        Prompt-side config plus whether brand applies to a feature.
+
+        One (cached) config read answers both questions, instead of
+        is_feature_enabled() followed by a separate config fetch.
+
+        Args:
+            user_id: The user UUID
+            feature_name: The studio feature name (e.g., 'blog', 'presentation')
+
+        Returns:
+            (config, enabled)
+        """
+        config = self.get_config_cached(user_id)
+        return config, self._feature_enabled_in(config, user_id, feature_name)
+
+    @staticmethod
+    def _feature_enabled_in(config: Dict[str, Any], user_id: str, feature_name: str) -> bool:
+        """Read a feature toggle from a config row, falling back to defaults."""
         stored = config.get("feature_settings") or {}
         # Merge with defaults so newly added features (e.g. "chat") inherit
         # their default value for users whose config predates the feature.
-        feature_settings = {**DEFAULT_FEATURE_SETTINGS, **stored}
-        enabled = feature_settings.get(feature_name, False)
-        if feature_name not in stored:
-            logger.info("Brand feature '%s' missing from stored settings for user %s, using default: %s",
-                        feature_name, user_id[:8], enabled)
-        logger.debug("Brand feature check: %s=%s (user=%s)", feature_name, enabled, user_id[:8])
+        if feature_name in stored:
+            enabled = stored[feature_name]
+        else:
+            enabled = DEFAULT_FEATURE_SETTINGS.get(feature_name, False)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Brand feature '%s' missing from stored settings for user %s, using default: %s",
+                            feature_name, user_id[:8], enabled)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Brand feature check: %s=%s (user=%s)", feature_name, enabled, user_id[:8])
         return enabled
 
     def delete_config(self, user_id: str) -> bool:
@@ -379,6 +446,7 @@ class BrandConfigService(SupabaseService):
             .eq("user_id", user_id)
             .execute()
         )
+        _invalidate_feature_cache(user_id)
 
         # Check if any rows were deleted
         return bool(response.data)
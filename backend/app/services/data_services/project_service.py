@@ -503,6 +503,42 @@ class ProjectService(SupabaseService):
         memory_data = response.data[0].get("memory", {})
         return memory_data.get("memory") if memory_data else None
 
+    def get_memories(self, project_id: str, user_id: Optional[str] = None) -> Dict[str, Optional[str]]:
+        """
+        Get the user's global memory and the project's memory in one query.
+
+        The chat prompt needs both on every message. The owning user row is
+        embedded into the project select (projects.user_id -> users.id), so
+        this is one round-trip instead of two. If the project isn't found
+        for this user, user memory is still read on its own.
+
+        Args:
+            project_id: The project UUID
+            user_id: The user's UUID (falls back to DEFAULT_USER_ID)
+
+        Returns:
+            {"user": user memory or None, "project": project memory or None}
+        """
+        uid = _resolve_user_id(user_id)
+        response = (
+            self.supabase.table(self.table)
+            .select("memory, owner:users!user_id(memory)")
+            .eq("id", project_id)
+            .eq("user_id", uid)
+            .execute()
+        )
+
+        if not response.data:
+            return {"user": self.get_user_memory(user_id=uid), "project": None}
+
+        row = response.data[0]
+        project_memory = row.get("memory") or {}
+        user_memory = (row.get("owner") or {}).get("memory") or {}
+        return {
+            "user": user_memory.get("memory"),
+            "project": project_memory.get("memory"),
+        }
+
     def update_user_memory(self, memory: str, user_id: Optional[str] = None) -> bool:
         """
         Update the user's global memory.
@@ -20,6 +20,7 @@ import anthropic
 from anthropic import APIStatusError, APITimeoutError, APIConnectionError
 
 from app.utils.cost_tracking import add_usage as add_cost_usage, check_user_spending_limit
+from app.utils.rate_limit_utils import ConcurrencyLimiter
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +29,22 @@ _RATE_LIMIT_CODES = (429, 529)  # rate limit + overloaded
 _SERVER_ERROR_CODES = (500, 502, 503)
 _MAX_RETRIES = 3
 
+
+def _agent_concurrency() -> int:
+    try:
+        return int(os.getenv("CLAUDE_AGENT_CONCURRENCY", "8"))
+    except ValueError:
+        return 8
+
+
+# The component agent and the database analyzer agent make many back-to-back
+# calls and opt in with limit_concurrency=True. When a burst of runs goes past
+# what the API key sustains, the extra calls just collect 429/529s and sleep
+# 30s+ in _call_with_retry; queueing them here instead keeps tail latency
+# flat. Other callers, including chat and the remaining studio agents, don't
+# opt in.
+_agent_call_limiter = ConcurrencyLimiter(_agent_concurrency())
+
 # ContextVar carrying the signed-in user's email for the current logical
 # call. Routes that dispatch Claude calls into worker threads (e.g. the
 # SSE chat endpoint) lose Flask's request context at the thread boundary,
@@ -281,6 +298,7 @@ class ClaudeService:
         chat_id: Optional[str] = None,
         tags: Optional[List[str]] = None,
         enable_prompt_cache: bool = False,
+        limit_concurrency: bool = False,
     ) -> Dict[str, Any]:
         """
         Send messages to Claude and get a response.
@@ -301,6 +319,8 @@ class ClaudeService:
             tool_choice: Optional tool choice configuration
             extra_headers: Optional headers for beta features (e.g., {"anthropic-beta": "web-fetch-2025-09-10"})
             project_id: Optional project ID for cost tracking (if provided, costs are tracked)
+            limit_concurrency: Queue behind the shared agent-call cap
+                (CLAUDE_AGENT_CONCURRENCY) instead of calling straight away
 
         Returns:
             Dict containing:
@@ -350,9 +370,16 @@ class ClaudeService:
         short_name = (last_user_msg[:80] + "...") if isinstance(last_user_msg, str) and len(last_user_msg) > 80 else last_user_msg
         trace_name = str(short_name) if short_name else "noobbook_llm_call"
         trace_input = {"prompt": last_user_msg, "model": model, "message_count": len(messages)}
+
+        def create() -> Any:
+            if not limit_concurrency:
+                return self._call_with_retry(lambda: client.messages.create(**api_params))
+            with _agent_call_limiter.slot():
+                return self._call_with_retry(lambda: client.messages.create(**api_params))
+
         call_t0 = time.monotonic()
         response = self._run_tracked(
-            lambda: self._call_with_retry(lambda: client.messages.create(**api_params)),
+            create,
             opik_kwargs=opik_kwargs,
             trace_input=trace_input,
             trace_name=trace_name,
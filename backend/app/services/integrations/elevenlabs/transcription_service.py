@@ -9,6 +9,7 @@ generate a short-lived token that the frontend uses for WebSocket auth.
 """
 import logging
 import os
+import threading
 from typing import Iterable, List, Optional
 from urllib.parse import quote
 
@@ -68,13 +69,41 @@ class TranscriptionService:
     WEBSOCKET_URL = "wss://api.elevenlabs.io/v1/speech-to-text/realtime"
     DEFAULT_MODEL = "scribe_v2_realtime"
 
+    TOKEN_URL = "https://api.elevenlabs.io/v1/single-use-token/realtime_scribe"
+
     # Supported audio configurations for ElevenLabs
     SAMPLE_RATE = 16000  # 16kHz recommended
     ENCODING = "pcm_s16le"  # 16-bit PCM little-endian
 
+    # Query params that never change between sessions. VAD (Voice Activity
+    # Detection) commits the transcript when silence is detected.
+    # `no_verbatim=true` asks Scribe to drop filler words, false starts,
+    # and stutters before commit, cutting cleanup latency to zero (vs a
+    # post-pass LLM call).
+    _STATIC_PARAMS = (
+        f"&audio_format=pcm_{SAMPLE_RATE}"
+        "&commit_strategy=vad"
+        "&no_verbatim=true"
+    )
+
     def __init__(self):
         """Initialize the transcription service."""
-        pass
+        self._session: Optional[requests.Session] = None
+        self._session_lock = threading.Lock()
+
+    def _get_session(self) -> requests.Session:
+        """
+        Keep-alive session for ElevenLabs REST calls.
+
+        Tokens are single-use and can't be cached, so every recording
+        session costs one token request. Reusing the connection saves the
+        TCP + TLS handshake on all but the first one.
+        """
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = requests.Session()
+        return self._session
 
     def generate_scribe_token(self) -> str:
         """
@@ -98,8 +127,8 @@ class TranscriptionService:
             raise ValueError("ELEVENLABS_API_KEY not found in environment")
 
         # Request a single-use token from ElevenLabs
-        response = requests.post(
-            "https://api.elevenlabs.io/v1/single-use-token/realtime_scribe",
+        response = self._get_session().post(
+            self.TOKEN_URL,
             headers={"xi-api-key": api_key},
             timeout=10
         )
@@ -131,18 +160,9 @@ class TranscriptionService:
         """
         token = self.generate_scribe_token()
 
-        # Using VAD (Voice Activity Detection) for
-        # automatic speech segmentation — commits transcript when
-        # silence is detected. `no_verbatim=true` asks Scribe to drop
-        # filler words, false starts, and stutters before commit,
-        # cutting cleanup latency to zero (vs a post-pass LLM call).
         url_parts = [
-            f"{self.WEBSOCKET_URL}",
-            f"?model_id={self.DEFAULT_MODEL}",
-            f"&token={token}",
-            f"&audio_format=pcm_{self.SAMPLE_RATE}",
-            f"&commit_strategy=vad",
-            f"&no_verbatim=true",
+            f"{self.WEBSOCKET_URL}?model_id={self.DEFAULT_MODEL}&token={token}",
+            self._STATIC_PARAMS,
         ]
         sanitized = _sanitize_keyterms(keyterms)
         for term in sanitized:
@@ -50,14 +50,26 @@ class ImagenService:
 
     def __init__(self):
         self._client = None
+        self._configured: Optional[bool] = None  # Cache configuration check
 
     # ------------------------------------------------------------------
     # Configuration
     # ------------------------------------------------------------------
 
+    def reload_config(self) -> None:
+        """Reset cached config/client so the next call re-reads the environment."""
+        self._configured = None
+        self._client = None
+
     def is_configured(self) -> bool:
         """True if either provider is configured."""
-        return gpt_image_service.is_configured() or bool(os.getenv("NANO_BANANA_API_KEY"))
+        # Checked on every image-generating studio POST; keys only change via
+        # Settings → API Keys, which calls reload_config().
+        if self._configured is None:
+            self._configured = (
+                gpt_image_service.is_configured() or bool(os.getenv("NANO_BANANA_API_KEY"))
+            )
+        return self._configured
 
     def _gemini_configured(self) -> bool:
         return bool(os.getenv("NANO_BANANA_API_KEY"))
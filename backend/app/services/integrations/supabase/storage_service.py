@@ -12,10 +12,20 @@ File paths follow the pattern: {project_id}/{source_id}/{filename}
 """
 import logging
 import os
-from typing import Optional, BinaryIO, List, Dict, Any, Union
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from typing import Optional, BinaryIO, Iterator, List, Dict, Any, Union
 from pathlib import Path
 
-from app.services.integrations.supabase import get_supabase, is_supabase_enabled
+import httpx
+
+from app.services.integrations.supabase import (
+    SupabaseClient,
+    get_supabase,
+    is_supabase_enabled,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -140,7 +150,17 @@ _LIST_OPTIONS = {"limit": 10000}
 
 
 def _get_client():
-    """Get Supabase client, raising error if not configured."""
+    """
+    Get Supabase client, raising error if not configured.
+
+    Every studio file route (slides, screenshots, social images) funnels
+    through here once per request. After the singleton has been built the
+    env lookup in is_supabase_enabled() can't change the answer, so return
+    the cached instance directly and only pay for the check on first use.
+    """
+    client = SupabaseClient._instance
+    if client is not None:
+        return client
     if not is_supabase_enabled():
         raise RuntimeError(
             "Supabase is not configured. Please add SUPABASE_URL and "
@@ -579,7 +599,6 @@ def list_source_chunks(project_id: str, source_id: str) -> List[Dict[str, Any]]:
                 return None
 
         # Download chunks concurrently to avoid N+1 sequential requests
-        from concurrent.futures import ThreadPoolExecutor
         with ThreadPoolExecutor(max_workers=10) as executor:
             results = list(executor.map(_download_chunk, txt_files))
 
@@ -756,6 +775,23 @@ def _build_studio_path(project_id: str, job_type: str, job_id: str, filename: st
     return f"{project_id}/{job_type}/{job_id}/{filename}"
 
 
+@lru_cache(maxsize=1024)
+def is_safe_studio_filename(filename: str) -> bool:
+    """
+    True if a caller-supplied filename stays inside its job's storage prefix.
+
+    Studio file routes take ``<path:filename>`` straight from the URL and
+    append it to ``{project_id}/{job_type}/{job_id}/``. Rejecting absolute
+    paths, backslashes and ``.``/``..`` segments keeps a request from
+    reaching another job's (or project's) objects. Preview iframes fire one
+    request per slide/asset with the same handful of names, so the verdict
+    is memoized — it depends only on the string.
+    """
+    if not filename or filename.startswith("/") or "\\" in filename:
+        return False
+    return all(part not in ("", ".", "..") for part in filename.split("/"))
+
+
 def upload_studio_file(
     project_id: str,
     job_type: str,
@@ -860,6 +896,36 @@ def delete_studio_file(
     return _remove_path(BUCKET_STUDIO, path, "studio file")
 
 
+def _walk_studio_files(client, root_prefix: str) -> List[tuple]:
+    """
+    Collect every file under a studio job prefix in a single walk.
+
+    Supabase .list() only returns immediate children, so folders
+    (entries without an id) are scanned iteratively. Returns
+    ``(full_path, entry)`` pairs; list errors propagate so callers decide
+    whether a partial walk is acceptable.
+    """
+    folders_to_scan = [root_prefix]
+    files = []
+
+    while folders_to_scan:
+        folder = folders_to_scan.pop()
+        entries = client.storage.from_(BUCKET_STUDIO).list(
+            folder, options=_LIST_OPTIONS
+        )
+        if not entries:
+            continue
+        for entry in entries:
+            path = f"{folder}/{entry['name']}"
+            if entry.get("id") is None:
+                # No id means it's a folder — recurse into it
+                folders_to_scan.append(path)
+            else:
+                files.append((path, entry))
+
+    return files
+
+
 def delete_studio_job_files(project_id: str, job_type: str, job_id: str) -> bool:
     """
     Delete all files for a studio job, including subdirectories.
@@ -880,25 +946,7 @@ def delete_studio_job_files(project_id: str, job_type: str, job_id: str) -> bool
     root_prefix = f"{project_id}/{job_type}/{job_id}"
 
     try:
-        # Iteratively scan folders to collect all file paths
-        folders_to_scan = [root_prefix]
-        all_paths = []
-
-        while folders_to_scan:
-            folder = folders_to_scan.pop()
-            entries = client.storage.from_(BUCKET_STUDIO).list(
-                folder, options=_LIST_OPTIONS
-            )
-            if not entries:
-                continue
-            for entry in entries:
-                path = f"{folder}/{entry['name']}"
-                if entry.get("id") is None:
-                    # No id means it's a folder — recurse into it
-                    folders_to_scan.append(path)
-                else:
-                    all_paths.append(path)
-
+        all_paths = [path for path, _ in _walk_studio_files(client, root_prefix)]
         if all_paths:
             client.storage.from_(BUCKET_STUDIO).remove(all_paths)
         return True
@@ -928,29 +976,12 @@ def list_studio_job_files(project_id: str, job_type: str, job_id: str) -> List[D
     root_prefix = f"{project_id}/{job_type}/{job_id}"
 
     try:
-        # Iteratively scan folders to collect all files
-        folders_to_scan = [root_prefix]
-        all_files = []
-
-        while folders_to_scan:
-            folder = folders_to_scan.pop()
-            entries = client.storage.from_(BUCKET_STUDIO).list(
-                folder, options=_LIST_OPTIONS
-            )
-            if not entries:
-                continue
-            for entry in entries:
-                path = f"{folder}/{entry['name']}"
-                if entry.get("id") is None:
-                    # No id means it's a folder — recurse into it
-                    folders_to_scan.append(path)
-                else:
-                    # Store with relative path from job root for ZIP structure
-                    relative_path = path[len(root_prefix) + 1:]  # Strip prefix + /
-                    file_info = {**entry, "name": relative_path}
-                    all_files.append(file_info)
-
-        return all_files
+        # Store with relative path from job root for ZIP structure
+        prefix_len = len(root_prefix) + 1  # Strip prefix + /
+        return [
+            {**entry, "name": path[prefix_len:]}
+            for path, entry in _walk_studio_files(client, root_prefix)
+        ]
     except Exception as e:
         logger.error("Failed to list studio job files for %s: %s", root_prefix, e)
         return []
@@ -1014,6 +1045,164 @@ def download_studio_binary(
     return _download_bytes(BUCKET_STUDIO, path, "studio binary")
 
 
+@lru_cache(maxsize=1)
+def _stream_http_client() -> httpx.Client:
+    """Shared HTTP client for streamed studio downloads (keeps a connection pool)."""
+    # Same timeout the storage client uses by default
+    return httpx.Client(timeout=20)
+
+
+def open_studio_binary_stream(
+    project_id: str,
+    job_type: str,
+    job_id: str,
+    filename: str,
+    headers: Optional[Dict[str, str]] = None
+) -> Optional[httpx.Response]:
+    """
+    Open a streaming download of a studio file.
+
+    download_studio_binary reads the whole object into memory before the
+    caller can send a byte. This issues the same GET as the storage
+    client's download(), but with stream=True, so a route can relay the body in
+    chunks. Conditional headers (If-None-Match / If-Modified-Since) and
+    Range / If-Range can be passed through; a 304, 206 or 416 from storage
+    is returned as-is.
+
+    The caller owns the response and must close() it.
+
+    Args:
+        project_id: The project UUID
+        job_type: Type of studio output
+        job_id: The job UUID
+        filename: Output filename
+        headers: Extra request headers to forward to storage
+
+    Returns:
+        Open httpx response (status 200, 206, 304 or 416), or None if not
+        found / on error
+    """
+    path = _build_studio_path(project_id, job_type, job_id, filename)
+    client = _get_client()
+    try:
+        # Same object URL and auth headers the storage client uses for
+        # download(), taken from the Supabase client's public attributes.
+        http = _stream_http_client()
+        request = http.build_request(
+            "GET",
+            f"{client.storage_url.rstrip('/')}/object/{BUCKET_STUDIO}/{path}",
+            headers={**client.options.headers, **(headers or {})},
+        )
+        response = http.send(request, stream=True)
+    except Exception as e:
+        logger.error("Failed to open stream for studio binary %s: %s", path, e)
+        return None
+
+    if response.status_code not in (200, 206, 304, 416):
+        response.close()
+        logger.error("Failed to download studio binary %s: HTTP %s", path, response.status_code)
+        return None
+    return response
+
+
+def get_studio_file_info(
+    project_id: str,
+    job_type: str,
+    job_id: str,
+    filename: str
+) -> Optional[Dict[str, Any]]:
+    """
+    Get a studio file's object metadata (size, content type, timestamps)
+    without downloading its body.
+
+    Args:
+        project_id: The project UUID
+        job_type: Type of studio output
+        job_id: The job UUID
+        filename: Output filename
+
+    Returns:
+        Storage object info dict or None if not found
+    """
+    client = _get_client()
+    path = _build_studio_path(project_id, job_type, job_id, filename)
+
+    try:
+        return client.storage.from_(BUCKET_STUDIO).info(path)
+    except Exception as e:
+        logger.error("Failed to get info for studio file %s: %s", path, e)
+        return None
+
+
+def iter_studio_binaries(
+    project_id: str,
+    job_type: str,
+    job_id: str,
+    filenames: List[str]
+) -> Iterator[Optional[bytes]]:
+    """
+    Download several studio files concurrently, yielding them in order.
+
+    ZIP exports pull every slide, screenshot and asset for a
+    job; fetching them one by one serializes a storage round-trip per file.
+    Up to ten downloads run ahead of the consumer, and each result is
+    yielded as soon as it and the ones before it have arrived, so a streamed
+    response can start writing before the slowest file finishes while only
+    a bounded number of files is held in memory. A failed download yields
+    None, same as download_studio_binary.
+
+    Args:
+        project_id: The project UUID
+        job_type: Type of studio output
+        job_id: The job UUID
+        filenames: Output filenames relative to the job folder
+
+    Yields:
+        File bytes (or None) in the same order as filenames
+    """
+    if not filenames:
+        return
+
+    def _download(filename: str) -> Optional[bytes]:
+        return download_studio_binary(project_id, job_type, job_id, filename)
+
+    max_workers = min(10, len(filenames))
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    pending = iter(filenames)
+    try:
+        # executor.map would submit every download at once; keep at most
+        # max_workers results ahead of the consumer instead
+        in_flight = deque(
+            executor.submit(_download, filename)
+            for filename in islice(pending, max_workers)
+        )
+        while in_flight:
+            data = in_flight.popleft().result()
+            for filename in islice(pending, 1):
+                in_flight.append(executor.submit(_download, filename))
+            yield data
+    finally:
+        # If the consumer stops early (client went away), drop queued downloads
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def download_studio_binaries(
+    project_id: str,
+    job_type: str,
+    job_id: str,
+    filenames: List[str]
+) -> List[Optional[bytes]]:
+    """
+    Download several studio files concurrently.
+
+    Eager version of iter_studio_binaries.
+
+    Returns:
+        List of file bytes (or None) in the same order as filenames
+    """
+    return list(iter_studio_binaries(project_id, job_type, job_id, filenames))
+
+
 def get_studio_public_url(
     project_id: str,
     job_type: str,
@@ -12,7 +12,7 @@ Source status flow: uploaded → processing → [embedding] → ready
 - error: Processing failed
 """
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterable, List, Any, Optional
 
 from app.services.integrations.supabase import get_supabase, is_supabase_enabled
 
@@ -299,20 +299,55 @@ def list_sources_from_index(project_id: str) -> List[Dict[str, Any]]:
 # deserialize them.
 _CONTEXT_SOURCE_COLUMNS = "id, name, type, status, is_active, embedding_info, summary_info, created_at"
 
+# The id filter travels in the query string (~37 bytes per UUID). Past this
+# many ids, query the whole project and filter in Python instead, so a big
+# selection can't push the URL past proxy/PostgREST length limits.
+_MAX_ID_FILTER = 100
 
-def list_sources_for_context(project_id: str) -> List[Dict[str, Any]]:
+
+def list_sources_for_context(
+    project_id: str,
+    source_ids: Optional[Iterable[str]] = None,
+    ready_only: bool = False,
+    active_only: bool = False,
+) -> List[Dict[str, Any]]:
     """Like ``list_sources_from_index`` but projects only the columns the chat
     source-context build needs — avoids shipping the large processing_info blob
     on every message. NOT for the Sources panel (which renders processing_info
-    error/sync state)."""
+    error/sync state).
+
+    The optional filters run in the query, so a chat with three selected
+    sources doesn't pull every row of a large project just to drop most of
+    them in Python.
+
+    Args:
+        project_id: The project UUID
+        source_ids: Only these sources (None = no id filter)
+        ready_only: Only sources with status "ready"
+        active_only: Only sources with the global active flag set
+    """
     client = _get_client()
 
-    response = (
+    query = (
         client.table("sources")
         .select(_CONTEXT_SOURCE_COLUMNS)
         .eq("project_id", project_id)
-        .order("created_at", desc=True)
-        .execute()
     )
-
-    return [_map_source_fields(source) for source in (response.data or [])]
+    wanted_ids = None
+    if source_ids is not None:
+        source_ids = list(source_ids)
+        if len(source_ids) <= _MAX_ID_FILTER:
+            query = query.in_("id", source_ids)
+        else:
+            wanted_ids = set(source_ids)
+    if ready_only:
+        query = query.eq("status", "ready")
+    if active_only:
+        query = query.eq("is_active", True)
+
+    response = query.order("created_at", desc=True).execute()
+
+    return [
+        _map_source_fields(source) for source in (response.data or [])
+        if wanted_ids is None or source["id"] in wanted_ids
+    ]
@@ -11,7 +11,7 @@ CRUD Operations are kept here for backwards compatibility with API routes.
 """
 import logging
 from pathlib import Path
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, Iterable, List, Any
 from werkzeug.datastructures import FileStorage
 
 logger = logging.getLogger(__name__)
@@ -64,10 +64,22 @@ class SourceService:
         """
         return source_index_service.list_sources_from_index(project_id)
 
-    def list_sources_for_context(self, project_id: str) -> List[Dict[str, Any]]:
+    def list_sources_for_context(
+        self,
+        project_id: str,
+        source_ids: Optional[Iterable[str]] = None,
+        ready_only: bool = False,
+        active_only: bool = False,
+    ) -> List[Dict[str, Any]]:
         """List sources with only the columns the chat source-context needs
-        (drops the heavy processing_info JSONB). Not for the Sources panel."""
-        return source_index_service.list_sources_for_context(project_id)
+        (drops the heavy processing_info JSONB). Not for the Sources panel.
+        Filters are applied in the query; see source_index_service."""
+        return source_index_service.list_sources_for_context(
+            project_id,
+            source_ids=source_ids,
+            ready_only=ready_only,
+            active_only=active_only,
+        )
 
     def get_source(self, project_id: str, source_id: str) -> Optional[Dict[str, Any]]:
         """
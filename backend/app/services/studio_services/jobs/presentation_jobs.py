@@ -49,10 +49,15 @@ def create_presentation_job(
         "summary": None,
         "design_notes": None,
         "screenshots": [],
+        "has_webp": False,
         "pptx_file": None,
         "pptx_filename": None,
+        "pptx_size": None,
+        "pptx_mtime": None,
         "export_status": None,
         "preview_url": None,
+        # Precomputed so preview polling is a plain concat per slide
+        "slide_url_prefix": f"/api/v1/projects/{project_id}/studio/presentations/{job_id}/slides/",
         "download_url": None,
         "iterations": None,
         "input_tokens": None,
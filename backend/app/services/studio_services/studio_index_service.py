@@ -37,8 +37,11 @@ Architecture:
     └── business_report_jobs.py
 """
 import logging
+import threading
 from typing import Dict, List, Any, Optional
 
+from cachetools import TLRUCache
+
 from app.services.integrations.supabase import get_supabase, is_supabase_enabled
 
 logger = logging.getLogger(__name__)
@@ -248,6 +251,8 @@ def create_job(
     except Exception as e:
         logger.error("Failed to create studio job (type=%s, project=%s): %s", job_type, project_id, e)
         return None
+    finally:
+        _invalidate_poll_cache(project_id)
 
 
 # Allowed transitions for the studio_jobs.status column. Every other
@@ -368,6 +373,8 @@ def update_job(
     except Exception as e:
         logger.error("Failed to update studio job %s: %s", job_id, e)
         return None
+    finally:
+        _invalidate_poll_cache(project_id, job_id)
 
 
 _TERMINAL_STATUSES = {"ready", "error", "cancelled"}
@@ -493,6 +500,115 @@ def get_job(
         return None
 
 
+# Single-flight caches for status polling. The frontend polls job status
+# about once a second per open tab; concurrent polls for the same key share
+# one index read, and the result is reused briefly. Jobs that are still
+# running expire quickly so progress stays live; finished jobs rarely change
+# and are kept a little longer. Writes in this process invalidate both caches.
+_POLL_ACTIVE_TTL_SECONDS = 0.25
+_POLL_TERMINAL_TTL_SECONDS = 5.0
+
+
+def _job_poll_ttu(_key: tuple, job: Optional[Dict[str, Any]], now: float) -> float:
+    if job and job.get("status") in _TERMINAL_STATUSES:
+        return now + _POLL_TERMINAL_TTL_SECONDS
+    return now + _POLL_ACTIVE_TTL_SECONDS
+
+
+def _list_poll_ttu(_key: tuple, jobs: List[Dict[str, Any]], now: float) -> float:
+    if all(job.get("status") in _TERMINAL_STATUSES for job in jobs):
+        return now + _POLL_TERMINAL_TTL_SECONDS
+    return now + _POLL_ACTIVE_TTL_SECONDS
+
+
+_POLL_CACHE: TLRUCache = TLRUCache(maxsize=4096, ttu=_job_poll_ttu)
+_LIST_POLL_CACHE: TLRUCache = TLRUCache(maxsize=1024, ttu=_list_poll_ttu)
+_POLL_LOCK = threading.Lock()
+_POLL_INFLIGHT: Dict[tuple, threading.Lock] = {}
+_MISSING = object()
+
+
+def _single_flight(cache: TLRUCache, key: tuple, load):
+    """Return cache[key], running ``load()`` at most once per key at a time."""
+    with _POLL_LOCK:
+        cached = cache.get(key, _MISSING)
+        if cached is not _MISSING:
+            return cached
+        key_lock = _POLL_INFLIGHT.setdefault(key, threading.Lock())
+
+    with key_lock:
+        # Another request may have filled the cache while we waited
+        with _POLL_LOCK:
+            cached = cache.get(key, _MISSING)
+            if cached is not _MISSING:
+                return cached
+
+        try:
+            value = load()
+            with _POLL_LOCK:
+                cache[key] = value
+        finally:
+            # Drop the per-key lock even when load() raises
+            with _POLL_LOCK:
+                _POLL_INFLIGHT.pop(key, None)
+        return value
+
+
+# Signalled whenever a job is written in this process, so job event
+# streams can push the change right away instead of waiting for their
+# next re-read.
+_JOB_CHANGED = threading.Condition()
+
+
+def _invalidate_poll_cache(project_id: str, job_id: Optional[str] = None) -> None:
+    """Drop cached poll results for a job and every job list in its project."""
+    with _POLL_LOCK:
+        if job_id:
+            _POLL_CACHE.pop(("job", project_id, job_id), None)
+        for key in [k for k in _LIST_POLL_CACHE.keys() if k[1] == project_id]:
+            _LIST_POLL_CACHE.pop(key, None)
+    if job_id:
+        with _JOB_CHANGED:
+            _JOB_CHANGED.notify_all()
+
+
+def wait_for_job_change(timeout: float) -> None:
+    """
+    Block until some studio job is written in this process, or timeout.
+
+    Wakes on any job write, not a specific one. Callers re-read their
+    job and compare. Writes made by other workers don't signal here, so
+    callers should keep the timeout short enough to pick those up too.
+    """
+    with _JOB_CHANGED:
+        _JOB_CHANGED.wait(timeout)
+
+
+def get_job_for_poll(
+    project_id: str,
+    job_id: str
+) -> Optional[Dict[str, Any]]:
+    """
+    Get a studio job for a status poll, coalescing concurrent reads.
+
+    Same result as get_job, but may be slightly stale (250ms while the
+    job runs, a few seconds once it has finished). Only for the read-only
+    polling endpoints — callers that modify a job should keep using get_job.
+
+    Args:
+        project_id: The project UUID
+        job_id: The job UUID
+
+    Returns:
+        Job record (flattened) or None if not found
+    """
+    return _single_flight(
+        _POLL_CACHE,
+        ("job", project_id, job_id),
+        lambda: get_job(project_id, job_id),
+    )
+
+
 def list_jobs(
     project_id: str,
     job_type: str,
@@ -528,6 +644,24 @@ def list_jobs(
         return []
 
 
+def list_jobs_for_poll(
+    project_id: str,
+    job_type: str,
+    source_id: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """
+    List studio jobs for a polling endpoint, coalescing concurrent reads.
+
+    Same result as list_jobs, with the same staleness bounds as
+    get_job_for_poll. Callers must not mutate the returned list.
+    """
+    return _single_flight(
+        _LIST_POLL_CACHE,
+        ("list", project_id, job_type, source_id or "*"),
+        lambda: list_jobs(project_id, job_type, source_id),
+    )
+
+
 def list_jobs_grouped(project_id: str) -> Dict[str, List[Dict[str, Any]]]:
     """
     List all studio jobs for a project, grouped by job_type.
@@ -560,6 +694,53 @@ def list_jobs_grouped(project_id: str) -> Dict[str, List[Dict[str, Any]]]:
         return {}
 
 
+def delete_failed_edit_jobs(
+    project_id: str,
+    job_type: str,
+    parent_job_id: str
+) -> int:
+    """
+    Delete a parent job's failed edit attempts in a single statement.
+
+    Every studio edit request clears out earlier edits of the same
+    parent that ended in error. Doing that by listing all jobs of the type
+    and deleting matches one by one costs a full-table read plus one round
+    trip per row; filtering on the JSONB parent_job_id server-side does it
+    in one query.
+
+    Never raises — this is non-critical housekeeping that must not block
+    the new edit.
+
+    Args:
+        project_id: The project UUID
+        job_type: Job type string
+        parent_job_id: The job being edited
+
+    Returns:
+        Number of rows deleted
+    """
+    try:
+        client = _get_client()
+        response = (
+            client.table("studio_jobs")
+            .delete()
+            .eq("project_id", project_id)
+            .eq("job_type", job_type)
+            .eq("status", "error")
+            .eq("job_data->>parent_job_id", parent_job_id)
+            .execute()
+        )
+        return len(response.data or [])
+    except Exception as e:
+        logger.error(
+            "Failed to delete failed edit jobs (type=%s, parent=%s): %s",
+            job_type, parent_job_id, e,
+        )
+        return 0
+    finally:
+        _invalidate_poll_cache(project_id)
+
+
 def delete_job(
     project_id: str,
     job_id: str
@@ -587,6 +768,8 @@ def delete_job(
     except Exception as e:
         logger.error("Failed to delete studio job %s: %s", job_id, e)
         return False
+    finally:
+        _invalidate_poll_cache(project_id, job_id)
 
 
 # =============================================================================
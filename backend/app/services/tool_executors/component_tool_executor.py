@@ -273,10 +273,12 @@ class ComponentToolExecutor:
             component_category = job.get("component_category", "component") if job else "component"
             component_description = job.get("component_description", "") if job else ""
 
-            # Include brand logo in the images list for reference
+            # Include brand logo in the images list for reference. Its url is
+            # a base64 data URI that's already inlined in every variation, so
+            # keep it out of the job row the frontend polls.
             all_images = []
             if logo_info:
-                all_images.append(logo_info)
+                all_images.append({k: v for k, v in logo_info.items() if k != "url"})
 
             # Update job to ready
             studio_index_service.update_component_job(
@@ -15,6 +15,7 @@ from __future__ import annotations
 
 import logging
 import re
+import threading
 import time
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Tuple
@@ -50,6 +51,100 @@ class _ResolvedConnection:
     connection_uri: str
 
 
+# Idle connections kept between agent runs. A fresh connection to a customer
+# database costs a TCP + TLS + auth handshake; a chat session asks several
+# questions of the same source, so each run checks out a warm connection
+# instead. Keyed by the resolved connection (id, type and URI), so edited
+# credentials never reuse an old session. A daemon thread, started when the
+# first connection is parked, closes idle connections once they pass the TTL,
+# so none stays open longer than _POOL_IDLE_TTL + _POOL_SWEEP_INTERVAL.
+_POOL_MAX_IDLE = 4  # per connection; matches the agent's parallel tool calls
+_POOL_IDLE_TTL = 300  # seconds
+_POOL_SWEEP_INTERVAL = 60  # seconds
+_idle_pool: Dict[_ResolvedConnection, List[Tuple[float, Any]]] = {}
+_idle_pool_lock = threading.Lock()
+_idle_sweeper: Optional[threading.Thread] = None
+
+
+def _close_quietly(conn: Any) -> None:
+    try:
+        conn.close()
+    except Exception:
+        pass
+
+
+def _sweep_idle_pool(now: float) -> List[Any]:
+    """Drop expired idle connections; caller holds the lock and closes them."""
+    expired: List[Any] = []
+    for key in list(_idle_pool):
+        fresh = []
+        for released_at, conn in _idle_pool[key]:
+            if now - released_at < _POOL_IDLE_TTL:
+                fresh.append((released_at, conn))
+            else:
+                expired.append(conn)
+        if fresh:
+            _idle_pool[key] = fresh
+        else:
+            del _idle_pool[key]
+    return expired
+
+
+def sweep_idle_connections() -> int:
+    """Close idle pooled connections past their TTL. Returns how many were closed."""
+    with _idle_pool_lock:
+        expired = _sweep_idle_pool(time.monotonic())
+    for stale in expired:
+        _close_quietly(stale)
+    return len(expired)
+
+
+def _run_idle_sweeper() -> None:
+    while True:
+        time.sleep(_POOL_SWEEP_INTERVAL)
+        try:
+            sweep_idle_connections()
+        except Exception:
+            logger.exception("Idle database connection sweep failed")
+
+
+def _start_idle_sweeper() -> None:
+    """Start the sweeper thread once per process; caller holds the lock."""
+    global _idle_sweeper
+    if _idle_sweeper is None:
+        _idle_sweeper = threading.Thread(
+            target=_run_idle_sweeper, name="db-idle-sweeper", daemon=True
+        )
+        _idle_sweeper.start()
+
+
+def _checkout_idle(resolved: _ResolvedConnection) -> Optional[Any]:
+    """Take the most recently released idle connection for ``resolved``."""
+    with _idle_pool_lock:
+        expired = _sweep_idle_pool(time.monotonic())
+        idle = _idle_pool.get(resolved)
+        conn = idle.pop()[1] if idle else None
+    for stale in expired:
+        _close_quietly(stale)
+    return conn
+
+
+def _release_idle(resolved: _ResolvedConnection, conn: Any) -> None:
+    """Park a connection for the next run, or close it if the pool is full."""
+    with _idle_pool_lock:
+        now = time.monotonic()
+        expired = _sweep_idle_pool(now)
+        idle = _idle_pool.setdefault(resolved, [])
+        if len(idle) < _POOL_MAX_IDLE:
+            idle.append((now, conn))
+            conn = None
+            _start_idle_sweeper()
+    for stale in expired:
+        _close_quietly(stale)
+    if conn is not None:
+        _close_quietly(conn)
+
+
 def _serialize_value(value: Any) -> Any:
     """Convert values to JSON-serializable types for tool results."""
     if isinstance(value, (str, int, float, bool)) or value is None:
@@ -110,7 +205,7 @@ class DatabaseExecutor:
 
     def __init__(self) -> None:
         self._conn_cache: Dict[str, Any] = {}
-        self._conn_type_cache: Dict[str, str] = {}
+        self._conn_resolved_cache: Dict[str, _ResolvedConnection] = {}
 
     # ---------------------------------------------------------------------
     # Public API
@@ -119,12 +214,16 @@ class DatabaseExecutor:
     def close_connections(self) -> None:
         """Close any cached DB connections."""
         for conn in self._conn_cache.values():
-            try:
-                conn.close()
-            except Exception:
-                pass
+            _close_quietly(conn)
         self._conn_cache.clear()
-        self._conn_type_cache.clear()
+        self._conn_resolved_cache.clear()
+
+    def release_connections(self) -> None:
+        """Hand cached DB connections back to the shared idle pool."""
+        for connection_id, conn in self._conn_cache.items():
+            _release_idle(self._conn_resolved_cache[connection_id], conn)
+        self._conn_cache.clear()
+        self._conn_resolved_cache.clear()
 
     def execute_tool(
         self,
@@ -227,9 +326,15 @@ class DatabaseExecutor:
     def _get_connection(self, project_id: str, source_id: str) -> Tuple[Any, _ResolvedConnection]:
         resolved = self._resolve_connection(project_id, source_id)
 
-        cached = self._conn_cache.get(resolved.connection_id)
-        cached_type = self._conn_type_cache.get(resolved.connection_id)
-        if cached is not None and cached_type == resolved.db_type:
+        cached = self._conn_cache.pop(resolved.connection_id, None)
+        cached_resolved = self._conn_resolved_cache.pop(resolved.connection_id, None)
+        if cached is not None and cached_resolved != resolved:
+            _close_quietly(cached)
+            cached = None
+        if cached is None:
+            cached = _checkout_idle(resolved)
+
+        if cached is not None:
             # Best-effort liveness check
             try:
                 if resolved.db_type == "mysql":
@@ -238,18 +343,15 @@ class DatabaseExecutor:
                     with cached.cursor() as cur:
                         cur.execute("SELECT 1")
                         cur.fetchone()
-                return cached, resolved
+                conn = cached
             except Exception:
-                try:
-                    cached.close()
-                except Exception:
-                    pass
-                self._conn_cache.pop(resolved.connection_id, None)
-                self._conn_type_cache.pop(resolved.connection_id, None)
+                _close_quietly(cached)
+                conn = self._connect(resolved.db_type, resolved.connection_uri)
+        else:
+            conn = self._connect(resolved.db_type, resolved.connection_uri)
 
-        conn = self._connect(resolved.db_type, resolved.connection_uri)
         self._conn_cache[resolved.connection_id] = conn
-        self._conn_type_cache[resolved.connection_id] = resolved.db_type
+        self._conn_resolved_cache[resolved.connection_id] = resolved
         return conn, resolved
 
     def validate_connection(self, project_id: str, source_id: str) -> _ResolvedConnection:
@@ -9,6 +9,7 @@ HTML slides, it captures screenshots and exports to PPTX.
 import logging
 import shutil
 import tempfile
+import time
 from typing import Dict, Any, Optional
 import uuid
 from pathlib import Path
@@ -62,7 +63,7 @@ class PresentationAgentExecutor:
         from app.services.ai_agents import presentation_agent_service
         from app.services.source_services import source_service
         from app.services.integrations.supabase import storage_service
-        from app.utils.screenshot_utils import capture_slides_as_screenshots
+        from app.utils.screenshot_utils import capture_slides_as_screenshots, png_to_webp
         from app.utils.presentation_export_utils import create_pptx_from_screenshots
 
         # Get source info
@@ -177,6 +178,7 @@ class PresentationAgentExecutor:
                     return
 
                 # Upload screenshots to Supabase Storage
+                has_webp = True
                 for screenshot_info in screenshots:
                     screenshot_path = Path(screenshot_info.get("screenshot_path", ""))
                     if screenshot_path.exists():
@@ -189,11 +191,26 @@ class PresentationAgentExecutor:
                             file_data=screenshot_bytes,
                             content_type="image/png"
                         )
+                        # Smaller WebP copy for the preview pane (served via
+                        # content negotiation; the PNG is still used for PPTX)
+                        webp_bytes = png_to_webp(screenshot_bytes)
+                        webp_path = webp_bytes and storage_service.upload_studio_binary(
+                            project_id=project_id,
+                            job_type="presentations",
+                            job_id=job_id,
+                            filename=f"screenshots/{screenshot_path.stem}.webp",
+                            file_data=webp_bytes,
+                            content_type="image/webp"
+                        )
+                        has_webp = has_webp and bool(webp_path)
 
-                # Update with screenshots info
+                # Update with screenshots info. has_webp tells the
+                # screenshot route whether a WebP copy exists for every
+                # slide, so it never has to probe storage for one.
                 studio_index_service.update_presentation_job(
                     project_id, job_id,
                     screenshots=screenshots,
+                    has_webp=has_webp,
                     status_message="Creating PPTX..."
                 )
 
@@ -227,11 +244,15 @@ class PresentationAgentExecutor:
                         content_type="application/vnd.openxmlformats-officedocument.presentationml.presentation"
                     )
 
-                    # Store filename (not absolute path) in job metadata
+                    # Store filename (not absolute path) in job metadata, plus
+                    # size/upload time so the download route can answer
+                    # conditional requests without touching storage.
                     studio_index_service.update_presentation_job(
                         project_id, job_id,
                         pptx_file=pptx_filename,
                         pptx_filename=pptx_filename,
+                        pptx_size=len(pptx_bytes),
+                        pptx_mtime=time.time(),
                         export_status="ready",
                         status_message="Presentation ready for download!",
                         download_url=f"/api/v1/projects/{project_id}/studio/presentations/{job_id}/download"
@@ -225,8 +225,17 @@ def extract_tool_use_blocks(
     content_blocks = response.get("content_blocks", [])
 
     for block in content_blocks:
+        # Handle dict format (already serialized)
+        if isinstance(block, dict):
+            if block.get("type") == "tool_use" and (tool_name is None or block.get("name") == tool_name):
+                tool_blocks.append({
+                    "id": block.get("id"),
+                    "name": block.get("name"),
+                    "input": block.get("input", {}),
+                })
+
         # Handle Anthropic objects (have .type attribute)
-        if hasattr(block, 'type') and block.type == "tool_use":
+        elif getattr(block, "type", None) == "tool_use":
             if tool_name is None or block.name == tool_name:
                 tool_blocks.append({
                     "id": block.id,
@@ -234,15 +243,6 @@ def extract_tool_use_blocks(
                     "input": block.input,
                 })
 
-        # Handle dict format (already serialized)
-        elif isinstance(block, dict) and block.get("type") == "tool_use":
-            if tool_name is None or block.get("name") == tool_name:
-                tool_blocks.append({
-                    "id": block.get("id"),
-                    "name": block.get("name"),
-                    "input": block.get("input", {}),
-                })
-
     return tool_blocks
 
 
@@ -0,0 +1,74 @@
+"""
+orjson-backed JSON provider for Flask.
+
+Every `jsonify(...)` / dict return in the API goes through
+`app.json`. The studio list and status endpoints return dozens of job records
+with nested slide/question/post arrays, and the frontend polls them every few
+seconds — stdlib `json` spends a noticeable share of each request just
+encoding. orjson is a C implementation that writes bytes directly, so we swap
+it in once at app creation and no handler has to change.
+
+Kept the same as Flask's DefaultJSONProvider:
+  - datetimes are passed through to the provider's `default` so they keep
+    the HTTP-date format instead of orjson's RFC 3339
+  - Decimal / UUID / dataclass / __html__ fall back to the same `default`
+  - keys are sorted (`sort_keys`), and responses are indented in debug
+    mode (`compact`) and end with a newline
+  - anything orjson can't encode (integers past 64 bits) and any call with
+    explicit json.dumps / json.loads kwargs goes through the stdlib provider
+
+Differences:
+  - non-ASCII text is written as UTF-8 instead of \\u escapes (`ensure_ascii`
+    is ignored)
+  - NaN and Infinity are written as null (stdlib writes the non-standard
+    NaN / Infinity tokens)
+  - non-string dict keys are stringified, including when sorting keys,
+    where stdlib raises
+"""
+from typing import Any, Union
+
+import orjson
+from flask import Response
+from flask.json.provider import DefaultJSONProvider
+
+_DUMPS_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSONProvider that serializes with orjson and parses with orjson."""
+
+    def _options(self, indent: bool = False) -> int:
+        option = _DUMPS_OPTIONS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return option
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+        try:
+            return orjson.dumps(obj, default=self.default, option=self._options()).decode("utf-8")
+        except TypeError:
+            return super().dumps(obj)
+
+    def loads(self, s: Union[str, bytes], **kwargs: Any) -> Any:
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        # Hand orjson's bytes straight to the response instead of going
+        # through dumps() — skips a decode/encode round-trip per request.
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        try:
+            body = orjson.dumps(
+                obj,
+                default=self.default,
+                option=self._options(indent) | orjson.OPT_APPEND_NEWLINE,
+            )
+        except TypeError:
+            return super().response(*args, **kwargs)
+        return self._app.response_class(body, mimetype=self.mimetype)
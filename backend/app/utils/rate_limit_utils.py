@@ -21,6 +21,9 @@ Usage:
     limiter.wait_if_needed()
     response = api.call(...)
 
+ConcurrencyLimiter caps calls in flight instead (agent-loop Claude calls
+in claude_service).
+
 Used by:
 - pdf_service (PDF page extraction)
 - pptx_service (slide extraction)
@@ -30,7 +33,8 @@ Used by:
 import logging
 import time
 import threading
-from typing import Optional
+from contextlib import contextmanager
+from typing import Iterator, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -123,6 +127,44 @@ class RateLimiter:
             return 60 - elapsed
 
 
+class ConcurrencyLimiter:
+    """
+    Thread-safe cap on how many calls run at the same time.
+
+    RateLimiter bounds requests per minute; this bounds requests in flight.
+    Callers past the cap block until a slot frees up instead of piling more
+    concurrent requests onto the API.
+    """
+
+    def __init__(self, max_concurrent: int):
+        """
+        Initialize the concurrency limiter.
+
+        Args:
+            max_concurrent: Maximum calls allowed in flight at once
+        """
+        self.max_concurrent = max(1, max_concurrent)
+        self._semaphore = threading.BoundedSemaphore(self.max_concurrent)
+
+    @contextmanager
+    def slot(self) -> Iterator[float]:
+        """
+        Hold one slot for the duration of the block.
+
+        Yields:
+            Time waited for the slot in seconds
+        """
+        start = time.monotonic()
+        self._semaphore.acquire()
+        waited = time.monotonic() - start
+        if waited >= 1.0:
+            logger.info("Concurrency limit reached (%s in flight). Waited %.1fs", self.max_concurrent, waited)
+        try:
+            yield waited
+        finally:
+            self._semaphore.release()
+
+
 def create_rate_limiter(requests_per_minute: int) -> RateLimiter:
     """
     Factory function to create a rate limiter.
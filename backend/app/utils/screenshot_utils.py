@@ -21,9 +21,11 @@ Usage:
 """
 
 import asyncio
+import io
 import logging
 from pathlib import Path
 from typing import List, Dict, Any, Optional
+from PIL import Image
 from playwright.async_api import async_playwright
 
 logger = logging.getLogger(__name__)
@@ -33,6 +35,10 @@ logger = logging.getLogger(__name__)
 SLIDE_WIDTH = 1920
 SLIDE_HEIGHT = 1080
 
+# WebP settings for preview copies (PNG stays the source for PPTX export)
+WEBP_QUALITY = 85
+WEBP_METHOD = 4
+
 
 async def _capture_screenshot_async(
     page,
@@ -218,6 +224,29 @@ def capture_slides_as_screenshots(
     return screenshots
 
 
+def png_to_webp(png_bytes: bytes) -> Optional[bytes]:
+    """
+    Transcode a captured PNG screenshot to WebP for the preview pane.
+
+    Slide screenshots are flat UI renders, where lossy WebP at q85 is
+    several times smaller than PNG with no visible difference.
+
+    Args:
+        png_bytes: PNG file contents
+
+    Returns:
+        WebP bytes, or None if the image can't be transcoded
+    """
+    try:
+        with Image.open(io.BytesIO(png_bytes)) as image:
+            buffer = io.BytesIO()
+            image.save(buffer, "WEBP", quality=WEBP_QUALITY, method=WEBP_METHOD)
+            return buffer.getvalue()
+    except Exception as e:
+        logger.warning("WebP transcode failed: %s", e)
+        return None
+
+
 def is_playwright_available() -> bool:
     """
     Check if Playwright is installed and browsers are available.
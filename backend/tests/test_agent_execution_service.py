@@ -0,0 +1,57 @@
+"""
+Tests for the agent execution log writer.
+
+Covers:
+- A saved log round-trips through get_agent_execution
+- Non-JSON values (datetimes, non-string keys) don't fail the save
+"""
+import os
+from datetime import datetime
+
+os.environ.setdefault("SUPABASE_URL", "http://localhost")
+os.environ.setdefault(
+    "SUPABASE_SERVICE_KEY",
+    "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9.eyJyb2xlIjoidGVzdCJ9.test",
+)
+
+from app.services.data_services.agent_execution_service import AgentExecutionService  # noqa: E402
+
+
+def _service(tmp_path, monkeypatch) -> AgentExecutionService:
+    service = AgentExecutionService()
+    monkeypatch.setattr(service, "_get_agent_dir", lambda project_id, agent_name: tmp_path)
+    return service
+
+
+def test_saved_log_round_trips(tmp_path, monkeypatch):
+    service = _service(tmp_path, monkeypatch)
+    messages = [
+        {"role": "user", "content": "héllo"},
+        {"role": "assistant", "content": [{"type": "text", "text": "hi"}]},
+    ]
+
+    execution_id = service.save_agent_execution(
+        "p1", "database_analyzer_agent", "e1", "task", messages,
+        {"success": True}, "2026-01-01T00:00:00", metadata={"source_id": "s1"},
+    )
+
+    assert execution_id == "e1"
+    log = service.get_agent_execution("p1", "database_analyzer_agent", "e1")
+    assert log["messages"] == messages
+    assert log["result"] == {"success": True}
+    assert log["source_id"] == "s1"
+    assert "héllo" in (tmp_path / "e1.json").read_text(encoding="utf-8")
+
+
+def test_non_json_values_are_stringified(tmp_path, monkeypatch):
+    service = _service(tmp_path, monkeypatch)
+
+    execution_id = service.save_agent_execution(
+        "p1", "agent", "e2", "task", [],
+        {"rows": {1: "a"}, "at": datetime(2026, 1, 1)}, "2026-01-01T00:00:00",
+    )
+
+    assert execution_id == "e2"
+    log = service.get_agent_execution("p1", "agent", "e2")
+    assert log["result"]["rows"] == {"1": "a"}
+    assert log["result"]["at"].startswith("2026-01-01")
@@ -5,13 +5,15 @@ Covers:
 - create_batches: empty, exact division, remainder, single item, invalid size
 - get_batch_info: even division edge case, empty input
 - RateLimiter: counter increment, window reset, remaining_requests, reset()
+- ConcurrencyLimiter: in-flight cap, slot released on error
 """
 import pytest
+import threading
 import time
 from unittest.mock import patch
 
 from app.utils.batching_utils import create_batches, get_batch_info, DEFAULT_BATCH_SIZE
-from app.utils.rate_limit_utils import RateLimiter
+from app.utils.rate_limit_utils import ConcurrencyLimiter, RateLimiter
 
 
 # ===========================================================================
@@ -162,3 +164,41 @@ class TestRateLimiter:
 
         # Counter should have been reset to 0, then incremented to 1
         assert limiter.remaining_requests == 9
+
+
+# ---------------------------------------------------------------------------
+# ConcurrencyLimiter
+# ---------------------------------------------------------------------------
+
+class TestConcurrencyLimiter:
+
+    def test_caps_calls_in_flight(self):
+        limiter = ConcurrencyLimiter(2)
+        in_flight = []
+        peak = []
+        lock = threading.Lock()
+
+        def work():
+            with limiter.slot():
+                with lock:
+                    in_flight.append(1)
+                    peak.append(len(in_flight))
+                time.sleep(0.02)
+                with lock:
+                    in_flight.pop()
+
+        threads = [threading.Thread(target=work) for _ in range(6)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert max(peak) == 2
+
+    def test_slot_released_on_error(self):
+        limiter = ConcurrencyLimiter(1)
+        with pytest.raises(RuntimeError):
+            with limiter.slot():
+                raise RuntimeError("boom")
+        with limiter.slot() as waited:
+            assert waited < 0.1
@@ -0,0 +1,84 @@
+"""
+Tests for the prompt-side caches in brand_config_service.
+
+Covers:
+- Repeated is_feature_enabled checks read the config once
+- Defaults fill in features missing from stored settings
+- Saving the config drops the user's cached toggles and cached config
+"""
+import os
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# Importing the service constructs a Supabase-backed singleton, which refuses
+# to load without these env vars. We never call the real client.
+os.environ.setdefault("SUPABASE_URL", "http://localhost")
+os.environ.setdefault(
+    "SUPABASE_SERVICE_KEY",
+    "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9.eyJyb2xlIjoidGVzdCJ9.test",
+)
+
+from app.services.data_services.brand_config_service import brand_config_service as service  # noqa: E402
+
+# app.services.data_services re-exports the singleton under the module's name
+service_module = sys.modules["app.services.data_services.brand_config_service"]
+
+
+@pytest.fixture(autouse=True)
+def clear_feature_cache():
+    service_module._prompt_config_cache.clear()
+    yield
+    service_module._prompt_config_cache.clear()
+
+
+def test_feature_checks_share_one_config_read():
+    config = {"feature_settings": {"blog": False}}
+    with patch.object(service, "get_config", return_value=config) as get_config:
+        assert service.is_feature_enabled("u1", "blog") is False
+        assert service.is_feature_enabled("u1", "blog") is False
+        # Not stored -> falls back to DEFAULT_FEATURE_SETTINGS
+        assert service.is_feature_enabled("u1", "presentation") is True
+        assert service.is_feature_enabled("u1", "presentation") is True
+
+    assert get_config.call_count == 1
+
+
+def test_saving_config_drops_cached_toggles():
+    config = {"feature_settings": {"blog": False}}
+    with patch.object(service, "get_config", side_effect=lambda user_id: config), \
+            patch.object(service, "supabase", MagicMock()):
+        assert service.is_feature_enabled("u1", "blog") is False
+        assert service.is_feature_enabled("u2", "blog") is False
+
+        config = {"feature_settings": {"blog": True}}
+        service.update_feature_settings("u1", {"blog": True})
+
+        assert service.is_feature_enabled("u1", "blog") is True
+        # Other users' entries are untouched
+        assert "u2" in service_module._prompt_config_cache
+
+
+def test_prompt_config_is_cached_until_saved():
+    rows = [{"voice": {"tone": "formal"}}, {"voice": {"tone": "casual"}}]
+    with patch.object(service, "get_config", side_effect=lambda user_id: rows[0]) as get_config, \
+            patch.object(service, "supabase", MagicMock()):
+        assert service.get_config_cached("u1")["voice"]["tone"] == "formal"
+        assert service.get_config_cached("u1")["voice"]["tone"] == "formal"
+        reads = get_config.call_count
+
+        rows.pop(0)
+        service.update_voice("u1", {"tone": "casual"})
+        assert service.get_config_cached("u1")["voice"]["tone"] == "casual"
+
+    assert reads == 1
+
+
+def test_config_and_flag_come_from_one_read():
+    config = {"feature_settings": {"blog": False}}
+    with patch.object(service, "get_config", return_value=config) as get_config:
+        assert service.get_config_with_feature_flag("u1", "blog") == (config, False)
+        assert service.get_config_with_feature_flag("u1", "email") == (config, True)
+
+    assert get_config.call_count == 1
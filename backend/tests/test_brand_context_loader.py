@@ -0,0 +1,158 @@
+"""
+Tests for BrandContextLoader.
+
+Covers:
+- Disabled features return "" without building anything
+- Sections are rendered from config and assets
+- A brand with no config content and no assets skips hashing and building
+- Formatted context is reused while config and assets are unchanged, and
+  rebuilt as soon as either changes
+- The prompt-side asset list cache is dropped by asset writes
+- Project owners are cached, misses are not
+"""
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+
+# Importing the loader constructs Supabase-backed service singletons, which
+# refuse to load without these env vars. We never call the real client.
+os.environ.setdefault("SUPABASE_URL", "http://localhost")
+os.environ.setdefault(
+    "SUPABASE_SERVICE_KEY",
+    "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9.eyJyb2xlIjoidGVzdCJ9.test",
+)
+
+from app.config.brand_context_loader import brand_context_loader  # noqa: E402
+
+# app.config re-exports the singleton under the module's own name
+loader_module = sys.modules["app.config.brand_context_loader"]
+
+USER_ID = "user-1234-5678"
+
+CONFIG = {
+    "colors": {"primary": "#111111", "accent": "#222222", "enabled": {"accent": False}},
+    "typography": {"heading_font": "Playfair Display", "body_font": "Inter"},
+    "voice": {"tone": "friendly", "personality": ["warm"], "keywords": []},
+    "best_practices": {"dos": ["Be brief"], "donts": []},
+    "feature_settings": {"blog": True, "mind_map": False},
+}
+
+ASSETS = [
+    {"asset_type": "logo", "name": "Main", "is_primary": True},
+    {"asset_type": "logo", "name": "Alt"},
+    {"asset_type": "icon", "name": "Star", "description": "rating"},
+]
+
+
+@pytest.fixture(autouse=True)
+def clear_context_cache():
+    loader_module._CONTEXT_CACHE.clear()
+    loader_module._OWNER_CACHE.clear()
+    yield
+    loader_module._CONTEXT_CACHE.clear()
+    loader_module._OWNER_CACHE.clear()
+
+
+@pytest.fixture
+def brand_data():
+    """Patch config/asset reads; returns the mutable (config, assets) pair."""
+    config = {**CONFIG}
+    assets = list(ASSETS)
+    with patch.object(
+        loader_module.brand_config_service, "get_config_cached", side_effect=lambda user_id: config,
+    ), patch.object(
+        loader_module.brand_asset_service, "list_assets_cached", side_effect=lambda user_id: assets,
+    ):
+        yield config, assets
+
+
+def test_disabled_feature_returns_empty(brand_data):
+    assert brand_context_loader.load_brand_context("p1", "mind_map", user_id=USER_ID) == ""
+
+
+def test_context_renders_sections(brand_data):
+    context = brand_context_loader.load_brand_context("p1", "blog", user_id=USER_ID)
+
+    assert context.startswith("## Brand Guidelines\n\n### Color Palette\n\n")
+    assert "- **Primary Color**: #111111" in context
+    assert "#222222" not in context  # accent toggled off
+    assert "family=Inter:wght@400;700&family=Playfair+Display:wght@400;700" in context
+    assert "- **Primary Logo**: Main" in context
+    assert "- **Additional Logos Available**: 1" in context
+    assert "  - Star — rating" in context
+    assert "- **Tone**: friendly" in context
+    assert "**Do**:\n- Be brief" in context
+    assert context.endswith("Do NOT substitute with defaults or generic values.\n")
+
+
+def test_unchanged_brand_reuses_formatted_context(brand_data):
+    with patch.object(
+        brand_context_loader, "_build_full_context",
+        wraps=brand_context_loader._build_full_context,
+    ) as build:
+        first = brand_context_loader.load_brand_context("p1", "blog", user_id=USER_ID)
+        second = brand_context_loader.load_brand_context("p1", "blog", user_id=USER_ID)
+
+    assert first == second
+    assert build.call_count == 1
+
+
+def test_changed_config_or_assets_rebuilds(brand_data):
+    config, assets = brand_data
+    first = brand_context_loader.load_brand_context("p1", "blog", user_id=USER_ID)
+
+    config["voice"] = {"tone": "formal"}
+    second = brand_context_loader.load_brand_context("p1", "blog", user_id=USER_ID)
+    assert "- **Tone**: formal" in second and second != first
+
+    assets.append({"asset_type": "icon", "name": "Heart"})
+    third = brand_context_loader.load_brand_context("p1", "blog", user_id=USER_ID)
+    assert "- **Icons Available**: 2" in third
+
+
+def test_empty_brand_returns_empty(brand_data):
+    config, assets = brand_data
+    for key in ("colors", "typography", "voice", "best_practices"):
+        config.pop(key)
+    assets.clear()
+    with patch.object(brand_context_loader, "_build_full_context") as build:
+        assert brand_context_loader.load_brand_context("p1", "blog", user_id=USER_ID) == ""
+
+    build.assert_not_called()
+
+
+def test_fully_disabled_palette_is_omitted():
+    config = {"colors": {"primary": "#111111", "enabled": {"primary": False}}}
+    assert brand_context_loader._build_color_context(config) == ""
+
+
+def test_cached_asset_list_is_dropped_on_write():
+    service = loader_module.brand_asset_service
+    service._invalidate_cached_assets(USER_ID)
+    with patch.object(service, "list_assets", side_effect=[ASSETS, []]) as mock_list, \
+            patch.object(service, "get_asset", return_value={"asset_type": "logo"}), \
+            patch.object(service, "_unset_primary_for_type"), \
+            patch.object(service, "supabase"):
+        assert service.list_assets_cached(USER_ID) == ASSETS
+        assert service.list_assets_cached(USER_ID) == ASSETS
+        assert mock_list.call_count == 1
+
+        service.set_primary(USER_ID, "a1", "logo")
+        assert service.list_assets_cached(USER_ID) == []
+        assert mock_list.call_count == 2
+    service._invalidate_cached_assets(USER_ID)
+
+
+def test_project_owner_is_cached_but_misses_are_not():
+    with patch.object(
+        loader_module.project_service, "get_project_owner_id",
+        side_effect=lambda project_id: USER_ID if project_id == "p1" else None,
+    ) as lookup:
+        assert brand_context_loader._resolve_user_id("p1") == USER_ID
+        assert brand_context_loader._resolve_user_id("p1") == USER_ID
+        assert brand_context_loader._resolve_user_id("gone") is None
+        assert brand_context_loader._resolve_user_id("gone") is None
+
+    assert [c.args[0] for c in lookup.call_args_list] == ["p1", "gone", "gone"]
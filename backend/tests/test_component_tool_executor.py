@@ -0,0 +1,46 @@
+"""
+Tests for the component agent's termination tool.
+
+Covers:
+- The brand logo data URI is inlined into every saved variation
+- The job record only keeps the logo's metadata, not the data URI
+"""
+import os
+from unittest.mock import patch
+
+# The executor imports Supabase-backed services that build a client at
+# import time. Supply dummy creds (only if unset).
+os.environ.setdefault("SUPABASE_URL", "http://localhost")
+os.environ.setdefault(
+    "SUPABASE_SERVICE_KEY",
+    "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9.eyJyb2xlIjoidGVzdCJ9.test",
+)
+
+from app.services.tool_executors import component_tool_executor as executor_module  # noqa: E402
+
+LOGO = {"filename": "logo.png", "placeholder": "BRAND_LOGO", "url": "data:image/png;base64,AAAA"}
+
+
+def test_logo_data_uri_stays_out_of_job_record():
+    components = [
+        {"variation_name": f"V{i}", "html_code": '<body><img src="BRAND_LOGO"></body>'}
+        for i in range(2)
+    ]
+    with patch.object(executor_module, "storage_service") as storage, patch.object(
+        executor_module, "studio_index_service"
+    ) as index:
+        index.get_component_job.return_value = None
+        result, is_termination = executor_module.component_tool_executor.execute_tool(
+            "write_component_code",
+            {"components": components},
+            {"project_id": "p1", "job_id": "j1", "logo_info": LOGO},
+        )
+
+    assert is_termination and result["success"]
+    uploaded = [call.kwargs["content"] for call in storage.upload_studio_file.call_args_list]
+    assert len(uploaded) == 2
+    assert all(LOGO["url"] in html for html in uploaded)
+
+    images = index.update_component_job.call_args.kwargs["images"]
+    assert images == [{"filename": "logo.png", "placeholder": "BRAND_LOGO"}]
+    assert result["images"] == images
@@ -0,0 +1,145 @@
+"""
+Tests for ContextLoader.get_active_sources.
+
+Covers:
+- Legacy chats (no selection) ask the DB for ready + globally active sources
+- A selection is pushed into the query as an id filter
+- An explicitly empty selection returns [] without querying
+- Source types are formatted from the extension, then the category
+- The source context block renders one entry per source
+- Memory context reads user + project memory in one query
+- build_full_context runs the memory and MCP lookups concurrently and keeps
+  the section order
+"""
+import os
+import threading
+from unittest.mock import MagicMock, patch
+
+# Importing the loader constructs Supabase-backed service singletons, which
+# refuse to load without these env vars. We never call the real client.
+os.environ.setdefault("SUPABASE_URL", "http://localhost")
+os.environ.setdefault(
+    "SUPABASE_SERVICE_KEY",
+    "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9.eyJyb2xlIjoidGVzdCJ9.test",
+)
+
+from app.config.context_loader import context_loader  # noqa: E402
+from app.services.ai_services.memory_service import memory_service  # noqa: E402
+from app.services.data_services.project_service import project_service  # noqa: E402
+from app.services.source_services import source_service  # noqa: E402
+
+SOURCES = [{"id": "s1", "name": "Doc", "status": "ready", "active": True}]
+
+
+def test_legacy_chat_filters_on_active_flag():
+    with patch.object(
+        source_service, "list_sources_for_context", return_value=SOURCES,
+    ) as mock_list:
+        assert context_loader.get_active_sources("p1") == SOURCES
+
+    mock_list.assert_called_once_with("p1", ready_only=True, active_only=True)
+
+
+def test_selection_is_filtered_in_query():
+    with patch.object(
+        source_service, "list_sources_for_context", return_value=SOURCES,
+    ) as mock_list:
+        assert context_loader.get_active_sources("p1", ["s1", "s2"]) == SOURCES
+
+    mock_list.assert_called_once_with("p1", source_ids=["s1", "s2"], ready_only=True)
+
+
+def test_empty_selection_skips_query():
+    with patch.object(source_service, "list_sources_for_context") as mock_list:
+        assert context_loader.get_active_sources("p1", []) == []
+
+    mock_list.assert_not_called()
+
+
+def test_format_source_type_prefers_extension_then_category():
+    fmt = context_loader._format_source_type
+    assert fmt("document", ".pdf") == "PDF Document"
+    assert fmt("video", ".mov") == "Video"
+    assert fmt("spreadsheet", ".ods") == "Spreadsheet"
+
+
+def test_build_source_context_renders_each_source():
+    sources = [
+        {
+            "id": "s1", "name": "Sales", "type": "document",
+            "embedding_info": {"file_extension": ".csv", "is_embedded": False},
+            "summary_info": {"summary": "Q1 numbers"},
+        },
+    ]
+    context = context_loader.build_source_context("p1", active_sources=sources)
+
+    assert context.startswith("\n## Available Sources\n")
+    assert (
+        "- **Sales**\n"
+        "  - ID: `s1`\n"
+        "  - Type: CSV Spreadsheet\n"
+        "  - Embedded: No\n"
+        "  - Chat tool: analyze_csv_agent (for calculations/plots)\n"
+        "  - Summary: Q1 numbers\n"
+        "\n"
+    ) in context
+    assert context.endswith("analyze_freshdesk_agent).\n")
+
+
+def test_build_source_context_without_sources_is_empty():
+    assert context_loader.build_source_context("p1", active_sources=[]) == ""
+
+
+def test_memory_context_uses_combined_fetch():
+    with patch.object(
+        memory_service, "get_memories",
+        return_value={"user": "Call me Sam", "project": None},
+    ) as mock_get:
+        context = context_loader.build_memory_context("p1", user_id="u1")
+
+    mock_get.assert_called_once_with("p1", user_id="u1")
+    assert "### User Memory\nCall me Sam\n" in context
+    assert "Project Memory" not in context
+
+
+def test_get_memories_reads_project_and_owner_in_one_query():
+    client = MagicMock()
+    query = client.table.return_value.select.return_value.eq.return_value.eq.return_value
+    query.execute.return_value.data = [
+        {"memory": {"memory": "Launch in May"}, "owner": {"memory": {"memory": "Call me Sam"}}},
+    ]
+    with patch.object(project_service, "supabase", client):
+        memories = project_service.get_memories("p1", user_id="u1")
+
+    assert memories == {"user": "Call me Sam", "project": "Launch in May"}
+    client.table.assert_called_once_with("projects")
+
+
+def test_full_context_overlaps_lookups_and_keeps_order():
+    # Both lookups must be in flight at once to get past the barrier
+    barrier = threading.Barrier(2, timeout=2)
+
+    def memory(project_id, user_id=None):
+        barrier.wait()
+        return "MEMORY"
+
+    def mcp(user_id=None):
+        barrier.wait()
+        return "MCP"
+
+    with patch.object(context_loader, "build_memory_context", side_effect=memory), \
+            patch.object(context_loader, "build_mcp_tools_context", side_effect=mcp):
+        context = context_loader.build_full_context("p1", user_id="u1", active_sources=SOURCES)
+
+    memory_at, sources_at, mcp_at = (
+        context.index("MEMORY"), context.index("## Available Sources"), context.index("MCP")
+    )
+    assert memory_at < sources_at < mcp_at
+
+
+def test_full_context_without_user_skips_mcp():
+    with patch.object(context_loader, "build_memory_context", return_value=""), \
+            patch.object(context_loader, "build_mcp_tools_context") as mcp:
+        assert context_loader.build_full_context("p1", active_sources=[]) == ""
+
+    mcp.assert_not_called()
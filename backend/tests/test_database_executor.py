@@ -0,0 +1,126 @@
+"""
+Tests for the database executor's connection reuse across runs.
+
+Covers:
+- A released connection is reused by the next executor for the same source
+- Changed credentials never reuse a pooled connection
+- A dead pooled connection is replaced with a fresh one
+- Idle connections past their TTL are closed, not reused
+- The sweep closes expired idle connections without waiting for a checkout
+"""
+import os
+from unittest.mock import patch
+
+import pytest
+
+os.environ.setdefault("SUPABASE_URL", "http://localhost")
+os.environ.setdefault(
+    "SUPABASE_SERVICE_KEY",
+    "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9.eyJyb2xlIjoidGVzdCJ9.test",
+)
+
+from app.services.tool_executors import database_executor  # noqa: E402
+from app.services.tool_executors.database_executor import (  # noqa: E402
+    DatabaseExecutor,
+    _ResolvedConnection,
+)
+
+RESOLVED = _ResolvedConnection("c1", "mysql", "mysql://u:p@db/app")
+
+
+class FakeConn:
+    def __init__(self, alive=True):
+        self.alive = alive
+        self.closed = False
+
+    def ping(self, reconnect=False):
+        if not self.alive:
+            raise ConnectionError("gone")
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture(autouse=True)
+def empty_pool():
+    database_executor._idle_pool.clear()
+    # Keep the background sweeper out of the tests
+    with patch.object(database_executor, "_start_idle_sweeper"):
+        yield
+    database_executor._idle_pool.clear()
+
+
+def _executor(resolved=RESOLVED) -> DatabaseExecutor:
+    executor = DatabaseExecutor()
+    executor._resolve_connection = lambda project_id, source_id: resolved
+    return executor
+
+
+def test_released_connection_is_reused_by_next_run():
+    with patch.object(DatabaseExecutor, "_connect", side_effect=lambda *a: FakeConn()) as connect:
+        first = _executor()
+        conn, _ = first._get_connection("p1", "s1")
+        first.release_connections()
+
+        second = _executor()
+        assert second._get_connection("p1", "s1")[0] is conn
+
+    assert connect.call_count == 1
+    assert not conn.closed
+
+
+def test_changed_credentials_do_not_reuse_pooled_connection():
+    with patch.object(DatabaseExecutor, "_connect", side_effect=lambda *a: FakeConn()) as connect:
+        first = _executor()
+        old, _ = first._get_connection("p1", "s1")
+        first.release_connections()
+
+        rotated = _ResolvedConnection("c1", "mysql", "mysql://u:new@db/app")
+        new, _ = _executor(rotated)._get_connection("p1", "s1")
+
+    assert new is not old
+    assert connect.call_count == 2
+
+
+def test_dead_pooled_connection_is_replaced():
+    dead = FakeConn(alive=False)
+    database_executor._release_idle(RESOLVED, dead)
+
+    with patch.object(DatabaseExecutor, "_connect", return_value=FakeConn()) as connect:
+        conn, _ = _executor()._get_connection("p1", "s1")
+
+    assert conn is not dead
+    assert dead.closed
+    connect.assert_called_once()
+
+
+def test_expired_idle_connection_is_closed():
+    stale = FakeConn()
+    database_executor._release_idle(RESOLVED, stale)
+
+    with patch.object(database_executor, "_POOL_IDLE_TTL", 0), \
+            patch.object(DatabaseExecutor, "_connect", return_value=FakeConn()) as connect:
+        conn, _ = _executor()._get_connection("p1", "s1")
+
+    assert conn is not stale
+    assert stale.closed
+    connect.assert_called_once()
+
+
+def test_sweep_closes_expired_idle_connections():
+    stale = FakeConn()
+    database_executor._release_idle(RESOLVED, stale)
+
+    assert database_executor.sweep_idle_connections() == 0
+    assert not stale.closed
+
+    with patch.object(database_executor, "_POOL_IDLE_TTL", 0):
+        assert database_executor.sweep_idle_connections() == 1
+
+    assert stale.closed
+    assert database_executor._idle_pool == {}
+
+
+def test_parking_a_connection_starts_the_sweeper():
+    database_executor._release_idle(RESOLVED, FakeConn())
+    database_executor._start_idle_sweeper.assert_called_once()
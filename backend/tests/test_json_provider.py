@@ -0,0 +1,93 @@
+"""
+Tests for the orjson-backed Flask JSON provider.
+
+Covers:
+- jsonify output round-trips through orjson
+- Flask-compatible fallbacks (datetime as HTTP date, Decimal/UUID as str)
+- request.get_json parsing and malformed-body handling
+- Key order, debug indentation and stdlib fallbacks match DefaultJSONProvider
+"""
+import uuid
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from flask import Flask, jsonify, request
+from flask.json.provider import DefaultJSONProvider
+
+from app.utils.json_provider import OrjsonProvider
+
+
+def _make_app() -> Flask:
+    app = Flask(__name__)
+    app.json = OrjsonProvider(app)
+    return app
+
+
+def test_jsonify_uses_orjson_and_preserves_types():
+    app = _make_app()
+    with app.test_request_context():
+        response = jsonify({"success": True, "jobs": [{"id": 1, "n": 2.5}], 3: "x"})
+    assert response.mimetype == "application/json"
+    assert response.get_json() == {"success": True, "jobs": [{"id": 1, "n": 2.5}], "3": "x"}
+
+
+def test_fallbacks_match_default_provider():
+    app = _make_app()
+    job_id = uuid.UUID("12345678-1234-5678-1234-567812345678")
+    when = datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    payload = app.json.loads(app.json.dumps({
+        "id": job_id, "cost": Decimal("1.50"), "at": when,
+    }))
+    assert payload == {
+        "id": str(job_id),
+        "cost": "1.50",
+        "at": "Tue, 02 Jan 2024 03:04:05 GMT",
+    }
+
+
+def test_request_get_json_parses_with_provider():
+    app = _make_app()
+
+    @app.route("/echo", methods=["POST"])
+    def echo():
+        return jsonify(request.get_json())
+
+    client = app.test_client()
+    response = client.post("/echo", json={"topic": "ünïcode", "platforms": ["x"]})
+    assert response.get_json() == {"topic": "ünïcode", "platforms": ["x"]}
+
+    bad = client.post("/echo", data="{not json", content_type="application/json")
+    assert bad.status_code == 400
+
+
+def test_keys_are_sorted_like_default_provider():
+    app = _make_app()
+    payload = {"b": 1, "a": {"z": 2, "y": 3}}
+    assert app.json.dumps(payload) == '{"a":{"y":3,"z":2},"b":1}'
+    with app.test_request_context():
+        assert jsonify(payload).data == b'{"a":{"y":3,"z":2},"b":1}\n'
+
+
+def test_debug_responses_are_indented():
+    app = _make_app()
+    app.debug = True
+    with app.test_request_context():
+        body = jsonify({"a": 1}).get_data(as_text=True)
+    assert body == '{\n  "a": 1\n}\n'
+
+
+def test_big_ints_fall_back_to_stdlib():
+    app = _make_app()
+    big = 2 ** 70
+    assert app.json.loads(app.json.dumps({"n": big})) == {"n": big}
+    with app.test_request_context():
+        response = jsonify({"n": big})
+    assert response.status_code == 200
+    assert response.get_json() == {"n": big}
+
+
+def test_explicit_kwargs_are_honoured():
+    app = _make_app()
+    payload = {"b": 1, "a": "é"}
+    assert app.json.dumps(payload, indent=4, sort_keys=False) == \
+        DefaultJSONProvider(app).dumps(payload, indent=4, sort_keys=False)
@@ -0,0 +1,112 @@
+"""
+Tests for the presentation PPTX download route.
+
+Covers:
+- A job with recorded pptx_size/pptx_mtime downloads with ETag + Last-Modified
+- A re-download with the validators gets an empty 304 without touching storage
+- HEAD is answered from the job record alone
+- Screenshots are served as WebP only to an explicit image/webp Accept on
+  jobs that recorded has_webp
+"""
+import os
+import time
+from unittest.mock import patch
+
+import pytest
+from flask import Flask
+
+os.environ.setdefault("SUPABASE_URL", "http://localhost")
+os.environ.setdefault(
+    "SUPABASE_SERVICE_KEY",
+    "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9.eyJyb2xlIjoidGVzdCJ9.test",
+)
+
+from app.api.studio import presentations, studio_bp  # noqa: E402
+
+JOB = {
+    "id": "j1",
+    "pptx_file": "deck.pptx",
+    "pptx_filename": "Deck.pptx",
+    "pptx_size": 5,
+    "pptx_mtime": time.time(),
+}
+URL = "/projects/p1/studio/presentations/j1/download"
+
+
+@pytest.fixture(autouse=True)
+def allow_project_access():
+    with patch("app.api.studio.verify_project_access", return_value=None):
+        yield
+
+
+def _client():
+    app = Flask(__name__)
+    app.register_blueprint(studio_bp)
+    return app.test_client()
+
+
+def test_download_sets_validators():
+    with patch.object(presentations.studio_index_service, "get_presentation_job", return_value=JOB), \
+            patch.object(presentations.storage_service, "download_studio_binary", return_value=b"pptx!"):
+        response = _client().get(URL)
+
+    assert response.status_code == 200
+    assert response.data == b"pptx!"
+    assert response.headers["ETag"] == f'"j1-5-{int(JOB["pptx_mtime"])}"'
+    assert "Last-Modified" in response.headers
+
+
+def test_redownload_is_304_without_storage():
+    with patch.object(presentations.studio_index_service, "get_presentation_job", return_value=JOB), \
+            patch.object(presentations.storage_service, "download_studio_binary", return_value=b"pptx!") as download:
+        client = _client()
+        first = client.get(URL)
+        by_etag = client.get(URL, headers={"If-None-Match": first.headers["ETag"]})
+        by_date = client.get(URL, headers={"If-Modified-Since": first.headers["Last-Modified"]})
+
+    assert by_etag.status_code == 304
+    assert by_date.status_code == 304
+    assert download.call_count == 1
+
+
+def test_head_is_answered_from_job_record():
+    with patch.object(presentations.studio_index_service, "get_presentation_job", return_value=JOB), \
+            patch.object(presentations.storage_service, "download_studio_binary") as download:
+        response = _client().head(URL)
+
+    assert response.status_code == 200
+    assert response.headers["Content-Length"] == "5"
+    assert "Last-Modified" in response.headers
+    download.assert_not_called()
+
+
+SHOT_URL = "/projects/p1/studio/presentations/j1/screenshots/slide_01.png"
+
+
+def _fetch_screenshot(accept, job):
+    def fake_download(project_id, job_type, job_id, filename):
+        return filename.encode()
+
+    with patch.object(presentations.studio_index_service, "get_job_for_poll", return_value=job), \
+            patch.object(presentations.storage_service, "download_studio_binary",
+                         side_effect=fake_download) as download:
+        response = _client().get(SHOT_URL, headers={"Accept": accept})
+    return response, [c.args[3] for c in download.call_args_list]
+
+
+def test_screenshot_webp_only_for_explicit_accept():
+    job = {"id": "j1", "has_webp": True}
+
+    response, fetched = _fetch_screenshot("image/webp,*/*;q=0.8", job)
+    assert response.data == b"screenshots/slide_01.webp"
+    assert "Accept" in response.headers["Vary"]
+
+    response, fetched = _fetch_screenshot("image/*,*/*", job)
+    assert response.data == b"screenshots/slide_01.png"
+    assert fetched == ["screenshots/slide_01.png"]
+
+
+def test_screenshot_skips_webp_probe_for_old_jobs():
+    response, fetched = _fetch_screenshot("image/webp", {"id": "j1"})
+    assert response.data == b"screenshots/slide_01.png"
+    assert fetched == ["screenshots/slide_01.png"]
@@ -0,0 +1,43 @@
+"""
+Tests for source_index_service.list_sources_for_context.
+
+Covers:
+- A small id selection is filtered in the query
+- A large selection is filtered in Python so the URL stays short
+"""
+from unittest.mock import MagicMock, patch
+
+from app.services.source_services import source_index_service
+
+
+def _query(rows):
+    query = MagicMock()
+    for name in ("select", "eq", "in_", "order"):
+        getattr(query, name).return_value = query
+    query.execute.return_value = MagicMock(data=rows)
+    client = MagicMock()
+    client.table.return_value = query
+    return client, query
+
+
+def _row(source_id):
+    return {"id": source_id, "name": source_id, "status": "ready"}
+
+
+def test_small_selection_filters_in_query():
+    client, query = _query([_row("s1")])
+    with patch.object(source_index_service, "_get_client", return_value=client):
+        sources = source_index_service.list_sources_for_context("p1", source_ids=["s1"])
+
+    query.in_.assert_called_once_with("id", ["s1"])
+    assert [s["id"] for s in sources] == ["s1"]
+
+
+def test_large_selection_filters_in_python():
+    wanted = [f"s{i}" for i in range(source_index_service._MAX_ID_FILTER + 1)]
+    client, query = _query([_row("s0"), _row("other"), _row("s5")])
+    with patch.object(source_index_service, "_get_client", return_value=client):
+        sources = source_index_service.list_sources_for_context("p1", source_ids=iter(wanted))
+
+    query.in_.assert_not_called()
+    assert [s["id"] for s in sources] == ["s0", "s5"]
@@ -251,3 +251,115 @@ class TestListSourceChunks:
 
         assert len(chunks) == 1
         assert chunks[0]["chunk_id"] == "src1_page_1_chunk_2"
+
+
+# ===========================================================================
+# Studio filename safety check
+# ===========================================================================
+
+class TestIsSafeStudioFilename:
+    """Caller-supplied filenames must stay inside the job's storage prefix."""
+
+    @pytest.mark.parametrize("filename", [
+        "slide_01.html",
+        "base-styles.css",
+        "slides/slide_02.html",
+        "assets/img/logo.png",
+    ])
+    def test_accepts_relative_names(self, filename):
+        assert storage_service.is_safe_studio_filename(filename) is True
+
+    @pytest.mark.parametrize("filename", [
+        "",
+        "/etc/passwd",
+        "../other-job/slide_01.html",
+        "slides/../../x.png",
+        "slides//slide.html",
+        "./slide.html",
+        "..\\secret.png",
+    ])
+    def test_rejects_traversal(self, filename):
+        assert storage_service.is_safe_studio_filename(filename) is False
+
+
+class TestIterStudioBinaries:
+
+    def test_yields_in_request_order(self):
+        """Results line up with filenames even when downloads finish out of order."""
+        import time
+
+        def fake_download(project_id, job_type, job_id, filename):
+            time.sleep(0.05 if filename == "a.html" else 0)
+            return None if filename == "missing.png" else filename.encode()
+
+        with patch.object(storage_service, "download_studio_binary", side_effect=fake_download):
+            results = list(storage_service.iter_studio_binaries(
+                "p1", "websites", "j1", ["a.html", "missing.png", "assets/b.png"]
+            ))
+
+        assert results == [b"a.html", None, b"assets/b.png"]
+
+    def test_iter_keeps_a_bounded_window_of_downloads(self):
+        started = []
+
+        def fake_download(project_id, job_type, job_id, filename):
+            started.append(filename)
+            return filename.encode()
+
+        filenames = [f"f{i}.png" for i in range(50)]
+        with patch.object(storage_service, "download_studio_binary", side_effect=fake_download):
+            results = storage_service.iter_studio_binaries("p1", "websites", "j1", filenames)
+            assert next(results) == b"f0.png"
+            # Ten in flight to start with, plus one refill for the consumed result
+            assert len(started) <= 11
+            assert list(results) == [name.encode() for name in filenames[1:]]
+
+    def test_empty_list_downloads_nothing(self):
+        with patch.object(storage_service, "download_studio_binary") as mock_download:
+            assert storage_service.download_studio_binaries("p1", "websites", "j1", []) == []
+        mock_download.assert_not_called()
+
+
+class TestOpenStudioBinaryStream:
+
+    @pytest.fixture
+    def storage_client(self, patch_storage_client):
+        mock_client, _ = patch_storage_client
+        mock_client.storage_url = "http://storage.local/storage/v1/"
+        mock_client.options.headers = {"apiKey": "key", "Authorization": "Bearer key"}
+        return mock_client
+
+    @staticmethod
+    def _http(handler):
+        import httpx
+        return patch.object(
+            storage_service, "_stream_http_client",
+            return_value=httpx.Client(transport=httpx.MockTransport(handler)),
+        )
+
+    def test_streams_object_and_forwards_headers(self, storage_client):
+        seen = {}
+
+        def handler(request):
+            import httpx
+            seen["url"] = str(request.url)
+            seen["if_none_match"] = request.headers.get("If-None-Match")
+            seen["authorization"] = request.headers.get("Authorization")
+            return httpx.Response(200, content=b"png-bytes", headers={"ETag": '"abc"'})
+
+        with self._http(handler):
+            response = storage_service.open_studio_binary_stream(
+                "p1", "websites", "j1", "assets/a.png", headers={"If-None-Match": '"old"'}
+            )
+
+        assert seen["url"] == "http://storage.local/storage/v1/object/studio-outputs/p1/websites/j1/assets/a.png"
+        assert seen["if_none_match"] == '"old"'
+        assert seen["authorization"] == "Bearer key"
+        assert response.status_code == 200
+        assert b"".join(response.iter_bytes()) == b"png-bytes"
+        response.close()
+
+    def test_missing_object_returns_none(self, storage_client):
+        import httpx
+        with self._http(lambda request: httpx.Response(400, json={"error": "not_found"})):
+            assert storage_service.open_studio_binary_stream("p1", "websites", "j1", "nope.png") is None
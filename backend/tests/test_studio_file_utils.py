@@ -0,0 +1,169 @@
+"""
+Tests for studio file response helpers.
+
+Covers:
+- Range requests return 206 with the requested slice
+- If-Range / If-None-Match validate against the content ETag
+- iter_zip streams a valid archive one entry at a time
+- relay_storage_stream passes storage bodies and 304s through, and always
+  closes the upstream
+"""
+import io
+import zipfile
+
+from flask import Flask, Response
+
+from app.api.studio.file_utils import (
+    content_etag,
+    iter_zip,
+    relay_storage_stream,
+    send_studio_bytes,
+    set_attachment_filename,
+    zip_compress_type,
+)
+
+DATA = b"0123456789" * 100
+
+
+def _make_app() -> Flask:
+    app = Flask(__name__)
+
+    @app.route("/file")
+    def serve():
+        return send_studio_bytes(DATA, "screenshots/slide_01.png")
+
+    return app
+
+
+def test_full_response_advertises_ranges_and_etag():
+    response = _make_app().test_client().get("/file")
+    assert response.status_code == 200
+    assert response.mimetype == "image/png"
+    assert response.headers["Accept-Ranges"] == "bytes"
+    assert response.headers["ETag"] == f'"{content_etag(DATA)}"'
+    assert response.data == DATA
+
+
+def test_range_request_returns_partial_content():
+    client = _make_app().test_client()
+    etag = f'"{content_etag(DATA)}"'
+    response = client.get("/file", headers={"Range": "bytes=10-19", "If-Range": etag})
+    assert response.status_code == 206
+    assert response.data == DATA[10:20]
+
+    stale = client.get("/file", headers={"Range": "bytes=10-19", "If-Range": '"stale"'})
+    assert stale.status_code == 200
+    assert stale.data == DATA
+
+
+def test_if_none_match_returns_not_modified():
+    client = _make_app().test_client()
+    etag = f'"{content_etag(DATA)}"'
+    response = client.get("/file", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+
+def test_iter_zip_yields_per_entry_and_builds_valid_archive():
+    consumed = []
+
+    def entries():
+        for name, data in [("index.html", "<h1>Hi</h1>"), ("missing.css", None), ("assets/a.png", DATA)]:
+            consumed.append(name)
+            yield name, data
+
+    stream = iter_zip(entries())
+    first = next(stream)
+    # Only the first entry has been fetched when its bytes are yielded
+    assert consumed == ["index.html"]
+    assert first
+
+    archive = first + b"".join(stream)
+    with zipfile.ZipFile(io.BytesIO(archive)) as zf:
+        assert zf.namelist() == ["index.html", "assets/a.png"]
+        assert zf.read("index.html") == b"<h1>Hi</h1>"
+        assert zf.read("assets/a.png") == DATA
+        assert zf.getinfo("index.html").compress_type == zipfile.ZIP_DEFLATED
+        assert zf.getinfo("assets/a.png").compress_type == zipfile.ZIP_STORED
+
+
+def test_zip_compress_type_by_extension():
+    assert zip_compress_type("styles.css") == zipfile.ZIP_DEFLATED
+    assert zip_compress_type("README") == zipfile.ZIP_DEFLATED
+    assert zip_compress_type("assets/Photo.JPG") == zipfile.ZIP_STORED
+    assert zip_compress_type("Deck.pptx") == zipfile.ZIP_STORED
+
+
+def test_set_attachment_filename_handles_non_ascii():
+    response = Response(b"")
+    set_attachment_filename(response, "Café Site.zip")
+    disposition = response.headers["Content-Disposition"]
+    assert disposition.startswith("attachment")
+    assert "filename*=UTF-8''Caf%C3%A9%20Site.zip" in disposition
+
+
+def _upstream(status, content=b"", headers=None):
+    import httpx
+    return httpx.Response(status, content=content, headers=headers or {})
+
+
+def test_relay_storage_stream_passes_body_and_validators():
+    app = Flask(__name__)
+
+    @app.route("/asset")
+    def asset():
+        return relay_storage_stream(
+            _upstream(200, DATA, {"ETag": '"abc"', "Content-Length": str(len(DATA))}),
+            "image/png",
+            chunk_size=64,
+        )
+
+    response = app.test_client().get("/asset")
+    assert response.status_code == 200
+    assert response.mimetype == "image/png"
+    assert response.headers["ETag"] == '"abc"'
+    assert response.data == DATA
+
+
+def test_relay_storage_stream_turns_upstream_304_into_empty_304():
+    app = Flask(__name__)
+
+    @app.route("/asset")
+    def asset():
+        return relay_storage_stream(_upstream(304, headers={"ETag": '"abc"'}), "image/png")
+
+    response = app.test_client().get("/asset")
+    assert response.status_code == 304
+    assert response.data == b""
+    assert response.headers["ETag"] == '"abc"'
+
+
+def test_relay_storage_stream_closes_upstream_on_head():
+    import httpx
+    app = Flask(__name__)
+    upstream = httpx.Response(200, stream=httpx.ByteStream(DATA))
+
+    @app.route("/asset")
+    def asset():
+        return relay_storage_stream(upstream, "image/png")
+
+    response = app.test_client().head("/asset")
+    response.close()  # what the WSGI server does once it has sent the headers
+    assert response.status_code == 200
+    assert upstream.is_closed
+
+
+def test_relay_storage_stream_drops_length_of_encoded_body():
+    import gzip
+    app = Flask(__name__)
+    encoded = gzip.compress(DATA)
+
+    @app.route("/asset")
+    def asset():
+        return relay_storage_stream(
+            _upstream(200, encoded, {"Content-Encoding": "gzip", "Content-Length": str(len(encoded))}),
+            "image/png",
+        )
+
+    response = app.test_client().get("/asset")
+    assert response.data == DATA
+    assert response.headers.get("Content-Length") != str(len(encoded))
@@ -0,0 +1,71 @@
+"""
+Tests for the studio job SSE stream.
+
+Covers:
+- Unknown job returns a 404 instead of opening a stream
+- A status event is pushed per change, and the stream ends at a terminal status
+- Unchanged re-reads don't emit duplicate events
+"""
+from unittest.mock import patch
+
+import pytest
+from flask import Flask
+
+from app.api.studio import job_events, studio_bp
+from app.services.studio_services import studio_index_service
+from app.utils.json_provider import OrjsonProvider
+
+URL = "/api/v1/projects/p1/studio/jobs/j1/events"
+
+
+@pytest.fixture(autouse=True)
+def allow_project_access():
+    with patch("app.api.studio.verify_project_access", return_value=None):
+        yield
+
+
+def _client():
+    app = Flask(__name__)
+    app.json = OrjsonProvider(app)
+    app.register_blueprint(studio_bp, url_prefix="/api/v1")
+    return app.test_client()
+
+
+def _job(status, updated_at):
+    return {"id": "j1", "status": status, "updated_at": updated_at}
+
+
+def test_unknown_job_returns_404():
+    with patch.object(studio_index_service, "get_job_for_poll", return_value=None):
+        response = _client().get(URL)
+    assert response.status_code == 404
+
+
+def test_stream_pushes_changes_until_terminal():
+    reads = [
+        _job("pending", "t0"),
+        _job("processing", "t1"),
+        _job("processing", "t1"),
+        _job("ready", "t2"),
+    ]
+    with patch.object(studio_index_service, "get_job_for_poll", side_effect=reads), \
+            patch.object(job_events.studio_index_service, "wait_for_job_change"):
+        response = _client().get(URL)
+        body = response.get_data(as_text=True)
+
+    assert response.headers["Content-Type"] == "text/event-stream"
+    assert response.headers["Cache-Control"] == "no-cache, no-transform"
+    assert body.count("event: status") == 3
+    assert '"status":"pending"' in body
+    assert '"status":"ready"' in body
+    assert body.rstrip().endswith("}")
+
+
+def test_deleted_job_emits_gone():
+    with patch.object(
+        studio_index_service, "get_job_for_poll",
+        side_effect=[_job("processing", "t0"), None],
+    ), patch.object(job_events.studio_index_service, "wait_for_job_change"):
+        body = _client().get(URL).get_data(as_text=True)
+
+    assert "event: gone" in body
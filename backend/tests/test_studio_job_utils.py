@@ -0,0 +1,54 @@
+"""
+Tests for the studio job status response helper.
+
+Covers:
+- First poll returns the job with an ETag derived from updated_at
+- A repeat poll with If-None-Match gets an empty 304
+- A changed updated_at invalidates the old ETag
+"""
+from flask import Flask
+
+from app.api.studio.job_utils import job_etag, job_status_response
+
+JOB = {"id": "j1", "status": "processing", "updated_at": "2026-01-01T00:00:00+00:00"}
+
+
+def _make_app(job) -> Flask:
+    app = Flask(__name__)
+
+    @app.route("/job")
+    def status():
+        return job_status_response(job)
+
+    return app
+
+
+def test_first_poll_returns_job_with_etag():
+    response = _make_app(JOB).test_client().get("/job")
+    assert response.status_code == 200
+    assert response.get_json() == {"success": True, "job": JOB}
+    assert response.headers["ETag"] == f'"{job_etag(JOB)}"'
+    assert response.headers["Cache-Control"] == "private, no-cache"
+
+
+def test_unchanged_job_returns_304():
+    client = _make_app(JOB).test_client()
+    etag = client.get("/job").headers["ETag"]
+    response = client.get("/job", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.data == b""
+
+
+def test_updated_job_gets_new_body():
+    old_etag = f'"{job_etag(JOB)}"'
+    updated = {**JOB, "status": "ready", "updated_at": "2026-01-01T00:00:05+00:00"}
+    response = _make_app(updated).test_client().get("/job", headers={"If-None-Match": old_etag})
+    assert response.status_code == 200
+    assert response.get_json()["job"]["status"] == "ready"
+
+
+def test_job_without_updated_at_has_no_etag():
+    job = {"id": "j1", "status": "ready"}
+    response = _make_app(job).test_client().get("/job")
+    assert response.status_code == 200
+    assert "ETag" not in response.headers
@@ -0,0 +1,134 @@
+"""
+Tests for the single-flight status-poll cache in studio_index_service.
+
+get_job_for_poll / list_jobs_for_poll should collapse concurrent polls for
+the same key into one index read, reuse the result briefly (longer once the
+job has finished), and drop cached results when the job is written.
+"""
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from app.services.studio_services import studio_index_service
+
+
+@pytest.fixture(autouse=True)
+def clear_poll_cache():
+    def clear():
+        studio_index_service._POLL_CACHE.clear()
+        studio_index_service._LIST_POLL_CACHE.clear()
+        studio_index_service._POLL_INFLIGHT.clear()
+
+    clear()
+    yield
+    clear()
+
+
+def test_concurrent_polls_share_one_read():
+    calls = []
+
+    def slow_get_job(project_id, job_id):
+        calls.append(job_id)
+        time.sleep(0.05)
+        return {"id": job_id, "status": "processing"}
+
+    results = []
+    with patch.object(studio_index_service, "get_job", side_effect=slow_get_job):
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(studio_index_service.get_job_for_poll("p1", "j1"))
+            )
+            for _ in range(8)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+    assert calls == ["j1"]
+    assert len(results) == 8
+    assert all(r == {"id": "j1", "status": "processing"} for r in results)
+
+
+def test_different_jobs_are_cached_separately():
+    with patch.object(
+        studio_index_service, "get_job",
+        side_effect=lambda p, j: {"id": j},
+    ) as mock_get:
+        assert studio_index_service.get_job_for_poll("p1", "j1") == {"id": "j1"}
+        assert studio_index_service.get_job_for_poll("p1", "j2") == {"id": "j2"}
+        assert studio_index_service.get_job_for_poll("p1", "j1") == {"id": "j1"}
+
+    assert mock_get.call_count == 2
+
+
+def test_missing_job_is_cached_as_none():
+    with patch.object(studio_index_service, "get_job", return_value=None) as mock_get:
+        assert studio_index_service.get_job_for_poll("p1", "gone") is None
+        assert studio_index_service.get_job_for_poll("p1", "gone") is None
+
+    assert mock_get.call_count == 1
+
+
+def test_entry_expires_after_ttl():
+    with patch.object(
+        studio_index_service, "get_job",
+        side_effect=[{"status": "processing"}, {"status": "ready"}],
+    ):
+        assert studio_index_service.get_job_for_poll("p1", "j1")["status"] == "processing"
+        time.sleep(0.3)
+        assert studio_index_service.get_job_for_poll("p1", "j1")["status"] == "ready"
+
+
+def test_finished_job_is_kept_longer():
+    with patch.object(
+        studio_index_service, "get_job",
+        side_effect=[{"status": "ready"}, {"status": "ready"}],
+    ) as mock_get:
+        studio_index_service.get_job_for_poll("p1", "j1")
+        time.sleep(0.3)
+        studio_index_service.get_job_for_poll("p1", "j1")
+
+    assert mock_get.call_count == 1
+
+
+def test_update_job_invalidates_cached_job():
+    # update_job reads the row itself, so serve whatever the "DB" holds now
+    row = {"status": "ready"}
+    with patch.object(
+        studio_index_service, "get_job", side_effect=lambda p, j: dict(row),
+    ), patch.object(studio_index_service, "_get_client", side_effect=RuntimeError("offline")):
+        assert "title" not in studio_index_service.get_job_for_poll("p1", "j1")
+        row["title"] = "new"
+        studio_index_service.update_job("p1", "j1", title="new")
+        assert studio_index_service.get_job_for_poll("p1", "j1")["title"] == "new"
+
+
+def test_list_poll_cache_is_invalidated_by_project_writes():
+    with patch.object(
+        studio_index_service, "list_jobs",
+        side_effect=[[{"id": "j1", "status": "ready"}], []],
+    ) as mock_list, patch.object(
+        studio_index_service, "_get_client", side_effect=RuntimeError("offline"),
+    ):
+        assert studio_index_service.list_jobs_for_poll("p1", "website") == [{"id": "j1", "status": "ready"}]
+        assert studio_index_service.list_jobs_for_poll("p1", "website") == [{"id": "j1", "status": "ready"}]
+        assert mock_list.call_count == 1
+
+        studio_index_service.delete_job("p1", "j1")
+        assert studio_index_service.list_jobs_for_poll("p1", "website") == []
+        assert mock_list.call_count == 2
+
+
+def test_failed_read_is_not_cached_and_releases_key():
+    with patch.object(studio_index_service, "get_job", side_effect=RuntimeError("index down")):
+        with pytest.raises(RuntimeError):
+            studio_index_service.get_job_for_poll("p1", "j1")
+
+    assert studio_index_service._POLL_INFLIGHT == {}
+    assert ("job", "p1", "j1") not in studio_index_service._POLL_CACHE
+
+    with patch.object(studio_index_service, "get_job", return_value={"id": "j1", "status": "completed"}):
+        assert studio_index_service.get_job_for_poll("p1", "j1")["id"] == "j1"
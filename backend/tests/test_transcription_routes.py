@@ -0,0 +1,44 @@
+"""
+Tests for the transcription status endpoint.
+
+Covers:
+- Status carries an ETag derived from the configured flag
+- A matching If-None-Match gets an empty 304
+- Adding the API key changes the ETag
+"""
+from flask import Flask
+
+from app.api.transcription import transcription_bp
+
+URL = "/transcription/status"
+
+
+def _client():
+    app = Flask(__name__)
+    app.register_blueprint(transcription_bp)
+    return app.test_client()
+
+
+def test_status_has_etag_and_revalidates(monkeypatch):
+    monkeypatch.delenv("ELEVENLABS_API_KEY", raising=False)
+    client = _client()
+
+    first = client.get(URL)
+    assert first.status_code == 200
+    assert first.get_json() == {"success": True, "configured": False}
+    assert first.headers["Cache-Control"] == "private, no-cache"
+
+    repeat = client.get(URL, headers={"If-None-Match": first.headers["ETag"]})
+    assert repeat.status_code == 304
+    assert repeat.data == b""
+
+
+def test_configuring_key_changes_etag(monkeypatch):
+    monkeypatch.delenv("ELEVENLABS_API_KEY", raising=False)
+    client = _client()
+    old_etag = client.get(URL).headers["ETag"]
+
+    monkeypatch.setenv("ELEVENLABS_API_KEY", "key")
+    response = client.get(URL, headers={"If-None-Match": old_etag})
+    assert response.status_code == 200
+    assert response.get_json()["configured"] is True
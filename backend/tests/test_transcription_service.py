@@ -0,0 +1,56 @@
+"""
+Tests for the ElevenLabs transcription config service.
+
+Covers:
+- A fresh single-use token is requested for every config (never cached)
+- Token requests reuse one keep-alive session
+- Realtime URL carries the model, token, static params and encoded keyterms
+"""
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.services.integrations.elevenlabs.transcription_service import TranscriptionService
+
+
+@pytest.fixture
+def service(monkeypatch):
+    monkeypatch.setenv("ELEVENLABS_API_KEY", "test-key")
+    svc = TranscriptionService()
+    session = MagicMock()
+    session.post.side_effect = [
+        MagicMock(status_code=200, json=MagicMock(return_value={"token": f"tok{i}"}))
+        for i in range(2)
+    ]
+    with patch("requests.Session", return_value=session):
+        yield svc, session
+
+
+def test_each_config_gets_a_fresh_token_over_one_session(service):
+    svc, session = service
+    first = svc.get_elevenlabs_config()
+    second = svc.get_elevenlabs_config()
+
+    assert "token=tok0" in first["websocket_url"]
+    assert "token=tok1" in second["websocket_url"]
+    assert session.post.call_count == 2
+    assert session.post.call_args.kwargs["headers"] == {"xi-api-key": "test-key"}
+
+
+def test_websocket_url_layout(service):
+    svc, _ = service
+    config = svc.get_elevenlabs_config(keyterms=["NoobBook", "a b"])
+
+    assert config["websocket_url"] == (
+        "wss://api.elevenlabs.io/v1/speech-to-text/realtime"
+        "?model_id=scribe_v2_realtime&token=tok0"
+        "&audio_format=pcm_16000&commit_strategy=vad&no_verbatim=true"
+        "&keyterms=NoobBook&keyterms=a%20b"
+    )
+    assert config["keyterms"] == ["NoobBook", "a b"]
+
+
+def test_missing_api_key_raises(monkeypatch):
+    monkeypatch.delenv("ELEVENLABS_API_KEY", raising=False)
+    with pytest.raises(ValueError):
+        TranscriptionService().generate_scribe_token()
@@ -0,0 +1,84 @@
+"""
+Tests for the video preview/download routes.
+
+Covers:
+- Range requests are forwarded to storage and its 206 is relayed as-is
+- Downloads are marked as attachments
+- A missing video is a 404
+"""
+import os
+from unittest.mock import patch
+
+import httpx
+import pytest
+from flask import Flask
+
+os.environ.setdefault("SUPABASE_URL", "http://localhost")
+os.environ.setdefault(
+    "SUPABASE_SERVICE_KEY",
+    "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9.eyJyb2xlIjoidGVzdCJ9.test",
+)
+
+from app.api.studio import studio_bp, videos  # noqa: E402
+
+VIDEO = bytes(range(256)) * 4
+PREVIEW_URL = "/projects/p1/studio/videos/j1/preview/clip.mp4"
+DOWNLOAD_URL = "/projects/p1/studio/videos/j1/download/clip.mp4"
+
+
+@pytest.fixture(autouse=True)
+def allow_project_access():
+    with patch("app.api.studio.verify_project_access", return_value=None):
+        yield
+
+
+def _client():
+    app = Flask(__name__)
+    app.register_blueprint(studio_bp)
+    return app.test_client()
+
+
+def _fake_storage(project_id, job_type, job_id, filename, headers=None):
+    """Answer like storage does: 206 with the slice for a Range request."""
+    byte_range = (headers or {}).get("Range")
+    if byte_range:
+        start, end = (int(n) for n in byte_range[len("bytes="):].split("-"))
+        return httpx.Response(206, content=VIDEO[start:end + 1], headers={
+            "Content-Range": f"bytes {start}-{end}/{len(VIDEO)}",
+            "Content-Length": str(end - start + 1),
+            "ETag": '"v1"',
+        })
+    return httpx.Response(200, content=VIDEO, headers={
+        "Content-Length": str(len(VIDEO)), "ETag": '"v1"',
+    })
+
+
+def test_range_request_is_answered_by_storage():
+    with patch.object(videos.storage_service, "open_studio_binary_stream",
+                      side_effect=_fake_storage) as open_stream, \
+            patch.object(videos.storage_service, "download_studio_binary") as download:
+        response = _client().get(PREVIEW_URL, headers={"Range": "bytes=100-199", "If-Range": '"v1"'})
+
+    assert response.status_code == 206
+    assert response.data == VIDEO[100:200]
+    assert response.headers["Content-Range"] == f"bytes 100-199/{len(VIDEO)}"
+    assert response.headers["Accept-Ranges"] == "bytes"
+    assert open_stream.call_args.kwargs["headers"] == {"Range": "bytes=100-199", "If-Range": '"v1"'}
+    download.assert_not_called()
+
+
+def test_download_is_an_attachment():
+    with patch.object(videos.storage_service, "open_studio_binary_stream", side_effect=_fake_storage):
+        response = _client().get(DOWNLOAD_URL)
+
+    assert response.status_code == 200
+    assert response.data == VIDEO
+    assert response.mimetype == "video/mp4"
+    assert response.headers["Content-Disposition"] == "attachment; filename=clip.mp4"
+
+
+def test_missing_video_is_404():
+    with patch.object(videos.storage_service, "open_studio_binary_stream", return_value=None):
+        response = _client().get(PREVIEW_URL)
+
+    assert response.status_code == 404
@@ -0,0 +1,168 @@
+"""
+Tests for website route helpers.
+
+Covers:
+- Auth-token injection in the preview and in stylesheets: the iframe can't send
+  Authorization headers, so every local resource URL in index.html gets
+  ?token= appended; external, anchor and data: URLs are left untouched.
+- Per-worker caching of website text files and missing files.
+- ZIP download built from the job record alone.
+"""
+import io
+import zipfile
+from unittest.mock import patch
+
+import pytest
+from flask import Flask
+
+from app.api.studio import websites
+from app.api.studio.websites import _add_token_to_css, _add_token_to_html
+from app.services.studio_services import studio_index_service
+
+PAGE = """<!DOCTYPE html>
+<html><head>
+<link rel='stylesheet' href='styles.css'>
+<style>.hero { background: url("assets/hero.png") }</style>
+</head><body>
+<a href="about.html?tab=1">About</a>
+<a href="#contact">Contact</a>
+<a href="mailto:hi@example.com">Mail</a>
+<img src="assets/a.png" srcset="assets/a.png 1x, assets/a@2x.png 2x">
+<img src="https://cdn.example.com/x.png">
+<div style="background-image: url(assets/b.png)"></div>
+<script src="script.js"></script>
+</body></html>"""
+
+
+def test_local_urls_get_token():
+    html = _add_token_to_html(PAGE, "T")
+    assert html.startswith("<!DOCTYPE html>")
+    assert 'href="styles.css?token=T"' in html
+    assert 'url("assets/hero.png?token=T")' in html
+    assert 'href="about.html?tab=1&amp;token=T"' in html
+    assert 'src="assets/a.png?token=T"' in html
+    assert 'srcset="assets/a.png?token=T 1x, assets/a@2x.png?token=T 2x"' in html
+    assert "url(assets/b.png?token=T)" in html
+    assert 'src="script.js?token=T"' in html
+
+
+def test_external_and_anchor_urls_untouched():
+    html = _add_token_to_html(PAGE, "T")
+    assert 'href="#contact"' in html
+    assert 'href="mailto:hi@example.com"' in html
+    assert 'src="https://cdn.example.com/x.png"' in html
+
+
+def test_unparseable_page_is_returned_as_is():
+    assert _add_token_to_html("", "T") == ""
+
+
+def test_css_urls_get_token():
+    css = (
+        '.a { background: url("assets/a.png"); }\n'
+        ".b { background: url('assets/b.png?v=2'); }\n"
+        ".c { background: url(assets/c.png); }\n"
+        ".d { background: url(https://cdn.example.com/d.png); }\n"
+        ".e { background: url(data:image/png;base64,AAA); }\n"
+    )
+    out = _add_token_to_css(css, "T")
+    assert 'url("assets/a.png?token=T")' in out
+    assert "url('assets/b.png?v=2&token=T')" in out
+    assert "url(assets/c.png?token=T)" in out
+    assert "url(https://cdn.example.com/d.png)" in out
+    assert "url(data:image/png;base64,AAA)" in out
+    # Same stylesheet, different token: reuses the cached split
+    assert "url(assets/c.png?token=U)" in _add_token_to_css(css, "U")
+
+
+def test_css_without_urls_is_unchanged():
+    css = "body { color: red; }"
+    assert _add_token_to_css(css, "T") is css
+
+
+@pytest.fixture
+def clear_file_caches():
+    websites._MISSING_FILES.clear()
+    websites._TEXT_FILES.clear()
+    yield
+    websites._MISSING_FILES.clear()
+    websites._TEXT_FILES.clear()
+
+
+@pytest.mark.usefixtures("clear_file_caches")
+class TestMissingFileCache:
+
+    def test_miss_on_ready_job_is_remembered(self):
+        with patch.object(
+            websites.studio_index_service, "get_job_for_poll",
+            return_value={"status": "ready"},
+        ):
+            websites._remember_missing("p1", "j1", "assets/missing.png")
+        assert websites._is_known_missing("p1", "j1", "assets/missing.png")
+        assert not websites._is_known_missing("p1", "j1", "assets/other.png")
+
+    def test_miss_on_running_job_is_not_remembered(self):
+        with patch.object(
+            websites.studio_index_service, "get_job_for_poll",
+            return_value={"status": "processing"},
+        ):
+            websites._remember_missing("p1", "j1", "index.html")
+        assert not websites._is_known_missing("p1", "j1", "index.html")
+
+
+@pytest.mark.usefixtures("clear_file_caches")
+class TestTextFileCache:
+
+    def test_ready_job_text_is_served_from_cache(self):
+        with patch.object(
+            websites.studio_index_service, "get_job_for_poll",
+            return_value={"status": "ready"},
+        ), patch.object(
+            websites.storage_service, "download_studio_file", return_value="body{}",
+        ) as mock_download:
+            assert websites._download_website_text("p1", "j1", "styles.css") == "body{}"
+            assert websites._download_website_text("p1", "j1", "styles.css") == "body{}"
+        assert mock_download.call_count == 1
+
+    def test_running_job_text_is_not_cached(self):
+        with patch.object(
+            websites.studio_index_service, "get_job_for_poll",
+            return_value={"status": "processing"},
+        ), patch.object(
+            websites.storage_service, "download_studio_file", return_value="<html></html>",
+        ) as mock_download:
+            websites._download_website_text("p1", "j1", "index.html")
+            websites._download_website_text("p1", "j1", "index.html")
+        assert mock_download.call_count == 2
+
+
+class TestDownloadWebsite:
+
+    def test_archive_is_built_from_the_cached_job_record(self):
+        studio_index_service._POLL_CACHE.clear()
+        job = {
+            "id": "j1",
+            "status": "ready",
+            "site_name": "My Site",
+            "files": ["index.html", "styles.css"],
+            "images": [{"filename": "hero.png"}, {}],
+        }
+        app = Flask(__name__)
+        with patch.object(
+            studio_index_service, "get_job", return_value=job,
+        ) as mock_get_job, patch.object(
+            websites.storage_service, "iter_studio_binaries",
+            side_effect=lambda p, t, j, names: (name.encode() for name in names),
+        ) as mock_iter:
+            # A status poll followed by the download reads the index once
+            studio_index_service.get_job_for_poll("p1", "j1")
+            with app.test_request_context():
+                response = websites.download_website("p1", "j1")
+                body = b"".join(response.response)
+        studio_index_service._POLL_CACHE.clear()
+
+        assert mock_get_job.call_count == 1
+        assert mock_iter.call_args.args[3] == ["index.html", "styles.css", "assets/hero.png"]
+        with zipfile.ZipFile(io.BytesIO(body)) as archive:
+            assert archive.namelist() == ["index.html", "styles.css", "assets/hero.png"]
+        assert 'filename=My_Site.zip' in response.headers["Content-Disposition"]